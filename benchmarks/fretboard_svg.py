@@ -0,0 +1,41 @@
+#!/bin/env python3
+
+import sys
+import timeit
+from trallala.core.scales import Scale, scales_steps
+from trallala.core.chords import Chord, chord_integer
+from trallala.core.notes import PitchClass
+from trallala.instruments.guitar import Guitar
+
+def main():
+    print("\nComparing svg.SVG and template rendering of fretboard " +
+          "diagrams for e-standard")
+
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    t = 12
+    g = Guitar()
+    f = g.fretboard
+
+    diagrams = []
+    for scale in scales_steps[t]:
+        for root_numeric in range(t):
+            diagrams.append(Scale(root=PitchClass(root_numeric), scale=scale))
+    for chord in chord_integer[t]:
+        diagrams.append(Chord(root='c', chord=chord))
+
+    for d in diagrams:
+        if str(f.svg(d)) != f.svg_str(d):
+            raise AssertionError(f"Output differs for {d}")
+
+    t_svg = min(timeit.repeat(lambda: [str(f.svg(d)) for d in diagrams],
+                              number=1, repeat=repeat))
+    t_str = min(timeit.repeat(lambda: [f.svg_str(d) for d in diagrams],
+                              number=1, repeat=repeat))
+
+    print(f"{len(diagrams)} diagrams, best of {repeat}")
+    print(f"svg.SVG:  {t_svg:.3f}s ({t_svg/len(diagrams)*1e3:.3f}ms per diagram)")
+    print(f"template: {t_str:.3f}s ({t_str/len(diagrams)*1e3:.3f}ms per diagram)")
+    print(f"speedup:  {t_svg/t_str:.1f}x")
+
+if __name__ == '__main__':
+    main()
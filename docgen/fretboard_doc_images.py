@@ -0,0 +1,30 @@
+#!/bin/env python3
+
+import sys,os
+from importlib import import_module
+from trallala.render import batch
+
+# examples whose diagrams are part of the documentation
+examples = ("guitar_fretboard_chord_Cmaj_pitchclasses",
+            "guitar_fretboard_chord_Cmaj_voicing",
+            "guitar_fretboard_chord_Cmaj_intervals",
+            "guitar_fretboard_scale_major_pentatonic_c")
+
+def main():
+    print("\nGenerating the fretboard images of the documentation")
+    print("Writing output into folder: " + sys.argv[1])
+
+    dirname = sys.argv[1]
+
+    if not os.path.isdir(dirname):
+        print("Output dir does not exist: " + dirname)
+
+    # the jobs are defined by the examples
+    jobs = [job for name in examples
+            for job in import_module("examples." + name).jobs()]
+    # skipped in incremental mode if unchanged
+    batch(jobs, dirname, workers=1,
+          incremental="--incremental" in sys.argv[2:])
+
+if __name__ == '__main__':
+    main()
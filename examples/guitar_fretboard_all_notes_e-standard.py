@@ -1,11 +1,30 @@
 #!/bin/env python3
 
 import sys,os
-import svg
 from trallala.instruments.guitar import Guitar
 from trallala.core import notes
 from trallala.core import chords
 from trallala.core import scales
+from trallala.render import Job, batch
+
+filename = "guitar_fretboard_all_notes_e-standard"
+
+def jobs():
+    """ svg diagrams of this example """
+    g = Guitar('e2', tuning='standard', strings=6, frets=24)
+    colors = {'root_color': "red", 'notes_color': 'green'}
+    return [Job(filename + "_pitchclasses.svg",
+                (( notes.PitchClass('e'),'blue'),
+                 ( notes.PitchClass('a#'),'green' ),
+                 ( notes.PitchClass('g'),'red' )), g),
+            Job(filename + "_single_note.svg",
+                notes.Note('e4'), g, {'color': "green"}),
+            Job(filename + "_single_pitchclass.svg",
+                notes.PitchClass('a#'), g, {'color': "red"}),
+            Job(filename + "_chord_Cmaj.svg",
+                chords.Chord(chord='major',root='c',voicing=(3,3,3)), g, colors),
+            Job(filename + "_scale_c_major_pentatonic.svg",
+                scales.Scale(scale='major_pentatonic',root='c'), g, colors)]
 
 def main():
     print("\nPrint the fretboard for e standard/ 24frets to stdout")
@@ -17,46 +36,17 @@ def main():
         print("Output dir does not exist: " + dirname)
 
     g = Guitar('e2', tuning='standard', strings=6, frets=24)
-    filename = "guitar_fretboard_all_notes_e-standard"
 
     print("".join((dirname,"/", filename, ".txt> Fretbaord ASCII'" )) )
     with open("/".join((dirname, ".".join( (filename,"txt") ))),'w') as f:
         print(str(g.fretboard) ,file=f)
 
-    print("".join((dirname,"/", filename, ".svg> Fretbaord PitchClasses SVG'" )) )
-    with open("/".join((dirname, "".join( (filename,"_pitchclasses",".svg") ))),'w') as f:
-        svg = g.fretboard.svg((( notes.PitchClass('e'),'blue'),
-                               ( notes.PitchClass('a#'),'green' ),
-                               ( notes.PitchClass('g'),'red' )))
-        print(svg,file=f)
-
-    x = "_single_note"
-    print("".join((dirname,"/", filename,x, ".svg> Fretbaord Single Note SVG'" )) )
-    with open("/".join((dirname, "".join( (filename,x ,".svg") ))),'w') as f:
-        svg = g.fretboard.svg(notes.Note('e4'),color="green")
-        print(svg,file=f)
-
-    x = "_single_pitchclass"
-    print("".join((dirname,"/", filename, x, ".svg> Fretbaord Single PitchClass SVG'" )) )
-    with open("/".join((dirname, "".join( (filename, x,".svg") ))),'w') as f:
-        svg = g.fretboard.svg(notes.PitchClass('a#'),color="red")
-        print(svg,file=f)
-
-    x = "_chord_Cmaj"
-    print("".join((dirname,"/", filename, x, ".svg> Fretbaord Chord SVG'" )) )
-    with open("/".join((dirname, "".join( (filename, x,".svg") ))),'w') as f:
-        svg = g.fretboard.svg(chords.Chord(chord='major',root='c',voicing=(3,3,3)),
-                                            root_color="red", notes_color='green')
-        print(svg,file=f)
-
-    x = "_scale_c_major_pentatonic"
-    print("".join((dirname,"/", filename, x, ".svg> Fretbaord C major Pentatonic SVG'" )) )
-    with open("/".join((dirname, "".join( (filename, x,".svg") )))
-                ,'w') as f:
-        svg = g.fretboard.svg(scales.Scale(scale='major_pentatonic',root='c'),
-                                            root_color="red",
-                                            notes_color='green')
-        print(svg,file=f)
+    # pitchclasses, single note, single pitchclass, Cmaj chord and
+    # C major pentatonic svg files, skipped with --incremental if unchanged
+    for job in jobs():
+        print("".join((dirname,"/", job.key, "> Fretbaord SVG'" )) )
+    batch(jobs(), dirname, workers=1,
+          incremental="--incremental" in sys.argv[2:])
 
 
 if __name__ == '__main__':
@@ -4,6 +4,20 @@ import sys,os
 
 from trallala.instruments.guitar import Guitar
 from trallala.core import chords
+from trallala.render import Job, batch
+
+filename = "guitar_fretboard_chord_Cmaj_pitchclasses.svg"
+
+def jobs():
+    """ Diagram of this example, also rendered into the documentation """
+    # Initialize the Guitar object with 6 Strings, 12 Frets
+    # and e-standard tuning
+    g = Guitar('e2', tuning='standard', strings=6, frets=12)
+    # create a Cmaj chord
+    diagram = chords.Chord(chord='major',root='c')
+    # svg fretboard with Cmaj chord, rendered by g.fretboard.svg
+    return [Job(filename, diagram, g,
+                {'root_color': "red", 'notes_color': 'green'})]
 
 def main():
     print("\nPrint the fretboard for e standard/ 12frets")
@@ -14,20 +28,10 @@ def main():
     if not os.path.isdir(dirname):
         print("Output dir does not exist: " + dirname)
 
-    # Initialize the Guitar object with 6 Strings, 12 Frets
-    # and e-standard tuning
-    g = Guitar('e2', tuning='standard', strings=6, frets=12)
-
-    filename = "guitar_fretboard_chord_Cmaj_pitchclasses.svg"
-
     print("".join((dirname,"/", filename, "> Fretbaord Chord SVG'" )) )
-    with open("/".join((dirname, filename )),'w') as f:
-        # create a Cmaj chord
-        chord = chords.Chord(chord='major',root='c')
-        # create svg fretboard with chord
-        svg = g.fretboard.svg(chord, root_color="red", notes_color='green')
-        # write svg file
-        print(svg,file=f)
+    # write svg file, skipped with --incremental if unchanged
+    batch(jobs(), dirname, workers=1,
+          incremental="--incremental" in sys.argv[2:])
 
 
 if __name__ == '__main__':
@@ -1,6 +1,7 @@
 import unittest
 
-from trallala.core.chords import Chord
+from trallala.core.chords import Chord, identify, identify_many
+from trallala.config_chords import chord_integer
 from trallala.core.notes import Note, PitchClass
 from trallala.core.intervals import Interval
 from trallala.core.scales import Scale
@@ -90,6 +91,24 @@ class TestChords(unittest.TestCase):
         c4.voicing = (4,4,4)
         self.assertTrue(c4 in scale)
 
+    def test_chord_root(self):
+        d = Chord('major', root='d')
+        self.assertTrue(d.get_chord() == ['d4', 'f#4/gb4', 'a4'])
+        self.assertTrue(str(d) == 'd, f#/gb, a')
+        d.voicing = (3, 4, 3)
+        self.assertTrue(d.get_chord() == ['d3', 'f#4/gb4', 'a3'])
+        self.assertTrue(PitchClass('f#') in d)
+        self.assertFalse(PitchClass('e') in d)
+        self.assertTrue((d + Note('c5')).get_chord() == ['d3', 'f#4/gb4', 'a3', 'c5'])
+        self.assertTrue((d + Interval(10)).get_chord() == ['d3', 'f#4/gb4', 'a3', 'c4'])
+        # intervals of an octave and more are added above the root
+        self.assertTrue((d + Interval(14)).get_chord() == ['d3', 'f#4/gb4', 'a3', 'e4'])
+        c = Chord('major', root='c', voicing=(4, 4, 4))
+        self.assertTrue((c + Interval(14)).get_chord() == ['c4', 'e4', 'g4', 'd5'])
+        self.assertTrue((c + Interval(12)).get_chord() == ['c4', 'e4', 'g4', 'c5'])
+        self.assertTrue(d in Scale('d'))
+        self.assertFalse(d in Scale('c'))
+
     def test_chord_to_interval(self):
         c = Chord('major',root='c',voicing=(4,4,4))
         c_i = c.get_chord_as_interval()
@@ -98,6 +117,28 @@ class TestChords(unittest.TestCase):
         self.assertTrue(c_i[1][0] == Interval('major_third'))
         self.assertTrue(c_i[1][1] == Interval('perfect_fifth'))
 
+    def test_identify(self):
+        r = identify(['e3', 'g3', 'c4'])
+        self.assertTrue(r[0] == ('major', 'c', 1, (), ()))
+        r = identify([Note('g2'), PitchClass('b'), PitchClass('d'), PitchClass('f')])
+        self.assertTrue(r[0] == ('dominant7', 'g', 0, (), ()))
+        r = identify(['c', 'e', 'g', 'd'], max_extra=1)
+        self.assertTrue(('major', 'c', None, ('d',), ()) in r)
+        r = identify(['c', 'e'], max_missing=1)
+        self.assertTrue(('major', 'c', None, (), ('g',)) in r)
+        self.assertTrue(identify(['c', 'c#', 'd']) == [])
+
+    def test_identify_all(self):
+        for name in chord_integer[12]:
+            for root in ('c', 'f#', 'bb'):
+                c = Chord(name, root=root)
+                r = identify(c)
+                self.assertTrue(r[0].root == PitchClass(root).name)
+                self.assertTrue(r[0].inversion == 0)
+                self.assertTrue(Chord(r[0].chord, r[0].root).pitchclassset
+                                == c.pitchclassset)
+        self.assertTrue(len(identify_many([['c4', 'e4', 'g4'], ['a3', 'c4', 'e4']])) == 2)
+
 
 if __name__ == '__main__':
     unittest.main()
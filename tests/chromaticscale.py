@@ -1,7 +1,8 @@
+import pickle
 import unittest
 
 from fractions import Fraction
-from trallala.core.scales import ChromaticScale
+from trallala.core.scales import ChromaticScale, Scale
 
 
 class TestChromaticScale(unittest.TestCase):
@@ -25,6 +26,18 @@ class TestChromaticScale(unittest.TestCase):
         self.assertTrue( sc.frequencyof(2*12+7) == 98.0)
         self.assertTrue( sc.spn_from_distance(dist) == 'a4')
 
+    def test_registry(self):
+        sc = ChromaticScale(anchor=('a4', 440))
+        self.assertIs(sc, ChromaticScale())
+        self.assertIs(sc, ChromaticScale(('A4', 440)))
+        self.assertIs(sc, pickle.loads(pickle.dumps(sc)))
+        self.assertIsNot(sc, ChromaticScale(('c4', 256)))
+        self.assertIsNot(Scale('c'), Scale('c'))
+        self.assertTrue(Scale('c').key == sc.key)
+        self.assertIs(sc.get_octaves()[4][9], ChromaticScale().get_octaves()[4][9])
+        s = pickle.loads(pickle.dumps(Scale('d', 'minor')))
+        self.assertTrue(s.get_scale() == [['d'], ['e'], ['f'], ['g'], ['a'], ['a#'], ['c']])
+
 
 if __name__ == '__main__':
     unittest.main()
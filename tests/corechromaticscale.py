@@ -1,7 +1,7 @@
 import unittest
 
 from fractions import Fraction
-from trallala.core.temperament import _CoreChromaticScale
+from trallala.core.temperament import _CoreChromaticScale, temperament
 
 
 class TestCoreChromaticScale(unittest.TestCase):
@@ -25,6 +25,37 @@ class TestCoreChromaticScale(unittest.TestCase):
         self.assertTrue( sc.frequencyof(2*12+7) == 98.0)
         self.assertTrue( sc.spn_from_distance(dist) == 'a4')
 
+    def test_frequencies(self):
+        sc = _CoreChromaticScale(note=('a4', 440))
+        self.assertTrue(list(sc.frequencies) == sorted(sc.frequencies))
+        self.assertTrue(sc.frequencies[57] == 440)
+        self.assertTrue(sc.distance_of_frequency(440.0) == 57)
+        self.assertTrue(sc.distance_of_frequency(439.0, tolerance=5) == 57)
+        self.assertTrue(sc.distance_of_frequency(450.0, nearest=True) == 57)
+        with self.assertRaises(ValueError):
+            sc.distance_of_frequency(439.0)
+
+    def test_spn_tables(self):
+        sc = _CoreChromaticScale(note=('a4', 440))
+        self.assertTrue(sc.spn_to_distance_many(['A#4', 'bB4', 'a#4/bb4', 'c0', 'B9'])
+                        == [58, 58, 58, 0, 119])
+        self.assertTrue(sc.spn_from_distance_many([58, 0, -1, 120])
+                        == ['a#4/bb4', 'c0', 'b-1', 'c10'])
+        self.assertTrue(sc.split_spn('Db3') == ('db', '3'))
+        self.assertTrue(sc.split_spn('c#3/db3') == ('c#', '3'))
+        with self.assertRaises(ValueError):
+            sc.spn_to_distance('h4')
+        for d in range(120):
+            self.assertTrue(sc.spn_to_distance(sc.spn_from_distance(d)) == d)
+
+    def test_shared(self):
+        sc = _CoreChromaticScale(note=('a4', 440))
+        self.assertIs(sc, _CoreChromaticScale())
+        with self.assertRaises(AttributeError):
+            sc._anchor = 432
+        self.assertTrue(_CoreChromaticScale().anchor == ('a4', 440))
+        self.assertIs(sc, _CoreChromaticScale(temperament=temperament['12TET']))
+
 
 if __name__ == '__main__':
     unittest.main()
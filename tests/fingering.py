@@ -0,0 +1,76 @@
+import unittest
+
+from itertools import product
+from random import Random
+from trallala.core.notes import Note
+from trallala.instruments.guitar import Guitar
+from trallala.instruments.fingering import fingering, tab, default_weights
+
+
+def path_cost(path, span=3, w=default_weights):
+    cost = 0
+    hand = 0
+    for i, (s, f) in enumerate(path):
+        cost += (w['open'] if f else 0) + w['height'] * f
+        if i:
+            cost += w['string'] * abs(s - path[i-1][0])
+        if f:
+            if hand:
+                cost += w['move'] * abs(f - hand) + w['stretch'] * max(abs(f - hand) - span, 0)
+            hand = f
+    return cost
+
+
+class TestFingering(unittest.TestCase):
+
+    def test_brute_force(self):
+        g = Guitar(frets=12)
+        f = g.fretboard
+        rnd = Random(3)
+        for _ in range(10):
+            melody = [Note(rnd.randint(40, 64)) for _ in range(4)]
+            path = fingering(melody, g)
+            self.assertEqual([f.all_notes[s][fr] for s, fr in path], melody)
+            best = min(path_cost(p) for p in product(*(f.get_indices(n) for n in melody)))
+            self.assertAlmostEqual(path_cost(path), best)
+
+    def test_preferences(self):
+        g = Guitar()
+        # open string instead of the 5th fret of the b string
+        self.assertEqual(fingering([Note('e4')], g), [(5, 0)])
+        # the hand stays in position across the open e string
+        melody = [Note(x) for x in ('c4', 'd4', 'e4', 'f4')]
+        self.assertEqual(fingering(melody, g, weights={'open': 0, 'height': 0}),
+                         [(3, 5), (3, 7), (5, 0), (4, 6)])
+        high = [Note(x) for x in ('c5', 'd5', 'e5')]
+        self.assertEqual(fingering(high, g), [(5, 8), (5, 10), (5, 12)])
+        self.assertEqual(fingering([], g), [])
+        with self.assertRaises(ValueError):
+            fingering([Note('c1')], g)
+
+    def test_open_string_keeps_hand(self):
+        g = Guitar()
+        # fret 12 -> open -> fret 1 moves the hand by 11 frets
+        jump = [(5, 12), (3, 0), (5, 1)]
+        self.assertGreater(path_cost(jump), 11 * default_weights['move'])
+        melody = [Note(x) for x in ('e5', 'g3', 'f4')]
+        path = fingering(melody, g)
+        self.assertEqual(path, [(3, 21), (3, 0), (1, 20)])
+        self.assertLess(path_cost(path), path_cost(jump))
+
+    def test_long_melody(self):
+        g = Guitar()
+        rnd = Random(5)
+        melody = [Note(rnd.randint(40, 76)) for _ in range(20000)]
+        path = fingering(melody, g)
+        self.assertEqual(len(path), len(melody))
+
+    def test_tab(self):
+        g = Guitar()
+        self.assertEqual(tab([(0, 3), (5, 12)], g).splitlines(),
+                         ['e4|---12-', 'b3|------', 'g3|------',
+                          'd3|------', 'a2|------', 'e2|-3----'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import xml.etree.ElementTree as ET
 
 from fractions import Fraction
 from trallala.core.scales import Scale
@@ -6,6 +7,7 @@ from trallala.core.notes import PitchClass, Note
 from trallala.core.chords import Chord
 from trallala.core.intervals import Interval
 from trallala.instruments.guitar import Guitar
+from trallala.render.jsonformat import decode
 
 class TestGuitar(unittest.TestCase):
 
@@ -32,6 +34,41 @@ class TestGuitar(unittest.TestCase):
         self.assertTrue(len(f) == 6)
         self.assertTrue(min( (len(x) == 25 for x in f) ))
 
+    def test_fretboard_matrices(self):
+        f = Guitar().fretboard
+        self.assertEqual(f.distances.shape, (6, 25))
+        for string, row in enumerate(f.all_notes):
+            for fret, n in enumerate(row):
+                self.assertEqual(f.distances[string, fret], n.distance)
+                self.assertEqual(f.pitchclasses[string, fret],
+                                 PitchClass(n).numeric)
+                self.assertAlmostEqual(f.frequencies[string, fret],
+                                       float(n.frequency))
+        with self.assertRaises(ValueError):
+            f.distances[0, 0] = 0
+
+    def test_mask(self):
+        f = Guitar().fretboard
+        self.assertEqual(f.mask(Note('e2')).sum(), 1)
+        self.assertEqual(f.mask(PitchClass('e')).sum(), 14)
+        self.assertTrue(f.mask(PitchClass('e'))[:, 0].tolist()
+                        == [True, False, False, False, False, True])
+        scale = Scale(PitchClass('c'), 'major')
+        self.assertEqual(f.mask(scale).sum(),
+                         sum(len(x) for x in f.get_indices(scale)))
+        chord = Chord('major', 'c')
+        self.assertEqual(f.mask(chord).sum(), len(f.get_indices(chord)))
+
+    def test_fretboard_cache(self):
+        f = Guitar().fretboard
+        self.assertIs(f, Guitar('e2', [0, 5, 5, 5, 4, 5]).fretboard)
+        self.assertIsNot(f, Guitar(frets=12).fretboard)
+        self.assertIsNot(f, Guitar(tuning='drop').fretboard)
+        with self.assertRaises(AttributeError):
+            f._frets = 12
+        with self.assertRaises(TypeError):
+            f.all_notes[0][0] = Note('c0')
+
     def test_svg(self):
         ### test without verification of svg...
         g=Guitar()
@@ -46,6 +83,125 @@ class TestGuitar(unittest.TestCase):
         svg = g.fretboard.svg(n)
         svg = g.fretboard.svg(n+Interval('perfect_fifth'))
 
+    def test_svg_str(self):
+        g=Guitar()
+        f = g.fretboard
+        for n in (Chord(root='c', chord='major'),
+                  Chord(root='c',chord='major',voicing=(3,3,4)),
+                  Scale(scale='major', root='c4'),
+                  PitchClass(3), Note('e3')):
+            self.assertEqual(str(f.svg(n)), f.svg_str(n))
+        c = Chord(root='c', chord='major')
+        self.assertEqual(str(f.svg(c, intervals=True)),
+                         f.svg_str(c, intervals=True))
+        self.assertEqual(str(f.svg(c, root_color='black', notes_color='red')),
+                         f.svg_str(c, root_color='black', notes_color='red'))
+        l = ((Note('e3'), 'red'), (PitchClass('g'), 'blue'))
+        self.assertEqual(str(f.svg(l)), f.svg_str(l))
+        self.assertEqual(str(Guitar(frets=12).fretboard.svg(c)),
+                         Guitar(frets=12).fretboard.svg_str(c))
+
+    def test_svg_compact(self):
+        f = Guitar().fretboard
+        ns = '{http://www.w3.org/2000/svg}'
+        for n, args in ((Chord(root='c', chord='major'), {'intervals': True}),
+                        (Scale(scale='major', root='c4'), {}),
+                        (Note('e3'), {'color': 'red'}),
+                        (PitchClass('a#'), {})):
+            compact = f.svg_compact(n, **args)
+            self.assertLess(len(compact) * 2, len(f.svg_str(n, **args)))
+            full = ET.fromstring(f.svg_str(n, **args))
+            root = ET.fromstring(compact)
+            self.assertEqual(root.get('width'), full.get('width'))
+            circles = full.findall(ns + 'circle')
+            uses = root.findall(f'{ns}g/{ns}use')
+            self.assertEqual(len(uses), len(circles))
+            self.assertEqual(sorted((float(u.get('x')), float(u.get('y')))
+                                    for u in uses),
+                             sorted((float(c.get('cx')), float(c.get('cy')))
+                                    for c in circles))
+            labels = [t.text for t in full.findall(ns + 'text')]
+            compact_labels = [t.text for t in root.iter(ns + 'text')]
+            self.assertEqual(sorted(labels), sorted(compact_labels))
+        self.assertIn('x="82.5"', f.svg_compact(Note('f2')))
+        self.assertIn('x="82"', f.svg_compact(Note('f2'), precision=0))
+
+    def test_svg_compact_many(self):
+        f = Guitar(frets=12).fretboard
+        ns = '{http://www.w3.org/2000/svg}'
+        diagrams = [Scale('c'), Chord(root='c', chord='major')]
+        doc = f.svg_sheet(diagrams, columns=1)
+        root = ET.fromstring(doc)
+        self.assertEqual(len(root.findall(f'{ns}defs/{ns}g')), 1)
+        self.assertEqual(doc.count('Generated with Trallala'), 1)
+        self.assertEqual(doc.count('href="#fb"'), 2)
+        self.assertLess(len(doc), sum(len(f.svg_compact(d)) for d in diagrams))
+        # every diagram places the same markers as its single document
+        for group, d in zip(root.findall(f'{ns}g[@transform]'), diagrams):
+            single = ET.fromstring(f.svg_compact(d))
+            self.assertEqual(sorted((u.get('x'), u.get('y'))
+                                    for u in group.findall(f'{ns}g/{ns}use')),
+                             sorted((u.get('x'), u.get('y'))
+                                    for u in single.findall(f'{ns}g/{ns}use')))
+
+    def test_svg_sheet(self):
+        f = Guitar(frets=12).fretboard
+        ns = '{http://www.w3.org/2000/svg}'
+        c = Chord(root='c', chord='major')
+        diagrams = [Scale('c'), Scale('a', 'minor'), (c, {'intervals': True}),
+                    Note('e4'), PitchClass('g')]
+        doc = f.svg_sheet(diagrams, columns=2)
+        root = ET.fromstring(doc)
+        self.assertEqual(root.get('width'), str(2 * 820))
+        self.assertEqual(root.get('height'), str(3 * (190 + 20)))
+        self.assertEqual(len(root.findall(f'{ns}defs/{ns}g')), 1)
+        self.assertEqual(doc.count('href="#fb"'), 5)
+        self.assertEqual(doc.count('Generated with Trallala'), 1)
+        captions = [t.text for t in root.findall(f"{ns}g[@class='label']/{ns}text")]
+        self.assertEqual(captions, ['C major', 'A minor', 'C, E, G', 'E4', 'G'])
+        groups = root.findall(f'{ns}g[@transform]')
+        self.assertEqual(groups[3].get('transform'), 'translate(820 230)')
+        self.assertEqual(len(groups[3].findall(f'{ns}g/{ns}use')),
+                         len(f.get_indices(Note('e4'))))
+        self.assertIn('M3  D4', doc)
+
+        doc = f.svg_sheet([Note('e4')], labels=['<e>'])
+        self.assertIn('&lt;e&gt;', doc)
+        self.assertEqual(ET.fromstring(doc).get('width'), '820')
+        with self.assertRaises(ValueError):
+            f.svg_sheet([Note('e4')], labels=[])
+        with self.assertRaises(ValueError):
+            f.svg_sheet([Note('e4')], columns=0)
+
+    def test_json(self):
+        g = Guitar()
+        f = g.fretboard
+        c = Chord(root='c', chord='major')
+        d = decode(f.to_json(c, root_color='black', intervals=True))
+        self.assertEqual(d['strings'], 6)
+        self.assertEqual(d['frets'], 24)
+        self.assertEqual(d['tuning'], ['e2', 'a2', 'd3', 'g3', 'b3', 'e4'])
+        full = ET.fromstring(f.svg_str(c, root_color='black', intervals=True))
+        ns = '{http://www.w3.org/2000/svg}'
+        self.assertEqual(len(d['notes']), len(full.findall(ns + 'circle')))
+        for string, fret, color, label in d['notes']:
+            self.assertIn(PitchClass(f.all_notes[string][fret]), c)
+            if f.all_notes[string][fret] in PitchClass('c'):
+                self.assertEqual((color, label), ('black', 'c'))
+            else:
+                self.assertEqual(color, 'green')
+        self.assertEqual({n[3] for n in d['notes']}, {'c', 'M3/ d4', 'P5/ d6'})
+
+        d = decode(f.to_json(Note('e4'), geometry=False))
+        self.assertNotIn('strings', d)
+        self.assertEqual(sorted(d['notes']),
+                         sorted((s, fr, 'blue', 'e4') for s, fr in f.get_indices(Note('e4'))))
+        self.assertEqual(decode(f.json_geometry()),
+                         {'strings': 6, 'frets': 24,
+                          'tuning': ['e2', 'a2', 'd3', 'g3', 'b3', 'e4']})
+        self.assertLess(len(f.to_json(Scale('c'))) * 10, len(f.svg_str(Scale('c'))))
+        with self.assertRaises(ValueError):
+            decode('{"v": 0}')
 
     def test_getindices(self):
         g = Guitar()
@@ -58,6 +214,15 @@ class TestGuitar(unittest.TestCase):
 
         for string, fret in i:
             self.assertTrue(f.all_notes[string][fret] == Note('e4'))
+        self.assertTrue(len(i) == 6)
+        for string, fret in i3:
+            self.assertTrue(f.all_notes[string][fret] in PitchClass('c'))
+        self.assertTrue(len(i3) == sum(n in PitchClass('c') for s in f.all_notes for n in s))
+        s = Scale('c')
+        for positions in i4:
+            for string, fret in positions:
+                self.assertTrue(f.all_notes[string][fret] in s)
+        self.assertTrue(f.get_indices(Note('c0')) == ())
 
 
 if __name__ == '__main__':
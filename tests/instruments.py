@@ -1,9 +1,16 @@
 import unittest
 
 from fractions import Fraction
-from trallala.core.scales import Scale
+from trallala.core.scales import Scale, ChromaticScale
 from trallala.core.notes import PitchClass, Note
+from trallala.core.chords import Chord
 from trallala.instruments.coreinstruments import _Instrument, _StringedInstrument
+from trallala.instruments.guitar import Guitar, SevenStringGuitar, EightStringGuitar
+from trallala.instruments.bass import Bass
+from trallala.instruments.ukulele import Ukulele
+from trallala.instruments.mandolin import Mandolin
+from trallala.instruments.banjo import Banjo
+from trallala.instruments.voicings import voicings
 
 class TestInstrument(unittest.TestCase):
 
@@ -30,5 +37,68 @@ class TestInstrument(unittest.TestCase):
         self.assertTrue(i.lowest_note == Note('e0'))
         self.assertTrue(i.highest_note == Note('e6'))
 
+class TestFrettedInstruments(unittest.TestCase):
+
+    def test_tunings(self):
+        tests = ((Guitar(strings=7), ('b1','e2','a2','d3','g3','b3','e4')),
+                 (SevenStringGuitar(tuning='drop'),
+                  ('a1','e2','a2','d3','g3','b3','e4')),
+                 (EightStringGuitar(), ('f#1','b1','e2','a2','d3','g3','b3','e4')),
+                 (Bass(), ('e1','a1','d2','g2')),
+                 (Bass(strings=5), ('b0','e1','a1','d2','g2')),
+                 (Bass('d1', 'drop'), ('d1','a1','d2','g2')),
+                 (Ukulele(), ('g4','c4','e4','a4')),
+                 (Ukulele(tuning='low_g'), ('g3','c4','e4','a4')),
+                 (Mandolin(), ('g3','d4','a4','e5')),
+                 (Banjo(), ('g4','d3','g3','b3','d4')),
+                 (Banjo(strings=4), ('c3','g3','d4','a4')))
+        for instrument, tuning in tests:
+            self.assertEqual(instrument.tuning, tuple(Note(x) for x in tuning))
+            self.assertEqual(instrument.fretboard.distances.shape,
+                             (len(tuning), instrument.semitones[-1]))
+        self.assertEqual(Ukulele().lowest_note, Note('c4'))
+        self.assertEqual(Bass().highest_note, Note('d#4'))
+        with self.assertRaises(ValueError):
+            Bass(tuning=(0, 5, 5))
+        with self.assertRaises(ValueError):
+            Mandolin(strings=5, tuning=(0, 7, 7, 7, 7))
+        with self.assertRaisesRegex(ValueError, "Valid tunings: standard$"):
+            Bass(strings=5, tuning='drop')
+        with self.assertRaisesRegex(ValueError, "9 strings"):
+            Guitar(strings=9)
+
+    def test_shared_fretboards(self):
+        self.assertIs(Bass().fretboard, Bass('e1').fretboard)
+        self.assertIs(Mandolin(frets=24).fretboard,
+                      Mandolin(frets=24).fretboard)
+        # same tuning and frets on different instruments
+        self.assertIs(Guitar('e1', [0, 5, 5, 5], strings=4, frets=20).fretboard,
+                      Bass().fretboard)
+        self.assertIsNot(Banjo().fretboard,
+                         Guitar('g4', [0, -17, 5, 4, 3], strings=5,
+                                frets=22).fretboard)
+        # same distances in another chromatic scale
+        scale = ChromaticScale(('a4', 432))
+        other = Guitar(tuning=[Note(x, scale) for x in ('e2','a2','d3','g3','b3','e4')])
+        self.assertIsNot(other.fretboard, Guitar().fretboard)
+        self.assertEqual(other.fretboard.all_notes[5][5].frequency, 432.0)
+        self.assertEqual((Banjo.default_strings, Banjo.default_frets), (5, 22))
+
+    def test_banjo_short_string(self):
+        f = Banjo().fretboard
+        self.assertEqual(f.playable[0].tolist(),
+                         [True] + [False] * 5 + [True] * 17)
+        self.assertEqual(f.all_notes[0][:7],
+                         (Note('g4'), None, None, None, None, None, Note('g#4')))
+        self.assertEqual(f.get_indices(Note('a4'))[0], (0, 7))
+        self.assertNotIn((0, 3), f.get_indices(Scale(PitchClass('g'), 'major'))[0])
+        self.assertTrue(f.mask(PitchClass('g'))[0, 0])
+        self.assertIn((0, 0, 0, 0, 0), voicings(Chord('major', 'g'), Banjo()))
+        # the short string is drawn from the 5th fret
+        self.assertIn('x1="328.6363636363636" y1="140.0"', f.svg_str(Note('g4')))
+
+    def test_ukulele_voicings(self):
+        self.assertIn((0, 0, 0, 3), voicings(Chord('major', 'c'), Ukulele()))
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 from fractions import Fraction
@@ -47,6 +49,40 @@ class TestNotes(unittest.TestCase):
         self.assertTrue(a4/2 == a4*0.5)
         self.assertTrue(a4/0.5 == a4*2)
 
+    def test_from_frequency(self):
+        a4 = Note('A4')
+        self.assertIs(Note.from_frequency(440.0), a4)
+        self.assertIs(Note.from_frequency(441.5, tolerance=10), a4)
+        self.assertIs(Note.from_frequency(452.0, nearest=True), a4)
+        self.assertIs(Note.from_frequency(1.0, nearest=True), Note('c0'))
+        with self.assertRaises(ValueError):
+            Note(441.5)
+        with self.assertRaises(ValueError):
+            Note.from_frequency(445.0, tolerance=10)
+
+    def test_interning(self):
+        a4 = Note('A4')
+        self.assertIs(a4, Note(12*4+9))
+        self.assertIs(a4, Note(440.0))
+        self.assertIs(a4, Note(a4))
+        self.assertIs(a4, Note('g4') + 2)
+        self.assertIs(a4, copy.deepcopy(a4))
+        self.assertIs(a4, pickle.loads(pickle.dumps(a4)))
+        self.assertIsNot(a4, Note('a4', ChromaticScale(('a4',442))))
+
+    def test_hash(self):
+        a4 = Note('A4')
+        self.assertTrue(len({a4, Note('a4'), Note(57), Note('c4')}) == 2)
+        self.assertTrue({a4: 1}[Note(440.0)] == 1)
+
+    def test_immutable(self):
+        a4 = Note('A4')
+        with self.assertRaises(AttributeError):
+            a4._distance = 0
+        with self.assertRaises(AttributeError):
+            a4.foo = 0
+        self.assertTrue(a4.distance == 57)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+from trallala.core.notes import Note, NoteArray
+
+
+class TestNoteArray(unittest.TestCase):
+
+    def test_init(self):
+        n = [Note('c4'), Note('e4'), Note('g4')]
+        a = NoteArray(n)
+        self.assertTrue(a.to_notes() == n)
+        self.assertTrue(NoteArray(['c4', 'E4', 55]).to_notes() == n)
+        self.assertTrue(NoteArray(np.array([48, 52, 55])).to_notes() == n)
+        self.assertTrue(a[1] is Note('e4'))
+        self.assertTrue(len(a) == 3)
+        self.assertTrue(a.names == ['c4', 'e4', 'g4'])
+        with self.assertRaises(ValueError):
+            a.distances[0] = 0
+
+    def test_math_operator(self):
+        n = [Note('c4'), Note('a#4'), Note('e2')]
+        a = NoteArray(n)
+        self.assertTrue((a + 2).to_notes() == [x + 2 for x in n])
+        self.assertTrue((a - 14).to_notes() == [x - 14 for x in n])
+        for f in (2, 2.5, 0.5, 0.3):
+            self.assertTrue((a * f).to_notes() == [x * f for x in n])
+            self.assertTrue((a / f).to_notes() == [x / f for x in n])
+        with self.assertRaises(TypeError):
+            a * 0
+        with self.assertRaises(ValueError):
+            a / 0
+
+    def test_compare(self):
+        a = NoteArray(['c4', 'a4', 'c5'])
+        self.assertTrue((a == 'a4').tolist() == [False, True, False])
+        self.assertTrue((a == 440.0).tolist() == [False, True, False])
+        self.assertTrue((a < Note('a4')).tolist() == [True, False, False])
+        self.assertTrue((a >= 57).tolist() == [False, True, True])
+        self.assertTrue((a != a).tolist() == [False, False, False])
+
+    def test_vectorized_properties(self):
+        n = [Note('c4'), Note('a4'), Note('e2'), Note(120)]
+        a = NoteArray(n)
+        self.assertTrue(a.frequencies.tolist() == [x.frequency for x in n])
+        self.assertTrue(a.pitchclasses.tolist() == [0, 9, 4, 0])
+        self.assertTrue(a.intervals().tolist() == [9, -29, 92])
+        self.assertTrue((a - Note('c4')).tolist() == [0, 9, -20, 72])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -29,5 +29,28 @@ class TestPitchClass(unittest.TestCase):
         self.assertTrue(9 in pc_a)
         self.assertFalse(a4 in pc_b)
 
+    def test_init(self):
+        for x in ('a', 'A', 'a4', 9, 21, Note('a2'), 440.0, PitchClass('a')):
+            pc = PitchClass(x)
+            self.assertTrue(pc.numeric == 9)
+            self.assertTrue(pc.name == 'a')
+        self.assertTrue(PitchClass('Bb').name == 'a#')
+        with self.assertRaises(ValueError):
+            PitchClass('h')
+
+    def test_hash(self):
+        s = {PitchClass('a'), PitchClass(21), PitchClass('c')}
+        self.assertTrue(len(s) == 2)
+        self.assertTrue(PitchClass('c') in s)
+        self.assertTrue(Note('c4') in PitchClass('c'))
+        self.assertTrue(Note('c9') not in PitchClass('c'))
+
+    def test_in_list(self):
+        pc = PitchClass('a#')
+        self.assertTrue(pc.in_list(['c', 'Bb']))
+        self.assertTrue(pc.in_list([PitchClass('c'), PitchClass(22)]))
+        self.assertFalse(pc.in_list(['c', PitchClass('a')]))
+        self.assertFalse(pc == 'a#')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from trallala.core.notes import Note, PitchClass, PitchClassSet
+
+
+class TestPitchClassSet(unittest.TestCase):
+
+    def test_init(self):
+        s = PitchClassSet((0, 4, 7))
+        self.assertTrue(s.mask == 0b10010001)
+        self.assertTrue(s == PitchClassSet(('c', Note('e4'), PitchClass('g'))))
+        self.assertTrue(s == PitchClassSet.from_mask(0b10010001))
+        self.assertTrue(list(s) == [0, 4, 7])
+        self.assertTrue(len(s) == 3)
+        self.assertTrue(str(s) == 'c, e, g')
+
+    def test_contains(self):
+        s = PitchClassSet((0, 4, 7))
+        self.assertTrue(PitchClass('e') in s)
+        self.assertTrue(Note('g2') in s)
+        self.assertTrue(12 in s)
+        self.assertFalse('d' in s)
+
+    def test_operators(self):
+        c = PitchClassSet((0, 4, 7))
+        a = PitchClassSet((9, 0, 4))
+        self.assertTrue(c.transpose(9) == PitchClassSet((9, 1, 4)))
+        self.assertTrue(c.transpose(-12) == c)
+        self.assertTrue(c | a == PitchClassSet((0, 4, 7, 9)))
+        self.assertTrue(c & a == PitchClassSet((0, 4)))
+        self.assertTrue(c - a == PitchClassSet((7,)))
+        self.assertTrue(len(~c) == 9)
+        self.assertTrue(PitchClassSet((0, 4)) <= c)
+        self.assertTrue(PitchClassSet((0, 4)) < c)
+        self.assertFalse(c < c)
+        self.assertFalse(a <= c)
+        self.assertTrue(c >= PitchClassSet((7,)))
+        self.assertTrue(len({c, PitchClassSet((12, 16, 19))}) == 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+from trallala.core.notes import PitchClass
+from trallala.core.scales import Scale
+from trallala.instruments.guitar import Guitar
+from trallala.instruments.ukulele import Ukulele
+from trallala.instruments.banjo import Banjo
+from trallala.instruments.positions import window, caged, three_notes_per_string
+from trallala.render.jsonformat import decode
+
+
+def strings(position, count=6):
+    return [[f for s, f in position.positions if s == i] for i in range(count)]
+
+
+class TestPositions(unittest.TestCase):
+
+    def check_consecutive(self, position, guitar):
+        # ascending consecutive scale tones, non decreasing strings
+        f = guitar.fretboard
+        tones = [f.distances[s, fr] for s, fr in position.positions]
+        scale = [d for d in range(tones[0], tones[-1] + 1)
+                 if PitchClass(d % 12) in position.scale]
+        self.assertEqual(tones, scale)
+        # strings in the pitch order of the open strings
+        order = sorted(range(len(f.all_notes)), key=lambda s: f.all_notes[s][0])
+        ranks = [order.index(s) for s, _ in position.positions]
+        self.assertEqual(ranks, sorted(ranks))
+
+    def test_caged(self):
+        g = Guitar()
+        boxes = caged(Scale(PitchClass('g'), 'major'), g)
+        self.assertEqual([b.name for b in boxes], ['G', 'E', 'D', 'C', 'A'])
+        self.assertEqual(strings(boxes[1]),
+                         [[2, 3, 5], [2, 3, 5], [2, 4, 5], [2, 4, 5], [3, 5], [2, 3, 5]])
+        self.assertEqual(strings(boxes[2]),
+                         [[5, 7, 8], [5, 7], [4, 5, 7], [4, 5, 7], [5, 7, 8], [5, 7]])
+        for b in boxes:
+            self.check_consecutive(b, g)
+            self.assertLessEqual(b.frets[1] - b.frets[0], 5)
+        with self.assertRaises(ValueError):
+            caged(Scale(PitchClass('c'), 'major'), Guitar(strings=2, tuning=(0, 5)))
+
+    def test_three_notes_per_string(self):
+        g = Guitar()
+        patterns = three_notes_per_string(Scale(PitchClass('g'), 'major'), g)
+        self.assertEqual(len(patterns), 7)
+        self.assertEqual(strings(patterns[0]),
+                         [[3, 5, 7], [3, 5, 7], [4, 5, 7], [4, 5, 7], [5, 7, 8], [5, 7, 8]])
+        for p in patterns:
+            self.assertEqual(len(p.positions), 18)
+            self.check_consecutive(p, g)
+
+    def test_window(self):
+        g = Guitar()
+        s = Scale(PitchClass('a'), 'minor_pentatonic')
+        p = window(s, g, 5)
+        self.assertEqual(p.name, 'fret 5')
+        self.assertEqual(strings(p), [[5, 8], [5, 7], [5, 7], [5, 7], [5, 8], [5, 8]])
+        self.check_consecutive(p, g)
+        # without stretch the window 5-8 ends at the gap from a to b
+        s2 = Scale(PitchClass('g'), 'major')
+        self.assertEqual(len(window(s2, g, 5, stretch=0).positions), 5)
+        self.assertEqual(len(window(s2, g, 5).positions), 17)
+        self.assertEqual(window(s2, g, 5).frets, (5, 9))
+        self.assertIs(window(s, g, 5).positions, window(s, g, 5).positions)
+
+    def test_reentrant(self):
+        s = Scale(PitchClass('c'), 'major')
+        # g4 c4 e4 a4: the g string lies between e and a
+        p = window(s, Ukulele(), 0)
+        self.assertEqual(p.positions[:3], ((1, 0), (1, 2), (2, 0)))
+        self.assertIn(0, [string for string, _ in p.positions])
+        self.check_consecutive(p, Ukulele())
+        for b in caged(s, Banjo()) + three_notes_per_string(s, Banjo()):
+            self.check_consecutive(b, Banjo())
+            self.assertTrue(all(Banjo().fretboard.playable[x] for x in b.positions))
+
+    def test_render(self):
+        g = Guitar()
+        box = caged(Scale(PitchClass('g'), 'major'), g)[1]
+        layer = decode(g.fretboard.to_json(box))['notes']
+        self.assertEqual([(s, f) for s, f, _, _ in layer], list(box.positions))
+        self.assertEqual([c for s, f, c, l in layer if l == 'g'], ['red'] * 3)
+        self.assertEqual(str(g.fretboard.svg(box)), g.fretboard.svg_str(box))
+        self.assertIn('G major (E)', g.fretboard.svg_sheet([box]))
+
+
+if __name__ == '__main__':
+    unittest.main()
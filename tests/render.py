@@ -0,0 +1,156 @@
+import io
+import json
+import os
+import tarfile
+import unittest
+import zipfile
+
+from tempfile import TemporaryDirectory
+from trallala.core.scales import Scale
+from trallala.core.chords import Chord
+from trallala.core.notes import Note
+from trallala.instruments.guitar import Guitar
+from trallala.render import Job, BatchOptions, batch
+from trallala.render.parallel import render, scale_jobs, chord_jobs
+from trallala.render.manifest import Manifest, MANIFEST_NAME, job_hash
+from trallala.render.sinks import ArchiveSink, DirectorySink, open_sink, INDEX_NAME
+
+
+class TestParallel(unittest.TestCase):
+
+    def test_render_order(self):
+        g = Guitar()
+        jobs = scale_jobs(g, scale_names=('major', 'minor'))
+        self.assertEqual(len(jobs), 24)
+        serial = list(render(jobs, workers=1))
+        parallel = list(render(jobs, workers=2, chunksize=3))
+        self.assertEqual(serial, parallel)
+        self.assertEqual([k for k, _ in serial], [j.key for j in jobs])
+        self.assertEqual(serial[0][1], g.fretboard.svg_str(jobs[0].diagram))
+
+    def test_render_options(self):
+        c = Chord(root='c', chord='major')
+        jobs = [Job('c.svg', c, Guitar(frets=12), {'intervals': True}),
+                Job('e.svg', Note('e4'))]
+        result = dict(render(jobs, workers=1))
+        self.assertEqual(result['c.svg'],
+                         str(Guitar(frets=12).fretboard.svg(c, intervals=True)))
+        self.assertEqual(result['e.svg'], str(Guitar().fretboard.svg(Note('e4'))))
+        with self.assertRaises(ValueError):
+            list(render(jobs, workers=0))
+        compact = Job('c.svg', c, None, {'intervals': True}, 'compact')
+        self.assertEqual(dict(render([compact], workers=1))['c.svg'],
+                         Guitar().fretboard.svg_compact(c, intervals=True))
+        self.assertNotEqual(job_hash(compact), job_hash(compact._replace(renderer='svg')))
+        with self.assertRaises(ValueError):
+            list(render([compact._replace(renderer='png')], workers=1))
+        jobs = chord_jobs(chord_names=('major',), renderer='json', intervals=True)
+        self.assertTrue(jobs[0].key.endswith('.json'))
+        self.assertEqual(dict(render(jobs[:1], workers=1))[jobs[0].key],
+                         Guitar().fretboard.to_json(jobs[0].diagram, intervals=True))
+
+    def test_batch(self):
+        jobs = chord_jobs(chord_names=('major',))
+        calls = []
+        with TemporaryDirectory() as d:
+            out = os.path.join(d, 'out')
+            n = batch(jobs, out, workers=2,
+                      progress=lambda done, total, key: calls.append((done, total, key)))
+            self.assertEqual(n, 12)
+            self.assertEqual(sorted(os.listdir(out)), sorted(j.key for j in jobs))
+            with open(os.path.join(out, jobs[0].key), encoding='utf-8') as f:
+                self.assertEqual(f.read(),
+                                 Guitar().fretboard.svg_str(jobs[0].diagram) + '\n')
+        self.assertEqual(calls[-1], (12, 12, jobs[-1].key))
+        self.assertEqual([c[0] for c in calls], list(range(1, 13)))
+
+    def test_job_hash(self):
+        g = Guitar()
+        c = Chord(root='c', chord='major')
+        h = job_hash(Job('c.svg', c, g))
+        self.assertEqual(h, job_hash(Job('other.svg', Chord(root='c', chord='major'), Guitar())))
+        self.assertNotEqual(h, job_hash(Job('c.svg', Chord(root='d', chord='major'), g)))
+        self.assertNotEqual(h, job_hash(Job('c.svg', Chord(root='c', chord='minor'), g)))
+        self.assertNotEqual(h, job_hash(Job('c.svg', Chord(root='c', chord='major',
+                                                           voicing=(3,3,3)), g)))
+        self.assertNotEqual(h, job_hash(Job('c.svg', c, Guitar(frets=12))))
+        self.assertNotEqual(h, job_hash(Job('c.svg', c, Guitar(tuning='drop'))))
+        self.assertNotEqual(h, job_hash(Job('c.svg', c, g, {'root_color': 'blue'})))
+        self.assertNotEqual(job_hash(Job('s', Scale('c'), g)),
+                            job_hash(Job('s', Scale('c', 'minor'), g)))
+        self.assertNotEqual(job_hash(Job('n', Note('e4'), g)),
+                            job_hash(Job('n', ((Note('e4'), 'blue'),), g)))
+        with self.assertRaises(TypeError):
+            job_hash(Job('x', object()))
+
+    def test_batch_incremental(self):
+        jobs = scale_jobs(scale_names=('major',))
+        with TemporaryDirectory() as d:
+            self.assertEqual(batch(jobs, d, workers=1, incremental=True), 12)
+            m = Manifest.load(os.path.join(d, MANIFEST_NAME))
+            self.assertEqual(len(m), 12)
+            self.assertEqual(m[jobs[0].key], job_hash(jobs[0]))
+            self.assertEqual(batch(jobs, d, workers=1, incremental=True), 0)
+            os.remove(os.path.join(d, jobs[3].key))
+            jobs[5] = Job(jobs[5].key, jobs[5].diagram, jobs[5].instrument,
+                          {'root_color': 'blue'})
+            written = []
+            self.assertEqual(batch(jobs, d, workers=1, incremental=True,
+                                   progress=lambda done, total, key: written.append(key)), 2)
+            self.assertEqual(written, [jobs[3].key, jobs[5].key])
+            self.assertEqual(batch(jobs, d, workers=1), 12)
+            options = BatchOptions(workers=1, incremental=True)
+            self.assertEqual(batch(jobs, d, options), 0)
+            self.assertEqual(batch(jobs, d, options, incremental=False), 12)
+
+    def test_archive_sinks(self):
+        jobs = chord_jobs(chord_names=('major', 'minor'))
+        with TemporaryDirectory() as d:
+            batch(jobs, os.path.join(d, 'dir'), workers=1)
+            expected = {}
+            for j in jobs:
+                with open(os.path.join(d, 'dir', j.key), 'rb') as f:
+                    expected[j.key] = f.read()
+
+            for name in ('c.zip', 'c.tar', 'c.tar.gz', 'c.tar.xz'):
+                path = os.path.join(d, name)
+                self.assertEqual(batch(jobs, path, workers=2), 24)
+                if name.endswith('.zip'):
+                    with zipfile.ZipFile(path) as z:
+                        members = {n: z.read(n) for n in z.namelist()}
+                else:
+                    with tarfile.open(path) as t:
+                        members = {m.name: t.extractfile(m).read() for m in t}
+                index = json.loads(members.pop(INDEX_NAME))
+                self.assertEqual(index, {j.key: j.key for j in jobs})
+                self.assertEqual(members, expected)
+
+            with open(os.path.join(d, 'c.tar.gz'), 'rb') as f:
+                first = f.read()
+            batch(jobs, os.path.join(d, 'c.tar.gz'), workers=1)
+            with open(os.path.join(d, 'c.tar.gz'), 'rb') as f:
+                self.assertEqual(first, f.read())
+
+            with open(os.path.join(d, 'c.zip'), 'rb') as f:
+                first = f.read()
+            with self.assertRaises(ValueError):
+                batch(jobs, os.path.join(d, 'c.zip'), incremental=True)
+            # the existing archive is left unchanged
+            with open(os.path.join(d, 'c.zip'), 'rb') as f:
+                self.assertEqual(first, f.read())
+            with ArchiveSink(os.path.join(d, 's.zip'), compress=False) as sink:
+                self.assertIs(open_sink(sink), sink)
+                batch(jobs[:2], sink, workers=1)
+                with self.assertRaises(ValueError):
+                    sink.write(jobs[0].key, '')
+                self.assertTrue(sink.exists(jobs[1].key))
+            with zipfile.ZipFile(os.path.join(d, 's.zip')) as z:
+                self.assertEqual(len(z.namelist()), 3)
+                self.assertEqual(z.getinfo(jobs[0].key).compress_type, zipfile.ZIP_STORED)
+            self.assertIsInstance(open_sink(os.path.join(d, 'x')), DirectorySink)
+        with self.assertRaises(ValueError):
+            ArchiveSink('x.rar')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,9 @@
 import unittest
 
 from fractions import Fraction
-from trallala.core.scales import Scale
-from trallala.core.notes import PitchClass
+from trallala.core.scales import Scale, find_containing
+from trallala.core.notes import PitchClassSet
+from trallala.core.notes import PitchClass, Note
 
 class TestScale(unittest.TestCase):
 
@@ -33,6 +34,36 @@ class TestScale(unittest.TestCase):
         self.assertTrue(PitchClass('c#') in s)
         self.assertFalse(PitchClass('c') in s)
 
+    def test_octaves(self):
+        s = Scale(root='a', scale='minor')
+        self.assertTrue(s.get_octave(4) == ('c4', 'd4', 'e4', 'f4', 'g4', 'a4', 'b4'))
+        self.assertIs(s.get_octave(4), s.get_octave(4))
+        self.assertTrue(s.get_octaves()[4] == list(s.get_octave(4)))
+        self.assertTrue(len(s.get_octaves()) == 9)
+        with self.assertRaises(KeyError):
+            s.get_octave(9)
+
+    def test_note_membership(self):
+        s = Scale(root='c#', scale='minor')
+        self.assertTrue(Note('c#4') in s)
+        self.assertTrue(Note('e0') in s)
+        self.assertFalse(Note('c4') in s)
+        self.assertFalse(Note('c#9') in s)
+        for n in range(12*9):
+            self.assertTrue((Note(n) in s) == (Note(n) in sum(s.get_octaves().values(), [])))
+
+    def test_find_containing(self):
+        r = find_containing(['c', 'd', 'e', 'f', 'g', 'a', 'b'])
+        self.assertTrue(r[:2] == [('major', 'c'), ('ionian', 'c')])
+        self.assertTrue(('aeolian', 'a') in r)
+        for name, root in r:
+            s = Scale(root=root, scale=name)
+            self.assertTrue(PitchClassSet((0, 2, 4, 5, 7, 9, 11)) <= s.pitchclassset)
+        r = find_containing(PitchClassSet((0, 1, 2, 3)))
+        self.assertTrue(r == [])
+        self.assertTrue(len(find_containing([])) == 22*12)
+        self.assertTrue(find_containing(['c', 'e', 'g'])[0][0].endswith('pentatonic'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,86 @@
+import io
+import os
+import unittest
+
+from contextlib import redirect_stdout
+from tempfile import TemporaryDirectory
+from trallala.core.chords import Chord
+from trallala.core.notes import PitchClass
+from trallala.instruments.guitar import Guitar
+from trallala.instruments.voicings import voicings
+from trallala.instruments.voicingdb import build, main, VoicingDatabase, MUTED
+
+
+class TestVoicingDatabase(unittest.TestCase):
+
+    def test_build_query(self):
+        g = Guitar(frets=7)
+        with TemporaryDirectory() as d:
+            path = os.path.join(d, 'g.vdb')
+            n = build(g, path, chord_names=('major', 'minor7'), workers=1,
+                      root_in_bass=True)
+            with VoicingDatabase(path) as db:
+                self.assertEqual(len(db), n)
+                self.assertEqual(db.chords, ('major', 'minor7'))
+                self.assertEqual(len(db.roots), 12)
+                self.assertEqual(db.constraints, {'root_in_bass': True})
+                self.assertTrue(db.matches(g))
+                self.assertFalse(db.matches(Guitar()))
+                self.assertFalse(db.matches(Guitar(frets=7, tuning='drop')))
+
+                c = Chord('major', 'c')
+                expected = voicings(c, g, root_in_bass=True)
+                self.assertEqual(db.query('major', 'c'), expected)
+                self.assertEqual(db.query('major', PitchClass('c')), expected)
+                self.assertEqual(db.query('major', 0), expected)
+                self.assertIn((None, 3, 2, 0, 1, 0), db.query('major', 'c'))
+
+                def fretted(v):
+                    return [f for f in v if f]
+                window = db.query('minor7', 'a', min_fret=5, max_fret=7)
+                self.assertEqual(window, [v for v in voicings(Chord('minor7', 'a'), g,
+                                                              root_in_bass=True)
+                                          if fretted(v) and min(fretted(v)) >= 5
+                                          and max(fretted(v)) <= 7])
+                for v in db.query('major', 'g', max_span=1):
+                    f = fretted(v)
+                    self.assertLessEqual(max(f, default=0) - min(f, default=0), 1)
+                a = db.query_array('major', 'c', max_fret=3)
+                self.assertEqual(a.shape[1], 6)
+                self.assertTrue(((a <= 3) | (a == MUTED)).all())
+                with self.assertRaises(KeyError):
+                    db.query('minor', 'c')
+            with open(os.path.join(d, 'x'), 'wb') as f:
+                f.write(b'no database')
+            with self.assertRaises(ValueError):
+                VoicingDatabase(os.path.join(d, 'x'))
+
+    def test_rebuild_open(self):
+        g = Guitar(frets=5)
+        with TemporaryDirectory() as d:
+            path = os.path.join(d, 'g.vdb')
+            build(g, path, chord_names=('major', 'minor7'), workers=1)
+            with VoicingDatabase(path) as db:
+                expected = db.query('major', 'c')
+                # a smaller database replaces the file while db is open
+                build(g, path, chord_names=('minor',), workers=1)
+                self.assertEqual(db.query('major', 'c'), expected)
+                self.assertEqual(db.query('minor7', 'a'),
+                                 voicings(Chord('minor7', 'a'), g))
+            with VoicingDatabase(path) as db:
+                self.assertEqual(db.chords, ('minor',))
+            self.assertEqual(os.listdir(d), ['g.vdb'])
+
+    def test_main_default_root(self):
+        with TemporaryDirectory() as d:
+            path = os.path.join(d, 'g7.vdb')
+            with redirect_stdout(io.StringIO()):
+                main([path, '--strings', '7', '--frets', '2', '-j', '1'])
+            with VoicingDatabase(path) as db:
+                # root of the seven string tuning (b1), not e2
+                self.assertTrue(db.matches(Guitar(strings=7, frets=2)))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from itertools import product
+from trallala.core.notes import PitchClass
+from trallala.core.chords import Chord
+from trallala.instruments.guitar import Guitar
+from trallala.instruments.voicings import voicings, catalogue
+
+
+def key(v):
+    return tuple(-1 if f is None else f for f in v)
+
+
+def brute_force(chord, guitar, max_span, root_in_bass, omit_fifth, max_fret):
+    f = guitar.fretboard
+    pcs = {p.numeric for p in chord.get_pitchclasses()}
+    root = chord.get_pitchclasses()[0].numeric
+    required = set(pcs)
+    if omit_fifth:
+        required.discard((root + 7) % 12)
+    ret = []
+    for v in product(*([None] + list(range(max_fret + 1)) for _ in range(6))):
+        sounding = [f.all_notes[s][fr] for s, fr in enumerate(v) if fr is not None]
+        played = {n.distance % 12 for n in sounding}
+        fretted = [fr for fr in v if fr]
+        if not played <= pcs or not required <= played \
+                or len(sounding) < len(required):
+            continue
+        if fretted and max(fretted) - min(fretted) > max_span:
+            continue
+        if root_in_bass and min(sounding).distance % 12 != root:
+            continue
+        ret.append(v)
+    return sorted(ret, key=key)
+
+
+class TestVoicings(unittest.TestCase):
+
+    def test_open_chords(self):
+        g = Guitar()
+        c = voicings(Chord('major', 'c'), g, root_in_bass=True)
+        self.assertIn((None, 3, 2, 0, 1, 0), c)
+        self.assertIn((8, 10, 10, 9, 8, 8), c)
+        self.assertNotIn((0, 3, 2, 0, 1, 0), c)
+        self.assertIn((0, 3, 2, 0, 1, 0), voicings(Chord('major', 'c'), g))
+        self.assertIn((3, 2, 0, 0, 0, 3), voicings(Chord('major', 'g'), g))
+        self.assertNotIn((None, None, 0, 0, 0, 3),
+                         voicings(Chord('major', 'g'), g, root_in_bass=True))
+        for v in c:
+            self.assertEqual(len(v), 6)
+            fretted = [f for f in v if f]
+            self.assertLessEqual(max(fretted, default=0) - min(fretted, default=0), 3)
+
+    def test_brute_force(self):
+        g = Guitar(frets=5)
+        for chord, span, bass, fifth in ((Chord('major', 'c'), 3, False, False),
+                                         (Chord('minor7', 'a'), 2, True, False),
+                                         (Chord('dominant7', 'e'), 3, True, True)):
+            self.assertEqual(sorted(voicings(chord, g, span, bass, fifth), key=key),
+                             brute_force(chord, g, span, bass, fifth, 5))
+
+    def test_constraints(self):
+        g = Guitar()
+        c = Chord('dominant7', 'g')
+        with_fifth = set(voicings(c, g, max_fret=5))
+        without = set(voicings(c, g, omit_fifth=True, max_fret=5))
+        self.assertTrue(with_fifth < without)
+        for v in voicings(c, g, min_strings=6, max_fret=7):
+            self.assertNotIn(None, v)
+            self.assertLessEqual(max(v), 7)
+
+    def test_catalogue(self):
+        g = Guitar(frets=7)
+        c = catalogue(g, chord_names=('major', 'minor'), roots=('c', 'a'),
+                      workers=2, root_in_bass=True)
+        self.assertEqual(list(c), [('major', 'c'), ('major', 'a'),
+                                   ('minor', 'c'), ('minor', 'a')])
+        self.assertEqual(c[('minor', 'a')],
+                         tuple(voicings(Chord('minor', 'a'), g, root_in_bass=True)))
+        self.assertIn((None, 0, 2, 2, 1, 0), c[('minor', 'a')])
+        self.assertEqual(c, catalogue(g, chord_names=('major', 'minor'),
+                                      roots=('c', 'a'), workers=1,
+                                      root_in_bass=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,8 @@ Please refere to the documentation provided in the
 
 from . import core
 from . import instruments
+from . import render
 
-__all__ = ["core","instruments"]
+__all__ = ["core","instruments","render"]
 
 
@@ -3,6 +3,7 @@
 """ Classes and methods used for Chords
 """
 
+from collections import namedtuple
 from functools import singledispatchmethod
 
 from .scales import ChromaticScale, Scale
@@ -48,6 +49,8 @@ class Chord:
         self._root_index = self._scale.temperament.name_to_distance(root)
         self._root_name = root
         self._chord = self._dispatch_init(chord)
+        self._pcset = notes.PitchClassSet((self._root_index + x for x in self._chord),
+                                          self._scale)
         if voicing:
             self._voicing = tuple(voicing)
         else:
@@ -79,8 +82,8 @@ class Chord:
                    +" (e.g., a major chord would be [0, 4, 7]")
         return tuple(sorted(c))
 
-    def _chord_int_from_intervals(self, intervals):
-        return tuple(x.distance for x in intervals)
+    def _chord_int_from_intervals(self, chord_intervals):
+        return tuple(x.distance for x in chord_intervals)
 
     def get_chord_as_interval(self) -> tuple:
         """ Returns the chord as a  root note and intervals
@@ -95,19 +98,30 @@ class Chord:
 
         return (c[0], tuple(ret))
 
+    def _distance(self, chord_int, octave):
+        """ Distance to C0 of the chord note 'chord_int' voiced in 'octave' """
+        length = self._scale.temperament.length
+        return length * (octave + chord_int // length) \
+            + (self._root_index + chord_int) % length
+
+    def _octave(self, chord_int, distance):
+        """ Voicing octave of the chord note 'chord_int' at 'distance' to C0 """
+        length = self._scale.temperament.length
+        return (distance - (self._root_index + chord_int) % length) // length \
+            - chord_int // length
+
     def get_chord(self) -> list:
         """ Returns the list with the notes of the chord.
         """
         chord = []
         if self._voicing is None:
-            root = self._chord[0]+4*self._scale.temperament.length
+            root = self._root_index + 4*self._scale.temperament.length
             for e in self._chord:
                 n = notes.Note(root + e, self._scale)
                 chord.append(n)
         else:
             for e, note in enumerate(self._chord):
-                n = note \
-                    + self._scale.temperament.length * self._voicing[e]
+                n = self._distance(note, self._voicing[e])
                 chord.append( notes.Note(n, self._scale)  )
         return chord
 
@@ -138,8 +152,9 @@ class Chord:
         return self.get_chord()[key]
 
     def __str__(self):
-        return ", ".join(("/".join(self._scale.temperament.distance_to_name(x)) \
-                for x in self._chord))
+        length = self._scale.temperament.length
+        return ", ".join(("/".join(self._scale.temperament.distance_to_name(
+                (self._root_index + x) % length)) for x in self._chord))
 
     @singledispatchmethod
     def __add__(self, a):
@@ -149,12 +164,12 @@ class Chord:
     def _1(self, a: notes.Note):
         if not self._voicing:
             raise ValueError("Cannot add Note to Chord without set voicing")
-        d = a.distance % self._scale.temperament.length
-        o = int(a.distance / self._scale.temperament.length)
+        d = (a.distance - self._root_index) % self._scale.temperament.length
+        o = self._octave(d, a.distance)
         c = list(self._chord)
+        v = list(self._voicing)
         if d not in c:
             c.append(d)
-            v = list(self._voicing)
             v.append(o)
         return Chord(c, root=self._root_name, voicing=v,
                      chromaticscale=self._scale)
@@ -163,28 +178,24 @@ class Chord:
     def _2(self, a: notes.PitchClass):
         new_chord_int = []
         new_chord_int.extend(self._chord)
-        if a.numeric not in new_chord_int:
-            new_chord_int.append(a.numeric)
-            if self._voicing:
-                v = list(self._voicing)
+        d = (a.numeric - self._root_index) % self._scale.temperament.length
+        v = list(self._voicing) if self._voicing else None
+        if d not in new_chord_int:
+            new_chord_int.append(d)
+            if v:
                 v.append(v[0])
-            else:
-                v = None
         ret = Chord(new_chord_int, self._root_name, v, self._scale)
         return ret
 
     @__add__.register
     def _3(self, a: intervals.Interval):
         new_chord_int = list(self._chord)
-        v = list(self._voicing[:])
+        v = list(self._voicing) if self._voicing else None
         if a.distance not in new_chord_int:
             new_chord_int.append(a.distance)
             if v:
-                if self._root_index + a.distance \
-                    < self._scale.temperament.length:
-                    v.append(v[0])
-                else:
-                    v.append(v[0] + 1)
+                v.append(self._octave(a.distance,
+                                      self._distance(self._chord[0], v[0]) + a.distance))
         return Chord(new_chord_int, self._root_name, v ,self._scale)
 
     @singledispatchmethod
@@ -224,7 +235,7 @@ class Chord:
 
     @__contains__.register
     def _2(self,a: notes.PitchClass):
-        return a.numeric in self._chord
+        return a.numeric in self._pcset
 
     @__contains__.register
     def _3(self,a: intervals.Interval):
@@ -252,6 +263,12 @@ class Chord:
         """
         return self._chord[:]
 
+    @property
+    def pitchclassset(self):
+        """ Pitchclasses of the chord as PitchClassSet
+        """
+        return self._pcset
+
     @property
     def voicing(self):
         """ Current voicing of this chord
@@ -269,10 +286,169 @@ class Chord:
 
 @Scale.__contains__.register
 def _s1(scale, a: Chord):
-    for chord_note in a.get_chord():
-        if chord_note not in scale:
-            return False
-    return True
+    return a.pitchclassset <= scale.pitchclassset
+
+
+ChordMatch = namedtuple('ChordMatch', ('chord', 'root', 'inversion', 'extra', 'missing'))
+ChordMatch.__doc__ = """ Result of identify()
+
+    chord:
+        chord name from trallala.config_chords
+    root:
+        pitchclass name of the root
+    inversion:
+        0 for root position, n if the n-th chord note is the bass, None
+        without bass note or if the bass is not a chord note
+    extra:
+        tuple(pitchclass names) not part of the chord
+    missing:
+        tuple(pitchclass names) of the chord not present
+"""
+
+# tuple(list of (chord mask, chord name, root, chord pitchclass order),
+# dict chord mask -> positions in the list) per temperament length
+_chord_index = {}
+# ranked (cost, ..., match) candidates per (length, mask, max_missing, max_extra)
+_identified = {}
+
+
+def _get_chord_index(length):
+    """ Bitmasks of every chord in chord_integer for every root and the
+    positions of the chords per bitmask
+    """
+    try:
+        return _chord_index[length]
+    except KeyError:
+        pass
+    index = []
+    by_mask = {}
+    full = (1 << length) - 1
+    for name, chord_int in chord_integer[length].items():
+        order = tuple(dict.fromkeys(x % length for x in chord_int))
+        base = 0
+        for pc in order:
+            base |= 1 << pc
+        for root in range(length):
+            mask = ((base << root) | (base >> (length - root))) & full
+            by_mask.setdefault(mask, []).append(len(index))
+            index.append((mask, name, root, order))
+    return _chord_index.setdefault(length, (index, by_mask))
+
+
+def _candidates(length, mask, max_missing, max_extra):
+    """ Chords of the index within max_missing/ max_extra of mask, cached """
+    key = (length, mask, max_missing, max_extra)
+    try:
+        return _identified[key]
+    except KeyError:
+        pass
+    index, by_mask = _get_chord_index(length)
+    # exact matches are looked up, only fuzzy queries scan the index
+    if max_missing == 0 and max_extra == 0:
+        ret = [(0, -len(index[p][3]), p) + index[p][1:] + (0, 0)
+               for p in by_mask.get(mask, ())]
+        ret.sort()
+        return _identified.setdefault(key, tuple(ret))
+    ret = []
+    for position, entry in enumerate(index):
+        missing = entry[0] & ~mask
+        extra = mask & ~entry[0]
+        n_missing = bin(missing).count('1')
+        n_extra = bin(extra).count('1')
+        if n_missing <= max_missing and n_extra <= max_extra:
+            ret.append((n_missing + n_extra, -len(entry[3]), position)
+                       + entry[1:] + (missing, extra))
+    ret.sort()
+    return _identified.setdefault(key, tuple(ret))
+
+
+def _pitchclasses_and_bass(chord, chromaticscale):
+    """ Pitchclass mask and bass pitchclass (or None) of the query """
+    if isinstance(chord, Chord):
+        chord = chord.get_chord()
+    if isinstance(chord, notes.PitchClassSet):
+        return (chord.mask, None)
+    length = chromaticscale.temperament.length
+    mask = 0
+    bass = None
+    for x in chord:
+        if isinstance(x, notes.Note):
+            distance = x.distance
+        elif isinstance(x, int):
+            distance = x
+        elif isinstance(x, str) and len(x) > 1 and x[-1].isdigit():
+            distance = chromaticscale.spn_to_distance(x)
+        else:
+            mask |= 1 << notes.PitchClass(x, chromaticscale).numeric
+            continue
+        mask |= 1 << distance % length
+        if bass is None or distance < bass:
+            bass = distance
+    return (mask, None if bass is None else bass % length)
+
+
+def _match(candidate, bass, temperament):
+    """ ChordMatch of a candidate of _candidates for the bass pitchclass """
+    _, _, _, name, root, order, missing, extra = candidate
+    length = temperament.length
+    names = temperament.distance_to_name
+    inversion = None
+    if bass is not None and (bass - root) % length in order:
+        inversion = order.index((bass - root) % length)
+    return ChordMatch(name, names(root)[0], inversion,
+                      tuple(names(i)[0] for i in range(length) if extra >> i & 1),
+                      tuple(names((root + i) % length)[0] for i in order
+                            if missing >> ((root + i) % length) & 1))
+
+
+def identify(chord, max_missing=0, max_extra=0,
+             chromaticscale=ChromaticScale()) -> list:
+    """ Identifies the chords formed by notes or pitchclasses
+
+    Uses a precomputed bitmask index over all chords of
+    trallala.config_chords for all roots. Candidates are cached per set of
+    pitchclasses.
+
+    Args:
+        chord:
+            Chord, PitchClassSet or iterable of Notes, SPN, distances to C0,
+            PitchClasses or pitchclass names. The lowest Note is the bass.
+        max_missing:
+            Maximal amount of chord notes missing in 'chord'. Default: 0
+        max_extra:
+            Maximal amount of notes in 'chord' not part of the chord.
+            Default: 0
+        chromaticscale:
+            ChromaticScale used to for the definition. Default: TET12
+
+    Returns:
+        List of ChordMatch ranked by the amount of missing and extra notes,
+        chords with the bass as root first, then larger chords first
+    """
+    length = chromaticscale.temperament.length
+    mask, bass = _pitchclasses_and_bass(chord, chromaticscale)
+
+    ranked = []
+    for candidate in _candidates(length, mask, max_missing, max_extra):
+        match = _match(candidate, bass, chromaticscale.temperament)
+        ranked.append(((candidate[0], match.inversion != 0) + candidate[1:3], match))
+    ranked.sort(key=lambda x: x[0])
+    return [m for _, m in ranked]
+
+
+def identify_many(chords, max_missing=0, max_extra=0,
+                  chromaticscale=ChromaticScale()) -> list:
+    """ identify() for many chords
+
+    Args:
+        chords:
+            Iterable of chords as accepted by identify()
+
+    Returns:
+        List with the result of identify() for each chord
+    """
+    return [identify(c, max_missing, max_extra, chromaticscale) for c in chords]
+
 
 if __name__ == '__main__':
     pass
@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 
-"""Note and PitchClass Class definitions
+"""Note, PitchClass, PitchClassSet and NoteArray Class definitions
 
 PitchClasses and Notes are fundamentel datatypes for this
 music theory package and are used and supported by all other
-classes like scales, chords or instruments.
+classes like scales, chords or instruments. NoteArray stores many notes
+as one array of distances for vectorized operations.
 """
 
 from functools import singledispatchmethod
 
+import numpy as np
+
 from .temperament import _CoreChromaticScale
 
 class Note:
@@ -28,12 +31,20 @@ class Note:
         frequency:
             Frequency in Hz of the note
     """
-    @singledispatchmethod
-    def __init__(self, note , chromaticscale=_CoreChromaticScale()):
-        """ Initializes a Note Object
+    __slots__ = ('_name', '_distance', '_chromaticscale')
+    _name: str
+    _distance: int
+    _chromaticscale: _CoreChromaticScale
+
+    # one shared Note per (distance, chromatic scale)
+    _interned = {}
+
+    def __new__(cls, note, chromaticscale=_CoreChromaticScale()):
+        """ Returns the Note Object
 
         Creates a Note Object from another Note object, SPN, distance to C0 (int) or a frequency
-        (float).
+        (float). Notes are immutable and interned: equal Notes of the same
+        chromatic scale are the same object.
 
         Args:
             note:
@@ -44,54 +55,92 @@ class Note:
             ValueError:
                 Frequency, SPN, distance does not usable to create note from
         """
-        if isinstance(note, Note):
-            self._shared_init(note.distance, chromaticscale)
-        else:
-            raise ValueError("Note must be initilized with SPN, int distance to C0"
-                             + " or a frequence")
-
         if not isinstance(chromaticscale, _CoreChromaticScale):
             chromaticscale = _CoreChromaticScale(chromaticscale.anchor,
                                                  chromaticscale.temperament)
+        if isinstance(note, int):
+            distancetoc0 = note
+        elif isinstance(note, str):
+            distancetoc0 = chromaticscale.spn_to_distance(note)
+        else:
+            distancetoc0 = cls._distance_of(note, chromaticscale)
 
-    @__init__.register
-    def _1(self, note: int, chromaticscale=_CoreChromaticScale()):
-        if not isinstance(chromaticscale, _CoreChromaticScale):
-            chromaticscale = _CoreChromaticScale(chromaticscale.anchor,
-                                                 chromaticscale.temperament)
-        self._shared_init(distancetoc0=note, chromaticscale=chromaticscale)
+        key = (distancetoc0, chromaticscale.key)
+        try:
+            return cls._interned[key]
+        except KeyError:
+            pass
 
-    @__init__.register
-    def _2(self, note: float, chromaticscale=_CoreChromaticScale()):
-        if not isinstance(chromaticscale, _CoreChromaticScale):
-            chromaticscale = _CoreChromaticScale(chromaticscale.anchor,
-                                                 chromaticscale.temperament)
-        success = False
-        octaves = chromaticscale.get_octaves()
-        for octave in octaves:
-            for n in octaves[octave]:
-                if n == note:
-                    success = True
-                    distancec0 = octaves[octave].index(n) \
-                                    + chromaticscale.temperament.length \
-                                    * (octave)
-                    self._shared_init(distancec0, chromaticscale)
-
-        if not success:
-            raise ValueError("Frequency does not match any note in used"
-                             + " chromatic scale")
-
-    @__init__.register
-    def _3(self, note: str, chromaticscale=_CoreChromaticScale()):
+        self = super().__new__(cls)
+        object.__setattr__(self, '_name', chromaticscale.spn_from_distance(distancetoc0))
+        object.__setattr__(self, '_distance', distancetoc0)
+        object.__setattr__(self, '_chromaticscale', chromaticscale)
+        return cls._interned.setdefault(key, self)
+
+    @singledispatchmethod
+    @classmethod
+    def _distance_of(cls, note, chromaticscale):
+        """ Semitone distance to C0 of a Note, SPN or frequency (ints are
+        handled by __new__)
+        """
+        # pylint: disable=unused-argument
+        if isinstance(note, Note):
+            return note.distance
+        raise ValueError("Note must be initilized with SPN, int distance to C0"
+                         + " or a frequence")
+
+    @_distance_of.register
+    @classmethod
+    def _2(cls, note: float, chromaticscale):
+        return chromaticscale.distance_of_frequency(note)
+
+    @_distance_of.register
+    @classmethod
+    def _3(cls, note: str, chromaticscale):
+        return chromaticscale.spn_to_distance(note)
+
+    @classmethod
+    def from_frequency(cls, frequency, chromaticscale=_CoreChromaticScale(),
+                       tolerance=0, nearest=False):
+        """ Creates a Note from a measured frequency
+
+        Args:
+            frequency:
+                Frequency in Hz
+            chromaticscale:
+                ChromaticScale Object. Default: TET12
+            tolerance:
+                Accepted deviation in cents. Default: 0 (exact match)
+            nearest:
+                Return the nearest note regardless of the tolerance
+        Raises:
+            ValueError:
+                Frequency does not match any note within the tolerance
+        """
         if not isinstance(chromaticscale, _CoreChromaticScale):
             chromaticscale = _CoreChromaticScale(chromaticscale.anchor,
                                                  chromaticscale.temperament)
-        self._shared_init(chromaticscale.spn_to_distance(note), chromaticscale)
+        return cls(chromaticscale.distance_of_frequency(frequency, tolerance, nearest),
+                   chromaticscale)
 
-    def _shared_init(self, distancetoc0, chromaticscale):
-        self._name = chromaticscale.spn_from_distance(distancetoc0)
-        self._distance = distancetoc0
-        self._chromaticscale = chromaticscale
+    def __setattr__(self, name, value):
+        raise AttributeError("Note objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Note objects are immutable")
+
+    def __reduce__(self):
+        return (Note, (self._distance, self._chromaticscale))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __hash__(self):
+        # Notes are equal if their names (and therefore distances) are equal
+        return hash(self._distance)
 
     @singledispatchmethod
     def __eq__(self, a):
@@ -250,6 +299,12 @@ class Note:
         """
         return self._chromaticscale.frequencyof(self._distance)
 
+    @property
+    def chromaticscale(self):
+        """ ChromaticScale (anchor and temperament) of this Note
+        """
+        return self._chromaticscale
+
 
 class PitchClass:
     """Object representing a ptichclass (e.g. all C notes in all octaves)
@@ -261,11 +316,14 @@ class PitchClass:
             Str name of the PichClass (e.g. C,D... without added octave)
     """
 
+    __slots__ = ('_chromaticscale', '_pc_numeric', '_pc_name', '_pc')
+
     def __init__(self, note, chromaticscale=_CoreChromaticScale()):
         """ initializes the PitchClass
 
         Pitchclass can be initialized from a note, SPN,  distance to C0,
-        PitchClass numeric (c=0,...) or frequency
+        PitchClass numeric (c=0,...) or frequency. The Notes of the
+        PitchClass are only created when it is iterated or indexed.
 
         Args:
             note:
@@ -275,32 +333,51 @@ class PitchClass:
                 ChromaticScale used to for the definition. Default: TET12
 
         Raises:
+            ValueError:
+                PitchClass cannot be created from note
         """
-        try:
-            n = Note(note)
-        except ValueError:
-            # if note name and not SPN is provided...
-            n = Note("".join((note, '0')))
+        temperament = chromaticscale.temperament
+        if isinstance(note, int):
+            distance = note
+        elif isinstance(note, Note):
+            distance = note.distance
+        elif isinstance(note, PitchClass):
+            distance = note.numeric
+        elif isinstance(note, str):
+            try:
+                distance = temperament.name_to_distance(note)
+            except ValueError:
+                distance = chromaticscale.spn_to_distance(note)
+        else:
+            distance = Note(note, chromaticscale).distance
 
         self._chromaticscale = chromaticscale
-
-        self._pc_numeric = n.distance % chromaticscale.temperament.length
-        self._pc_name = chromaticscale.split_spn(n.name)[0]
-        pc = []
-        octaves = chromaticscale.get_octaves()
-        for octave in octaves:
-            pc.append(Note(self._pc_numeric)*(octave+1))
-        self._pc = pc
+        self._pc_numeric = distance % temperament.length
+        self._pc_name = temperament.distance_to_name(self._pc_numeric)[0]
+        self._pc = None
+
+    def _notes(self):
+        """ Notes of this pitchclass in all octaves, created on first use """
+        if self._pc is None:
+            length = self._chromaticscale.temperament.length
+            self._pc = tuple(Note(self._pc_numeric + length*octave, self._chromaticscale)
+                             for octave in range(self._chromaticscale.number_octaves))
+        return self._pc
 
     def __iter__(self):
-        return self._pc.__iter__()
+        return self._notes().__iter__()
 
     def __str__(self):
-        return str(", ".join((str(x) for x in self._pc)))
+        return str(", ".join((str(x) for x in self._notes())))
 
     def __getitem__(self, n):
-        return self._pc[n]
+        return self._notes()[n]
 
+    def __hash__(self):
+        return hash(self._pc_numeric)
+
+    # no str overload: a name cannot share the hash of the numeric value
+    # (lists are unhashable and are compared by in_list)
     @singledispatchmethod
     def __eq__(self, a):
         if isinstance(a,  PitchClass):
@@ -308,13 +385,22 @@ class PitchClass:
         return NotImplemented
 
     @__eq__.register
-    def _1(self, a: str):
-        return self._chromaticscale.temperament.name_to_distance(a)  == self._pc_numeric
+    def _1(self, a: list):
+        return self.in_list(a)
 
-    @__eq__.register
-    def _2(self, a: list):
+    def in_list(self, a) -> bool:
+        """ True if any element of a is this PitchClass
+
+        Args:
+            a:
+                Iterable of PitchClasses and/or str names (e.g. 'a', 'Bb')
+        """
         for n in a:
-            if self == n:
+            if isinstance(n, str):
+                n = self._chromaticscale.temperament.name_to_distance(n)
+            else:
+                n = n.numeric
+            if n == self._pc_numeric:
                 return True
         return False
 
@@ -330,7 +416,9 @@ class PitchClass:
 
     @__contains__.register
     def _1(self, a: Note):
-        return a.name in self._pc
+        length = self._chromaticscale.temperament.length
+        return a.distance % length == self._pc_numeric \
+            and 0 <= a.distance < length * self._chromaticscale.number_octaves
 
     @__contains__.register(int)
     @__contains__.register(str)
@@ -351,5 +439,353 @@ class PitchClass:
         return self._pc_numeric
 
 
+class PitchClassSet:
+    """Set of pitchclasses stored as an integer bitmask
+
+    Bit n of the mask is set if the pitchclass with numeric n is part of the
+    set. Membership, transposition and the set operations are integer
+    operations.
+
+    Properties:
+        mask:
+            Bitmask of the set as int
+        length:
+            Length of the temperament (amount of bits used)
+    """
+
+    __slots__ = ('_mask', '_length', '_chromaticscale')
+
+    def __init__(self, pitchclasses=(), chromaticscale=_CoreChromaticScale()):
+        """ initializes the PitchClassSet
+
+        Args:
+            pitchclasses:
+                Iterable of pitchclass numerics or distances (int), Notes,
+                PitchClasses, pitchclass names or SPN
+            chromaticscale:
+                ChromaticScale used to for the definition. Default: TET12
+        Raises:
+            ValueError:
+                Element cannot be converted into a PitchClass
+        """
+        self._chromaticscale = chromaticscale
+        self._length = chromaticscale.temperament.length
+        mask = 0
+        for pc in pitchclasses:
+            mask |= 1 << self._numeric(pc)
+        self._mask = mask
+
+    @classmethod
+    def from_mask(cls, mask: int, chromaticscale=_CoreChromaticScale()):
+        """ Creates a PitchClassSet from a bitmask
+        """
+        ret = cls((), chromaticscale)
+        ret._mask = mask & ((1 << ret._length) - 1)
+        return ret
+
+    def _numeric(self, a):
+        if isinstance(a, int):
+            return a % self._length
+        if isinstance(a, Note):
+            return a.distance % self._length
+        if isinstance(a, PitchClass):
+            return a.numeric
+        return PitchClass(a, self._chromaticscale).numeric
+
+    def _new(self, mask):
+        return PitchClassSet.from_mask(mask, self._chromaticscale)
+
+    def _check(self, a):
+        if not isinstance(a, PitchClassSet):
+            return False
+        if a.length != self._length:
+            raise ValueError("PitchClassSets of different temperaments")
+        return True
+
+    def transpose(self, steps: int):
+        """ Returns the set transposed by 'steps' (bit rotation)
+        """
+        steps %= self._length
+        full = (1 << self._length) - 1
+        return self._new(((self._mask << steps) | (self._mask >> (self._length - steps)))
+                         & full)
+
+    def __contains__(self, a):
+        return bool(self._mask >> self._numeric(a) & 1)
+
+    def __iter__(self):
+        return (i for i in range(self._length) if self._mask >> i & 1)
+
+    def __len__(self):
+        return bin(self._mask).count('1')
+
+    def __str__(self):
+        return ", ".join(self._chromaticscale.temperament.distance_to_name(i)[0]
+                         for i in self)
+
+    def __or__(self, a):
+        if not self._check(a):
+            return NotImplemented
+        return self._new(self._mask | a.mask)
+
+    def __and__(self, a):
+        if not self._check(a):
+            return NotImplemented
+        return self._new(self._mask & a.mask)
+
+    def __xor__(self, a):
+        if not self._check(a):
+            return NotImplemented
+        return self._new(self._mask ^ a.mask)
+
+    def __sub__(self, a):
+        if not self._check(a):
+            return NotImplemented
+        return self._new(self._mask & ~a.mask)
+
+    def __invert__(self):
+        return self.complement()
+
+    def complement(self):
+        """ Returns all pitchclasses not in this set
+        """
+        return self._new(~self._mask)
+
+    def issubset(self, a) -> bool:
+        """ True if all pitchclasses of this set are in 'a'
+        """
+        self._check(a)
+        return self._mask & ~a.mask == 0
+
+    def issuperset(self, a) -> bool:
+        """ True if all pitchclasses of 'a' are in this set
+        """
+        self._check(a)
+        return a.mask & ~self._mask == 0
+
+    def __le__(self, a):
+        if not self._check(a):
+            return NotImplemented
+        return self.issubset(a)
+
+    def __ge__(self, a):
+        if not self._check(a):
+            return NotImplemented
+        return self.issuperset(a)
+
+    def __lt__(self, a):
+        if not self._check(a):
+            return NotImplemented
+        return self.issubset(a) and self._mask != a.mask
+
+    def __gt__(self, a):
+        if not self._check(a):
+            return NotImplemented
+        return self.issuperset(a) and self._mask != a.mask
+
+    def __eq__(self, a):
+        if not isinstance(a, PitchClassSet):
+            return NotImplemented
+        return self._mask == a.mask and self._length == a.length
+
+    def __hash__(self):
+        return hash((self._mask, self._length))
+
+    @property
+    def mask(self):
+        """ Bitmask of the pitchclasses as int
+        """
+        return self._mask
+
+    @property
+    def length(self):
+        """ Length of the temperament
+        """
+        return self._length
+
+
+class NoteArray:
+    """Many notes of one chromatic scale stored as one contiguous int array
+
+    NoteArray supports the same mathematical operations as Note, applied to
+    all notes at once without creating Note objects. The array is
+    immutable; all operations return new NoteArrays or numpy arrays.
+
+    Properties:
+        distances:
+            Read-only numpy array of the semitone distances to C0
+        names:
+            List of the SPN names of the notes
+        frequencies:
+            Numpy array of the frequencies in Hz of the notes
+        pitchclasses:
+            Numpy array of the numeric pitchclasses of the notes
+    """
+
+    def __init__(self, notes, chromaticscale=_CoreChromaticScale()):
+        """ Initializes a NoteArray
+
+        Args:
+            notes:
+                NoteArray, numpy array of distances to C0 or iterable of
+                Notes, SPNs (str) or distances to C0 (int)
+            chromaticscale:
+                ChromaticScale Object. Default: TET12
+        Raises:
+            ValueError:
+                Element is not usable to create a note from
+        """
+        if not isinstance(chromaticscale, _CoreChromaticScale):
+            chromaticscale = _CoreChromaticScale(chromaticscale.anchor,
+                                                 chromaticscale.temperament)
+        self._chromaticscale = chromaticscale
+
+        if isinstance(notes, NoteArray):
+            distances = notes.distances
+        elif isinstance(notes, np.ndarray):
+            if notes.dtype.kind not in 'iu':
+                raise ValueError("NoteArray requires an integer array of distances to C0")
+            distances = notes
+        else:
+            distances = np.fromiter((self._distance_of(n) for n in notes),
+                                    dtype=np.int64)
+        self._distances = np.array(distances, dtype=np.int64, order='C')
+        self._distances.flags.writeable = False
+
+    def _distance_of(self, n):
+        if isinstance(n, Note):
+            return n.distance
+        if isinstance(n, str):
+            return self._chromaticscale.spn_to_distance(n)
+        if isinstance(n, (int, np.integer)):
+            return n
+        raise ValueError("NoteArray elements must be Notes, SPN or int distances to C0")
+
+    def _new(self, distances):
+        return NoteArray(distances, self._chromaticscale)
+
+    def _operand(self, a):
+        """ Distances of the right hand operand of a comparison """
+        if isinstance(a, NoteArray):
+            return a.distances
+        if isinstance(a, np.ndarray):
+            return a
+        return self._distance_of(a)
+
+    def to_notes(self) -> list:
+        """ Returns the notes as a list of Note objects
+        """
+        return [Note(d, self._chromaticscale) for d in self._distances.tolist()]
+
+    def __len__(self):
+        return len(self._distances)
+
+    def __iter__(self):
+        return iter(self.to_notes())
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return Note(int(self._distances[key]), self._chromaticscale)
+        return self._new(self._distances[key])
+
+    def __str__(self):
+        return ", ".join(self.names)
+
+    def __add__(self, a):
+        """ Transposition by int or array of semitone steps """
+        return self._new(self._distances + a)
+
+    def __sub__(self, a):
+        """ NoteArray - Note/NoteArray returns the semitone distances as numpy
+        array, NoteArray - int returns the transposed NoteArray
+        """
+        if isinstance(a, (Note, NoteArray)):
+            return self._distances - self._operand(a)
+        return self._new(self._distances - a)
+
+    def __mul__(self, a):
+        """ Multiplication of all notes as defined by Note.__mul__ """
+        if a >= 1:
+            shifted = self._distances + (a-1)*self._chromaticscale.temperament.length
+            return self._new(np.trunc(shifted).astype(np.int64))
+        if 0 < a < 1:
+            return self/(1/a)
+        raise TypeError("Multiplication of 'NoteArray' with numbers <= 0 not allowed")
+
+    def __truediv__(self, a):
+        """ Division of all notes as defined by Note.__truediv__ """
+        if a >= 1:
+            shifted = self._distances - (a-1)*self._chromaticscale.temperament.length
+            return self._new(np.trunc(shifted).astype(np.int64))
+        if 1 > a > 0:
+            return self * (1/a)
+        raise ValueError("Division of 'NoteArray' with numbers <= 0 not allowed")
+
+    def __eq__(self, a):
+        if isinstance(a, float):
+            return self.frequencies == a
+        return self._distances == self._operand(a)
+
+    def __ne__(self, a):
+        return ~(self == a)
+
+    def __lt__(self, a):
+        if isinstance(a, float):
+            return self.frequencies < a
+        return self._distances < self._operand(a)
+
+    def __le__(self, a):
+        if isinstance(a, float):
+            return self.frequencies <= a
+        return self._distances <= self._operand(a)
+
+    def __gt__(self, a):
+        if isinstance(a, float):
+            return self.frequencies > a
+        return self._distances > self._operand(a)
+
+    def __ge__(self, a):
+        if isinstance(a, float):
+            return self.frequencies >= a
+        return self._distances >= self._operand(a)
+
+    __hash__ = None
+
+    def intervals(self):
+        """ Semitone distances between consecutive notes as numpy array
+        """
+        return np.diff(self._distances)
+
+    @property
+    def distances(self):
+        """ Distances to C0 as read-only numpy array
+        """
+        return self._distances
+
+    @property
+    def names(self):
+        """ SPN names of the notes
+        """
+        return self._chromaticscale.spn_from_distance_many(self._distances.tolist())
+
+    @property
+    def pitchclasses(self):
+        """ Numeric pitchclasses (i.e., 0 to 11) of the notes as numpy array
+        """
+        return self._distances % self._chromaticscale.temperament.length
+
+    @property
+    def frequencies(self):
+        """ Frequencies of the notes as numpy array
+        """
+        table = np.asarray(self._chromaticscale.frequencies)
+        inside = (self._distances >= 0) & (self._distances < len(table))
+        freqs = np.empty(len(self._distances), dtype=np.float64)
+        freqs[inside] = table[self._distances[inside]]
+        for i in np.flatnonzero(~inside):
+            freqs[i] = self._chromaticscale.frequencyof(int(self._distances[i]))
+        return freqs
+
+
 if __name__ == '__main__':
     pass
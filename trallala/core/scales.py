@@ -17,9 +17,13 @@ for t in scales_steps:
         if sum(scales_steps[t][s]) != t:
             raise ValueError(f"Sum of steps in {s}: {scales_steps[t][s]} != {t}")
 
+# octaves of Note objects per chromatic scale key, shared by all scales
+_octaves = {}
+
 # Indirection required to allow scales to work with Note objects
 class ChromaticScale(_CoreChromaticScale):
     _number_octaves = 9
+    _shared = True
 
     def __init__(self, anchor=('a4', 440), temperament=temperament['12TET']):
         """ Creates Chromatic Scale from given note (Scientific Pitch Notation)
@@ -30,30 +34,34 @@ class ChromaticScale(_CoreChromaticScale):
 
         super().__init__(anchor, temperament)
 
+    @staticmethod
+    def _anchor_arguments(anchor=('a4', 440), temperament=temperament['12TET']):
+        # pylint: disable=arguments-renamed,redefined-outer-name
+        # mirrors the arguments of __init__
+        return (anchor, temperament)
+
     def get_octaves(self):
         """ returns a full octave from An to An+1 (including). i.e., the list
         is len(temperament)+1 """
-        octaves = dict()
-        for o in range(self._number_octaves):
-            octaves[o] = self._calc_octave(o)
-        return octaves
+        try:
+            octaves = _octaves[self.key]
+        except KeyError:
+            octaves = _octaves.setdefault(self.key, {o: tuple(self._calc_octave(o))
+                                                     for o in range(self._number_octaves)})
+        return {o: list(n) for o, n in octaves.items()}
 
     def _calc_octave(self, octave_number):
         """ Calculates the octave number n from Cn to Cn+1 and returns it as a
         list of Note objects"""
-        ret = list()
-        for i in range(len(self._temperament)+1):
-            anchor = (self.spn_from_distance(
-                self._anchor_distance), self._anchor)
-            ret.append(notes.Note(i+self.temperament.length*octave_number,
-                                  chromaticscale=_CoreChromaticScale(anchor,
-                                                                     temperament=self.temperament)))
-        return ret
+        core = _CoreChromaticScale(self.anchor, self.temperament)
+        start = self.temperament.length*octave_number
+        return [notes.Note(start+i, chromaticscale=core)
+                for i in range(len(self._temperament)+1)]
 
     def __iter__(self):
         """ overwrites __iter__ to enable Note object """
         s = []
-        for l in self.get_octaves():
+        for l in self.get_octaves().values():
             s.extend(l)
         return s.__iter__()
 
@@ -71,7 +79,7 @@ class Scale(ChromaticScale):
         # test if root is valid (i.e Pitchclass or Pitchclass name) ->
         # name_to_distance raises exception if invalid
         if type(root) is not notes.PitchClass:
-            self._root  = notes.PitchClass(str(root), super())
+            self._root  = notes.PitchClass(str(root), self)
         else:
             self._root = root
 
@@ -83,6 +91,8 @@ class Scale(ChromaticScale):
             self._scalename = scale
 
         self._indices = self._calc_filter()
+        self._pcset = notes.PitchClassSet(self._indices, self)
+        self._octaves = {}
 
     def get_scale(self) -> list:
         """ Returns the notes of the scale as an list containing the pitchclass
@@ -120,15 +130,38 @@ class Scale(ChromaticScale):
             i = (i + step) % self.temperament.length
         return indices
 
+    def get_octave(self, octave: int) -> tuple:
+        """ Returns the notes of the scale in octave 'octave' of the used
+        chromatic scale. Each octave is calculated once on first access.
+        """
+        try:
+            return self._octaves[octave]
+        except KeyError:
+            pass
+        if not 0 <= octave < self._number_octaves:
+            raise KeyError(f"Octave {octave} not in chromatic scale")
+        start = self.temperament.length * octave
+        core = _CoreChromaticScale(self.anchor, self.temperament)
+        self._octaves[octave] = tuple(notes.Note(start + k, core)
+                                      for k in sorted(self._indices))
+        return self._octaves[octave]
+
     def get_octaves(self):
         """ Returns the frequencies of the scale in all octaves in the used chromatic scale
         """
-        octaves = dict()
-        for octave in super().get_octaves():
-            octaves[octave] = []
-            for k in sorted(self._indices):
-                octaves[octave].append(super().get_octaves()[octave][k])
-        return octaves
+        return {o: list(self.get_octave(o)) for o in range(self._number_octaves)}
+
+    @property
+    def pitchclassset(self):
+        """ Pitchclasses of the scale as PitchClassSet
+        """
+        return self._pcset
+
+    @property
+    def scalename(self):
+        """ Name of the scale as defined in trallala.config_scales
+        """
+        return self._scalename
 
     def __getitem__(self,key):
         return self.get_scale()[key]
@@ -148,7 +181,7 @@ class Scale(ChromaticScale):
 
     @__contains__.register
     def _1(self, a: notes.PitchClass):
-        return a.numeric in self._indices
+        return a.numeric in self._pcset
 
     @__contains__.register
     def _2(self, a:intervals.Interval):
@@ -156,13 +189,94 @@ class Scale(ChromaticScale):
 
     @__contains__.register
     def _3(self, a: notes.Note):
-        structured_scale = self.get_octaves()
-        octave = int(self.spn_to_distance(a.name) \
-                        / self.temperament.length)
-
-        return str(a) in  structured_scale[octave]
+        length = self.temperament.length
+        return a.distance in self._pcset \
+            and 0 <= a.distance < length * self._number_octaves
 
     # !!! __contains__ for Chord added by .chords !!!!
 
+
+# tuple(list of (mask, scale name, root) of all scales for all roots,
+# dict mask -> positions of the scales containing mask) per temperament length
+_scale_index = {}
+# ranked results of find_containing per (temperament length, mask)
+_containing = {}
+
+
+def _get_scale_index(length):
+    """ Bitmasks of every scale in scales_steps for every root and the
+    positions of the scales containing a mask for every subset mask
+    """
+    try:
+        return _scale_index[length]
+    except KeyError:
+        pass
+    index = []
+    containing = {}
+    full = (1 << length) - 1
+    for name, steps in scales_steps[length].items():
+        base = 0
+        i = 0
+        for step in steps:
+            base |= 1 << i
+            i += step
+        for root in range(length):
+            mask = ((base << root) | (base >> (length - root))) & full
+            # all subsets of mask, from mask down to 0
+            subset = mask
+            while True:
+                containing.setdefault(subset, []).append(len(index))
+                if subset == 0:
+                    break
+                subset = (subset - 1) & mask
+            index.append((mask, name, root))
+    return _scale_index.setdefault(length, (index, containing))
+
+
+def find_containing(pitchclasses, chromaticscale=ChromaticScale()) -> list:
+    """ Finds all scales containing the given pitchclasses
+
+    Uses a precomputed index from every subset of the scale bitmasks of
+    trallala.config_scales (for all roots) to the scales containing it,
+    built for TET12 when the module is loaded. Results are cached per set
+    of pitchclasses.
+
+    Args:
+        pitchclasses:
+            PitchClassSet or iterable of Notes, PitchClasses, pitchclass
+            names or numerics
+        chromaticscale:
+            ChromaticScale used to for the definition. Default: TET12
+
+    Returns:
+        List of tuple(scale name, root name) ranked by fit: scales with
+        fewer notes not in pitchclasses first, then scales whose root is
+        in pitchclasses, then in the order of scales_steps and roots
+    """
+    if not isinstance(pitchclasses, notes.PitchClassSet):
+        pitchclasses = notes.PitchClassSet(pitchclasses, chromaticscale)
+    length = chromaticscale.temperament.length
+    mask = pitchclasses.mask
+    try:
+        return list(_containing[(length, mask)])
+    except KeyError:
+        pass
+
+    index, containing = _get_scale_index(length)
+    ranked = []
+    for position in containing.get(mask, ()):
+        scale_mask, name, root = index[position]
+        extra = bin(scale_mask & ~mask).count('1')
+        ranked.append(((extra, not mask >> root & 1, position),
+                       (name, chromaticscale.temperament.distance_to_name(root)[0])))
+    ranked.sort()
+    result = tuple(r for _, r in ranked)
+    _containing[(length, mask)] = result
+    return list(result)
+
+
+_get_scale_index(ChromaticScale().temperament.length)
+
+
 if __name__ == "__main__":
     pass
@@ -13,7 +13,10 @@
 
 import re
 
+from bisect import bisect_left
 from fractions import Fraction
+from math import log2
+from itertools import product
 
 
 # definition of temperaments
@@ -134,6 +137,56 @@ def _init_temperament():
 _init_temperament()
 
 
+# octaves reachable with the single digit octave of an SPN
+_SPN_OCTAVES = 10
+_spn_regex = re.compile(r"([abcdefg][b#]?)([0-9])", re.I)
+_spn_tables = {}
+# frequency tables per chromatic scale key
+_frequency_tables = {}
+
+
+def _get_spn_tables(temp):
+    """ Precomputed SPN parse and format tables of a temperament
+
+    The tables depend only on the temperament and are built once per
+    temperament class and shared by all chromatic scales using it.
+
+    Returns:
+        tuple(spn_to_distance, distance_to_spn, spn_split) with
+        spn_to_distance:
+            every valid SPN (all octaves, any case, sharps and flats and
+            the canonical names like 'a#4/bb4') to distance to C0
+        distance_to_spn:
+            distance to C0 to canonical SPN name (e.g. 'a#4/bb4')
+        spn_split:
+            every valid SPN to tuple(note name, octave) as returned by
+            _CoreChromaticScale.split_spn
+    """
+    try:
+        return _spn_tables[type(temp)]
+    except KeyError:
+        pass
+
+    to_distance = {}
+    from_distance = {}
+    split = {}
+    for octave in range(_SPN_OCTAVES):
+        for pc in range(temp.length):
+            distance = octave * temp.length + pc
+            names = temp.distance_to_name(pc)
+            for name in names:
+                for variant in product(*((c.lower(), c.upper()) for c in name)):
+                    spn = "".join((*variant, str(octave)))
+                    to_distance[spn] = distance
+                    split[spn] = (name, str(octave))
+            canonical = "/".join(''.join((x, str(octave))) for x in names)
+            from_distance[distance] = canonical
+            to_distance[canonical] = distance
+            split[canonical] = (names[0], str(octave))
+
+    return _spn_tables.setdefault(type(temp), (to_distance, from_distance, split))
+
+
 class _CoreChromaticScale:
     """ 'Raw' ChromaticScales used by Notes and PitchClasses
 
@@ -145,24 +198,93 @@ class _CoreChromaticScale:
     !DO NOT USE THIS CLASS OUTSIDE OF TRALLALA!
 
     """
+    # pylint: disable=too-many-instance-attributes
     _number_octaves = 9
 
+    # Instances of classes setting _shared are shared per (anchor, temperament)
+    _shared = True
+    _registry = {}
+
+    def __new__(cls, *args, **kwargs):
+        if not cls.__dict__.get('_shared', False):
+            return super().__new__(cls)
+        try:
+            return cls._registry[cls._registry_key(*cls._anchor_arguments(*args, **kwargs))]
+        except KeyError:
+            return super().__new__(cls)
+
+    @staticmethod
+    def _anchor_arguments(note=('a4', 440), temperament=temperament['12TET']):
+        # pylint: disable=redefined-outer-name
+        """ (anchor, temperament) of the arguments of __init__ """
+        return (note, temperament)
+
     def __init__(self, note=('a4', 440), temperament=temperament['12TET']):
+        # pylint: disable=redefined-outer-name
         """ Warning: Internal Class only. Please use ChromaticScale instead.
 
         Creates Chromatic Scale from given note (Scientific Pitch Notation)
         and a temperament distance list. For non-12 steps scales, a list of
         tone with the correpsonding half-tone distance must be be provided
-        in addition. Default: A4=440Hz and 12TET"""
+        in addition. Default: A4=440Hz and 12TET
 
-        if not isinstance(note, (list, tuple)):
-            raise ValueError(f"Wrong anchor note type: {type(note)}")
+        ChromaticScales are shared: all ChromaticScales with the same anchor
+        and temperament are the same object and can not be modified."""
+
+        if self.__dict__.get('_initialised', False):
+            # shared instance returned by __new__
+            return
+
+        shared = type(self).__dict__.get('_shared', False)
+        if not shared:
+            # copy the validated definition of the shared chromatic scale
+            core = _CoreChromaticScale(note, temperament)
+            self.__dict__.update(core.__dict__)
+            return
+
+        self._registry_key(note, temperament)
         if temperament.get_note_frequency(note[1], temperament.length) != note[1]*2:
             raise ValueError('len(temperament) != one octave')
 
         self._temperament = temperament
+        (self._spn_to_distance,
+         self._distance_to_spn,
+         self._spn_split) = _get_spn_tables(temperament)
         self._anchor = note[1]
         self._anchor_distance = self.spn_to_distance(note[0])
+        self._key = (self._anchor_distance, self._anchor, type(self._temperament))
+        self._initialised = True
+        self._registry.setdefault(self._registry_key(note, temperament), self)
+
+    def __setattr__(self, name, value):
+        if type(self).__dict__.get('_shared', False) \
+                and self.__dict__.get('_initialised', False):
+            raise AttributeError("Shared ChromaticScales are immutable")
+        super().__setattr__(name, value)
+
+    @classmethod
+    def _registry_key(cls, note, temp):
+        if not isinstance(note, (list, tuple)):
+            raise ValueError(f"Wrong anchor note type: {type(note)}")
+        return (cls, str(note[0]).lower(), note[1], type(temp))
+
+    def __reduce_ex__(self, protocol):
+        if type(self).__dict__.get('_shared', False):
+            return (type(self), (self.anchor, self._temperament))
+        return super().__reduce_ex__(protocol)
+
+    def __getstate__(self):
+        # the SPN tables are shared per temperament and rebuilt on unpickling
+        state = dict(self.__dict__)
+        for k in ('_spn_to_distance', '_distance_to_spn', '_spn_split'):
+            state.pop(k, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        (self._spn_to_distance,
+         self._distance_to_spn,
+         self._spn_split) = _get_spn_tables(self._temperament)
 
     def get_octaves(self):
         """ returns a full octave from An to An+1 (including). i.e., the list
@@ -174,13 +296,53 @@ class _CoreChromaticScale:
 
     def _calc_octave(self, octave_number):
         """ Calculates the octave number n from Cn to Cn+1 """
-        ret = []
-        for i in range(len(self._temperament)+1):
-            ret.append(
-                self._temperament.get_note_frequency(self._anchor,
-                                                     self.temperament.length*octave_number \
-                                                        -self._anchor_distance + i))
-        return ret
+        start = self.temperament.length*octave_number
+        return list(self.frequencies[start:start+len(self._temperament)+1])
+
+    @property
+    def frequencies(self):
+        """ Sorted frequency table of all notes in all octaves, indexed by the
+        semitone distance to C0. Calculated once per chromatic scale.
+        """
+        try:
+            return _frequency_tables[self._key]
+        except KeyError:
+            pass
+        table = tuple(self.frequencyof(d)
+                      for d in range(self.temperament.length*self._number_octaves+1))
+        return _frequency_tables.setdefault(self._key, table)
+
+    def distance_of_frequency(self, frequency, tolerance=0, nearest=False):
+        """ Semitone distance to C0 of the note with the given frequency
+
+        Resolved by binary search over the frequency table.
+
+        Args:
+            frequency:
+                Frequency in Hz
+            tolerance:
+                Accepted deviation from the frequency of the note in cents.
+                Default: 0 (exact match)
+            nearest:
+                Return the nearest note regardless of the tolerance
+        Returns:
+            Semitone distance to C0 as int
+        Raises:
+            ValueError:
+                Frequency does not match any note within the tolerance
+        """
+        table = self.frequencies
+        i = bisect_left(table, frequency)
+        if i < len(table) and table[i] == frequency:
+            return i
+        if (tolerance or nearest) and frequency > 0:
+            candidates = [x for x in (i-1, i) if 0 <= x < len(table)]
+            distance = min(candidates,
+                           key=lambda x: abs(log2(frequency/table[x])))
+            if nearest or abs(1200*log2(frequency/table[distance])) <= tolerance:
+                return distance
+        raise ValueError("Frequency does not match any note in used"
+                         + " chromatic scale")
 
     @property
     def temperament(self):
@@ -188,6 +350,19 @@ class _CoreChromaticScale:
         """
         return self._temperament
 
+    @property
+    def number_octaves(self):
+        """ Amount of octaves covered by this ChromaticScale
+        """
+        return self._number_octaves
+
+    @property
+    def key(self):
+        """ Hashable identity of this ChromaticScale as
+        (anchor distance to C0, anchor frequency, temperament class)
+        """
+        return self._key
+
     @property
     def anchor(self):
         """ Used Anchor not as (SPN, Frequency)
@@ -204,9 +379,26 @@ class _CoreChromaticScale:
         Returns:
             Semitone distance to C0 as int
         """
+        try:
+            return self._spn_to_distance[note]
+        except KeyError:
+            pass
         (note_name, octave) = self.split_spn(note)
         return int(octave) * self.temperament.length + self.temperament.name_to_distance(note_name)
 
+    def spn_to_distance_many(self, notes) -> list:
+        """ Calculates the semitone distances to C0 of many SPNs
+
+        Arg:
+            notes:
+                Iterable of notes as SPN strings
+
+        Returns:
+            List of semitone distances to C0 as int
+        """
+        table = self._spn_to_distance
+        return [table[x] if x in table else self.spn_to_distance(x) for x in notes]
+
     def spn_from_distance(self, distance: int):
         """ Semitone Distance to C= to SPN
 
@@ -217,11 +409,28 @@ class _CoreChromaticScale:
         Returns:
             SPN name as str
         """
+        try:
+            return self._distance_to_spn[distance]
+        except KeyError:
+            pass
         l = len(self._temperament)
         note = self._temperament.distance_to_name(distance % l)
         octave = int((distance-distance % l) / l)
         return "/".join( [''.join((x,str(octave) )) for x in note]  )
 
+    def spn_from_distance_many(self, distances) -> list:
+        """ SPN names of many semitone distances to C0
+
+        Args:
+                distances:
+                    Iterable of semitone distances to C0
+
+        Returns:
+            List of SPN names as str
+        """
+        table = self._distance_to_spn
+        return [table[x] if x in table else self.spn_from_distance(x) for x in distances]
+
     def split_spn(self, spn: str):
         """ Splits an SPN into note name and octave
 
@@ -236,7 +445,11 @@ class _CoreChromaticScale:
             ValueError in case of invalid SPN
 
         """
-        match = re.match(r"([abcdefg][b#]?)([0-9])", spn.lower(), re.I)
+        try:
+            return self._spn_split[spn]
+        except KeyError:
+            pass
+        match = _spn_regex.match(spn.lower())
         if match:
             return match.groups()
         raise ValueError(f'Bad note name {spn}. Note name in SPN required')
@@ -253,7 +466,7 @@ class _CoreChromaticScale:
 
     def __iter__(self):
         s = []
-        for l in self.get_octaves():
+        for l in self.get_octaves().values():
             s.extend(l)
         return s.__iter__()
 
@@ -3,5 +3,14 @@ Adapting notes, chords, ... to the instruments.
 """
 
 from . import guitar
+from . import bass
+from . import ukulele
+from . import mandolin
+from . import banjo
+from . import voicings
+from . import positions
+from . import fingering
+from . import voicingdb
 
-__all__ = ["guitar"]
+__all__ = ["guitar", "bass", "ukulele", "mandolin", "banjo", "voicings",
+           "positions", "fingering", "voicingdb"]
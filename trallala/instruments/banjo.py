@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+"""
+Five string and tenor banjos.
+
+The short 5th string of the five string banjo is the first string of the
+fretboard. It starts at the 5th fret: its open note sounds at fret 0 and
+its fretted notes are numbered by the frets of the neck (6 and above).
+The fretboard engine (FretBoard) is shared with all fretted instruments,
+see guitar.FretBoard for the supported diagrams.
+
+Typical usage examples:
+    banjo = Banjo()                         # g4 d3 g3 b3 d4 (open g)
+    tenor = Banjo(strings=4)                # c3 g3 d4 a4
+    print(banjo.fretboard.svg_str(trallala.core.chords.Chord('major', 'g')))
+
+"""
+
+from .guitar import _FrettedInstrument
+
+
+tunings = {
+        5 : {
+            'standard'  : ( 0, -17, 5, 4, 3),
+            'double_c'  : ( 0, -19, 7, 5, 2)
+            },
+        4 : {
+            'standard'  : ( 0, 7, 7, 7),
+            'irish'     : ( 0, 7, 7, 7)
+            }
+        }
+
+# open note of the first string, used if no root_of_tuning is given
+tuning_roots = {
+        5 : { 'standard' : 'g4', 'double_c' : 'g4' },
+        4 : { 'standard' : 'c3', 'irish' : 'g2' }
+        }
+
+# the 5th string starts at the 5th fret
+first_frets = {
+        5 : ( 5, 0, 0, 0, 0)
+        }
+
+
+class Banjo(_FrettedInstrument):
+    """Banjo class, customizable with parameters
+
+    Attributes:
+        fretboard: FretBoard object for SVG output
+
+    Args:
+        root_of_tuning:
+            The open note of the first string in SPN
+            (default: root of the named tuning, e.g. 'g4')
+        tuning:
+            str_name of tuning (standard or double_c for 5 strings,
+            standard or irish for 4 strings) or list of semitone
+            distances between strings or tuning as notes.Note for open
+            strings. (default: 'standard')
+        strings:
+            amount of strings, 5 or 4 (tenor banjo) (default: 5)
+        frets:
+            amount of frets on the fretboard. (default: 22)
+    Raises:
+        ValueError: An unsupported tuning was provided
+    """
+    tunings = tunings
+    tuning_roots = tuning_roots
+    first_frets = first_frets
+    default_strings = 5
+    default_frets = 22
+
+
+if __name__ == "__main__":
+    pass
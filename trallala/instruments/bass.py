@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+"""
+Bass guitars with 4, 5 or 6 strings.
+
+The fretboard engine (FretBoard) is shared with all fretted instruments,
+see guitar.FretBoard for the supported diagrams.
+
+Typical usage examples:
+    bass = Bass()                       # e1 a1 d2 g2
+    bass = Bass(strings=5)              # b0 e1 a1 d2 g2
+    print(bass.fretboard.svg_str(trallala.core.notes.Note('c2')))
+
+"""
+
+from .guitar import _FrettedInstrument
+
+
+tunings = {
+        4 : {
+            'standard'  : ( 0, 5, 5, 5),
+            'drop'      : ( 0, 7, 5, 5)
+            },
+        5 : {
+            'standard'  : ( 0, 5, 5, 5, 5)
+            },
+        6 : {
+            'standard'  : ( 0, 5, 5, 5, 5, 5)
+            }
+        }
+
+# lowest note of the tunings, used if no root_of_tuning is given
+tuning_roots = {
+        4 : { 'standard' : 'e1', 'drop' : 'd1' },
+        5 : { 'standard' : 'b0' },
+        6 : { 'standard' : 'b0' }
+        }
+
+
+class Bass(_FrettedInstrument):
+    """Bass guitar class, customizable with parameters
+
+    Attributes:
+        fretboard: FretBoard object for SVG output
+
+    Args:
+        root_of_tuning:
+            The lowest note of the used tuning in SPN
+            (default: root of the named tuning, e.g. 'e1')
+        tuning:
+            str_name of tuning (e.g., standard or drop) or list of
+            semitone distances between strings or tuning as notes.Note for
+            open strings. (default: 'standard')
+        strings:
+            amount of strings (default: 4)
+        frets:
+            amount of frets on the fretboard. (default: 20)
+    Raises:
+        ValueError: An unsupported tuning was provided
+    """
+    tunings = tunings
+    tuning_roots = tuning_roots
+    default_strings = 4
+    default_frets = 20
+
+
+if __name__ == "__main__":
+    pass
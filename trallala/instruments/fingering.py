@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+"""Fingering of melodies on fretted instruments
+
+A melody (sequence of notes.Note) is mapped to one (string, fret) per note
+by the Viterbi algorithm over the candidate positions of every note
+(FretBoard.get_indices). The path with the minimal total cost is chosen:
+
+    position cost:   fretted notes cost 'open' (preference of open
+                     strings) plus 'height' per fret
+    transition cost: 'move' per fret of hand movement between fretted
+                     notes, 'stretch' per fret beyond the span of the hand
+                     and 'string' per string crossed
+
+Open strings do not move the hand: the hand stays at the last fretted
+position and the movement to the next fretted note is charged against
+it. The state of the Viterbi algorithm is therefore the position of the
+note and the fret of the hand. The run time is linear in the length of
+the melody: every step compares the states of two consecutive notes
+only, transition costs of repeated note pairs are reused.
+
+Typical usage examples:
+    melody = [Note(x) for x in ('e3', 'g3', 'a3', 'b3', 'e4')]
+    path = fingering(melody, Guitar())
+    print(tab(path, Guitar()))
+"""
+
+import numpy as np
+
+
+default_weights = {'move': 1.0, 'stretch': 2.0, 'string': 0.5, 'open': 0.5,
+                   'height': 0.05}
+
+
+def _candidates(fretboard, note, weights, cache):
+    """ Positions of note and their position costs """
+    try:
+        return cache[note.distance]
+    except KeyError:
+        pass
+    positions = fretboard.get_indices(note)
+    if not positions:
+        raise ValueError(f"{note} is not on the fretboard")
+    array = np.array(positions, dtype=np.int64)
+    frets = array[:, 1]
+    cost = np.where(frets > 0, weights['open'], 0.0) + weights['height'] * frets
+    return cache.setdefault(note.distance, (positions, array[:, 0], frets, cost))
+
+
+def _transition(a, b, frets, span, weights):
+    """ Transition costs between the positions of a and b
+
+    Returns:
+        tuple(matrix positions of a x positions of b of the string
+        crossings and the position costs of b, matrix hand fret (0: no
+        fretted note yet) x positions of b of the hand movement)
+    """
+    strings = weights['string'] * np.abs(b[1][None, :] - a[1][:, None]) + b[3]
+    hand = np.arange(frets)[:, None]
+    shift = np.abs(b[2][None, :] - hand)
+    fretted = (hand > 0) & (b[2][None, :] > 0)
+    move = np.where(fretted, weights['move'] * shift
+                    + weights['stretch'] * np.maximum(shift - span, 0), 0.0)
+    return strings, move
+
+
+def fingering(melody, instrument, span=3, weights=None) -> list:
+    """ Minimal cost fingering of melody on instrument
+
+    Args:
+        melody:
+            sequence of notes.Note
+        instrument:
+            fretted instrument (e.g. guitar.Guitar)
+        span:
+            frets reachable without stretching
+        weights:
+            dict of cost weights overriding default_weights ('move',
+            'stretch', 'string', 'open', 'height')
+    Returns:
+        list of (string, fret), one per note of melody
+    Raises:
+        ValueError: a note of melody is not on the fretboard
+    """
+    # pylint: disable=too-many-locals
+    fretboard = instrument.fretboard
+    frets = fretboard.distances.shape[1]
+    weights = dict(default_weights, **(weights or {}))
+    candidates = {}
+    transitions = {}
+    melody = list(melody)
+    steps = [_candidates(fretboard, n, weights, candidates) for n in melody]
+    if not steps:
+        return []
+
+    # cost[position, hand]: open strings keep the hand of the previous note
+    cost = np.full((len(steps[0][0]), frets), np.inf)
+    cost[np.arange(len(steps[0][0])), steps[0][2]] = steps[0][3]
+    back = []
+    for k in range(1, len(steps)):
+        a, b = steps[k-1], steps[k]
+        key = (melody[k-1].distance, melody[k].distance)
+        try:
+            strings, move = transitions[key]
+        except KeyError:
+            strings, move = transitions.setdefault(
+                key, _transition(a, b, frets, span, weights))
+        total = cost[:, None, :] + strings[:, :, None]
+        previous = total.argmin(axis=0)
+        total = np.take_along_axis(total, previous[None], axis=0)[0] + move.T
+        # fretted notes move the hand to their fret
+        hands = np.tile(np.arange(frets), (len(b[0]), 1))
+        cost = total.copy()
+        rows = np.nonzero(b[2] > 0)[0]
+        if len(rows):
+            best = total[rows].argmin(axis=1)
+            cost[rows] = np.inf
+            cost[rows, b[2][rows]] = total[rows, best]
+            hands[rows, b[2][rows]] = best
+        back.append((previous, hands))
+
+    i, h = divmod(int(cost.argmin()), frets)
+    path = [steps[-1][0][i]]
+    for step, (previous, hands) in zip(reversed(steps[:-1]), reversed(back)):
+        h = hands[i, h]
+        i = previous[i, h]
+        path.append(step[0][i])
+    path.reverse()
+    return path
+
+
+def tab(path, instrument) -> str:
+    """ Tablature of a fingering
+
+    Args:
+        path:
+            list of (string, fret) as returned by fingering
+        instrument:
+            fretted instrument the path was computed for
+    Returns:
+        one line per string, highest string first, prefixed by the name
+        of the open note
+    """
+    tuning = [n.name.split('/')[0] for n in instrument.tuning]
+    width = max(len(x) for x in tuning)
+    lines = [[x.ljust(width), '|-'] for x in tuning]
+    for string, fret in path:
+        column = str(fret)
+        for i, line in enumerate(lines):
+            line.append((column if i == string else '').ljust(len(column), '-'))
+            line.append('-')
+    return "\n".join("".join(line) for line in reversed(lines))
+
+
+if __name__ == "__main__":
+    pass
@@ -11,57 +11,113 @@ Typical usage examples:
 
 """
 
-import svg
-
 from functools import singledispatchmethod
 from textwrap import dedent
+from types import MappingProxyType
+
+import svg
+import numpy as np
+
 from ..core import notes
 from ..core import scales
 from ..core import chords
 from ..core import intervals
+from ..render import svgtemplate
+from ..render import jsonformat
 from .coreinstruments import _StringedInstrument
+from . import positions as _positions
 
 
 tunings = {
         6 : {
             'standard'  : ( 0, 5, 5, 5, 4, 5),
             'drop'      : ( 0, 3, 5, 5, 4, 5)
+            },
+        7 : {
+            'standard'  : ( 0, 5, 5, 5, 5, 4, 5),
+            'drop'      : ( 0, 7, 5, 5, 5, 4, 5)
+            },
+        8 : {
+            'standard'  : ( 0, 5, 5, 5, 5, 5, 4, 5),
+            'drop'      : ( 0, 7, 5, 5, 5, 5, 4, 5)
             }
         }
 
-class Guitar(_StringedInstrument):
-    """Guitar class, customizable with parameters
+# lowest note of the tunings, used if no root_of_tuning is given
+tuning_roots = {
+        6 : { 'standard' : 'e2', 'drop' : 'e2' },
+        7 : { 'standard' : 'b1', 'drop' : 'a1' },
+        8 : { 'standard' : 'f#1', 'drop' : 'e1' }
+        }
 
-    Attributes:
-        fretboard: FretBoard object for SVG output
+# FretBoards shared by all fretted instruments per
+# (strings, open note distances, chromatic scale, frets, first frets)
+_fretboards = {}
+# pre-serialized svg fretboards per geometry and output mode
+# (width, height, strings, frets, first frets, compact, precision)
+_svg_templates = {}
+
+
+class _FrettedInstrument(_StringedInstrument):
+    """Base of the fretted instruments sharing the FretBoard engine
 
+    Subclasses define the class attributes:
+        tunings: dict strings -> tuning name -> semitone distances between
+            the strings, relative to the first string
+        tuning_roots: dict strings -> tuning name -> open note of the first
+            string
+        first_frets: dict strings -> tuple(first fret per string) for
+            instruments with short strings (e.g. the 5th string of a banjo)
+
+        default_tuning, default_strings, default_frets: defaults of the
+            constructor arguments
+
+    FretBoards are built once per process and tuning and are shared by all
+    instruments (of any class) with the same strings, tuning, chromatic
+    scale and frets.
     """
-    def __init__(self,
-                 root_of_tuning: notes.Note=notes.Note('e2'),
-                 tuning: str='standard', strings: int=6, frets: int=24):
-        """ Initializes a Guitar object based on tuning and fretboard
+    tunings = {}
+    tuning_roots = {}
+    first_frets = {}
+    default_tuning = 'standard'
+    default_strings = 6
+    default_frets = 24
+
+    def __init__(self, root_of_tuning: notes.Note=None, tuning: str=None,
+                 strings: int=None, frets: int=None):
+        """ Initializes the instrument based on tuning and fretboard
 
         Args:
             root_of_tuning:
-                The lowest note of the used tuning in SPN (default: 'e2')
+                The open note of the first string in SPN. None for the root
+                of the named tuning (or of the standard tuning) in
+                tuning_roots.
             tuning:
-                str_name of tuning (e.g., standard or drop) or list of
-                semitone distances between strings or tuning as notes.Note for
-                open strings. (default: 'standard')
+                str_name of tuning (see tunings) or list of semitone
+                distances between strings or tuning as notes.Note for open
+                strings. (default: default_tuning)
             strings:
-                amount of strings (default: 6)
+                amount of strings (default: default_strings)
             frets:
-                amount of frets on the fretboard. (default: 24)
+                amount of frets on the fretboard (default: default_frets)
         Raises:
             ValueError: An unsupported tuning was provided
         """
+        tuning = self.default_tuning if tuning is None else tuning
+        strings = self.default_strings if strings is None else strings
+        frets = self.default_frets if frets is None else frets
+        if root_of_tuning is None:
+            roots = self.tuning_roots.get(strings, {})
+            root_of_tuning = roots.get(tuning if isinstance(tuning, str)
+                                       else 'standard', roots.get('standard'))
         t = self._dispatched_init(tuning, root_of_tuning, strings)
         if len(t) != strings:
             raise ValueError('Tuning does not match the amount of strings')
 
         self._frets = frets
+        self._first_frets = tuple(self.first_frets.get(strings, (0,)*strings))
         # fretboard have a distance of semitones = frets + open
-        super().__init__(strings, t, [frets+1]*strings)
+        super().__init__(strings, t, [frets+1-x for x in self._first_frets])
 
     @singledispatchmethod
     def _dispatched_init(self, tuning, *args, **kwargs):
@@ -71,6 +127,9 @@ class Guitar(_StringedInstrument):
     @_dispatched_init.register(list)
     def _1(self, tuning, root: notes.Note, *args, **kwargs):
         if min(isinstance(x, int) for x in tuning):
+            if root is None:
+                raise ValueError("root_of_tuning is required for semitone "
+                                 + "distances")
             t= []
             for s in tuning:
                 if len(t) > 0:
@@ -89,13 +148,70 @@ class Guitar(_StringedInstrument):
 
     @_dispatched_init.register
     def _2(self, tuning: str, root, strings):
-        return self._dispatched_init(tunings[strings][tuning], root)
+        named = self.tunings.get(strings, {})
+        if tuning not in named:
+            raise ValueError(f'Unknown tuning "{tuning}" for {strings} strings.'
+                             f' Valid tunings: {", ".join(named) or "none"}')
+        return self._dispatched_init(named[tuning], root)
 
     @property
     def fretboard(self):
-        """ Fretboard object of the guitar
+        """ Fretboard object of the instrument
+
+        FretBoards are immutable and shared by all instruments with the same
+        strings, tuning, chromatic scale and frets.
         """
-        return FretBoard(self._strings,self._tuning,self._frets)
+        key = (self._strings, tuple(n.distance for n in self._tuning),
+               self._tuning[0].chromaticscale.key, self._frets, self._first_frets)
+        try:
+            return _fretboards[key]
+        except KeyError:
+            pass
+        return _fretboards.setdefault(key, FretBoard(self._strings, self._tuning,
+                                                     self._frets, self._first_frets))
+
+
+class Guitar(_FrettedInstrument):
+    """Guitar class, customizable with parameters
+
+    Attributes:
+        fretboard: FretBoard object for SVG output
+
+    Args:
+        root_of_tuning:
+            The lowest note of the used tuning in SPN
+            (default: root of the named tuning, e.g. 'e2')
+        tuning:
+            str_name of tuning (e.g., standard or drop) or list of
+            semitone distances between strings or tuning as notes.Note for
+            open strings. (default: 'standard')
+        strings:
+            amount of strings (default: 6)
+        frets:
+            amount of frets on the fretboard. (default: 24)
+    Raises:
+        ValueError: An unsupported tuning was provided
+    """
+    tunings = tunings
+    tuning_roots = tuning_roots
+
+
+class SevenStringGuitar(Guitar):
+    """Seven string guitar (standard tuning b1 e2 a2 d3 g3 b3 e4)
+    """
+    def __init__(self, root_of_tuning: notes.Note=None,
+                 tuning: str='standard', frets: int=24):
+        """ Initializes a seven string guitar (see Guitar) """
+        super().__init__(root_of_tuning, tuning, 7, frets)
+
+
+class EightStringGuitar(Guitar):
+    """Eight string guitar (standard tuning f#1 b1 e2 a2 d3 g3 b3 e4)
+    """
+    def __init__(self, root_of_tuning: notes.Note=None,
+                 tuning: str='standard', frets: int=24):
+        """ Initializes an eight string guitar (see Guitar) """
+        super().__init__(root_of_tuning, tuning, 8, frets)
 
 
 class FretBoard():
@@ -103,8 +219,17 @@ class FretBoard():
 
     FretBoard provides a parameterizable fretboard supporting SVG output for:
         Scales, Chords, Notes, PitchClasses and Lists of Notes/PitchClasses
+
+    FretBoards are immutable.
     """
-    def __init__(self,strings: int, opennotes: tuple, frets: int):
+    # pylint: disable=too-many-instance-attributes
+    # Required to store SVG and fretboard parameters.
+
+    # height of the captions of svg_sheet
+    _sheet_caption = 20
+
+    def __init__(self,strings: int, opennotes: tuple, frets: int,
+                 first_frets: tuple=None):
         """ Initializes the fretboard and define the SVG dimensions
 
         Args:
@@ -115,29 +240,62 @@ class FretBoard():
                 len(opennotes) must be equal to strings
             frets:
                 Amount of frets
+            first_frets:
+                First fret per string for short strings starting on the
+                neck (e.g. 5 for the 5th string of a banjo). The open note
+                sounds at fret 0, the frets up to first fret do not exist on
+                the string. (default: 0 for all strings)
         Property:
             all_notes:
-                Multidimensional list with all notes on the fretboard:
-                    list[string][fret]
+                Multidimensional tuple with all notes on the fretboard:
+                    tuple[string][fret], None for frets missing on short
+                    strings
         Raises:
             ValueError: len(opennotes) != strings
         """
 
-        # pylint: disable=too-many-instance-attributes
-        # Required to store SVG and fretboard parameters.
-
-
         if len(opennotes) != strings:
             raise ValueError("Tuning does not fit amount of strings")
         self._strings = strings
         self._frets = frets
 
-        self._notes = []
-        for x in range(strings):
-            string = []
-            for y in range(frets+1):
-                string.append(opennotes[x]+y)
-            self._notes.append(string)
+        if first_frets is None:
+            first_frets = (0,) * strings
+        self._first_frets = tuple(first_frets)
+
+        # strings x frets matrices of distances to C0, pitchclasses and
+        # frequencies. Missing positions of short strings are -1 (distances,
+        # pitchclasses) and nan (frequencies).
+        fret = np.arange(frets+1)
+        first = np.array(self._first_frets, dtype=np.int64)[:, None]
+        self._playable = (fret == 0) | (fret > first)
+        distances = np.array([n.distance for n in opennotes],
+                             dtype=np.int64)[:, None] + np.where(fret > first,
+                                                                 fret - first, 0)
+        chromaticscale = opennotes[0].chromaticscale
+        array = notes.NoteArray(distances.ravel(), chromaticscale)
+        self._distances = np.where(self._playable, distances, -1)
+        self._pitchclasses = np.where(self._playable,
+                                      array.pitchclasses.reshape(distances.shape),
+                                      -1)
+        self._frequencies = np.where(self._playable,
+                                     array.frequencies.reshape(distances.shape),
+                                     np.nan)
+        self._length = chromaticscale.temperament.length
+        # position index: distance to C0 -> ((string, fret), ...)
+        positions = {}
+        for string, fret in zip(*(x.tolist() for x in np.nonzero(self._playable))):
+            positions.setdefault(self._distances[string, fret].item(),
+                                 []).append((string, fret))
+        self._positions = {d: tuple(p) for d, p in positions.items()}
+        for m in (self._playable, self._distances, self._pitchclasses,
+                  self._frequencies):
+            m.flags.writeable = False
+
+        self._notes = tuple(tuple(opennotes[x] + (d - self._distances[x, 0])
+                                  if d >= 0 else None
+                                  for d in self._distances[x].tolist())
+                            for x in range(strings))
 
         # dimensions for svg fretboard
         # TODO: make fretboard customizable
@@ -146,12 +304,63 @@ class FretBoard():
         self._height = (self._strings-1) * 15 * 2 + 2 * self._innerspacing
         self._string_distance = (self._height-2*self._innerspacing)/(self._strings-1)
         self._fret_distance   = (self._width -2*self._innerspacing)/(self._frets)
-        self._svg_fretboard = self._draw_fretboard()
+        self._svg_fretboard = tuple(self._draw_fretboard())
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get('_frozen', False):
+            raise AttributeError("FretBoard objects are immutable")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError("FretBoard objects are immutable")
+
+    @singledispatchmethod
+    def mask(self, n):
+        """ Returns a boolean strings x frets matrix of the positions of n
+
+        Args:
+            n:
+                note, pitchclass, scale or chord. Chords without voicing
+                are located with the notes of chords.Chord.get_chord.
+        """
+        raise NotImplementedError(f"not implemented for {type(n)}")
+
+    @mask.register
+    def _m1(self, n: notes.Note):
+        mask = np.zeros(self._distances.shape, dtype=bool)
+        positions = self._positions.get(n.distance)
+        if positions:
+            mask[tuple(zip(*positions))] = True
+        return mask
+
+    @mask.register
+    def _m2(self, n: notes.PitchClass):
+        return self._pitchclasses == n.numeric
+
+    @mask.register
+    def _m3(self, n: chords.Chord):
+        # lookup table over the distances, the last entry (-1) stays False
+        table = np.zeros(self._distances.max() + 2, dtype=bool)
+        table[[x.distance for x in n if 0 <= x.distance < len(table) - 1]] = True
+        return table[self._distances]
+
+    @mask.register
+    def _m4(self, n: scales.Scale):
+        # lookup table over the pitchclasses, the last entry (-1) stays False
+        mask = n.pitchclassset.mask
+        table = np.array([mask >> pc & 1 for pc in range(self._length)] + [0],
+                         dtype=bool)
+        return table[self._pitchclasses]
 
     @singledispatchmethod
     def get_indices(self, n: notes.Note):
         """ Returns the (y,x) coordinates of n on the fretboard
 
+        Notes are looked up in the position index of the fretboard
+        (distance -> positions), pitchclasses, chords and scales are located
+        with their boolean masks (see mask).
+
         Args:
             n:
                 List of notes, pitchclasses or single notes, pitchclases,
@@ -161,28 +370,37 @@ class FretBoard():
 
     @get_indices.register
     def _1(self, n: notes.Note):
-        ret = [] * self._strings
-        for s, note_list in enumerate(self._notes):
-            for f, note in enumerate(note_list):
-                if n == note:
-                    ret.append( (s,f) )
-        return tuple(ret)
+        return self._positions.get(n.distance, ())
 
     @get_indices.register(notes.PitchClass)
     @get_indices.register(chords.Chord)
     def _2(self, c):
-        ret = []
-        for note in c:
-            ret.extend(self.get_indices(note))
-        return tuple(ret)
+        # grouped by note in the order of the notes of c
+        strings, frets = np.nonzero(self.mask(c))
+        distances = self._distances[strings, frets]
+        if isinstance(c, chords.Chord):
+            order = np.array([x.distance for x in c], dtype=np.int64)
+            sorter = np.argsort(order, kind='stable')
+            rank = sorter[np.searchsorted(order, distances, sorter=sorter)]
+        else:
+            rank = distances
+        order = np.lexsort((strings, rank))
+        return tuple(zip(strings[order].tolist(), frets[order].tolist()))
 
     @get_indices.register
     def _3(self, n: scales.Scale):
-        ret = []
-        for note in n:
-            if self._notes[0][0] <= note <= self._notes[-1][-1]:
-                ret.append(self.get_indices(note))
-        return tuple(ret)
+        # grouped by note, ordered by the pitchclasses of the scale and octave
+        strings, frets = np.nonzero(self.mask(n))
+        distances = self._distances[strings, frets]
+        scale = [pc.numeric for pc in n.get_scale()]
+        rank = np.zeros(self._length, dtype=np.int64)
+        rank[scale] = np.arange(len(scale))
+        order = np.lexsort((strings, distances,
+                            rank[self._pitchclasses[strings, frets]]))
+        positions = tuple(zip(strings[order].tolist(), frets[order].tolist()))
+        bounds = [0] + (np.flatnonzero(np.diff(distances[order])) + 1).tolist() \
+            + [len(positions)]
+        return tuple(positions[a:b] for a, b in zip(bounds, bounds[1:]) if b > a)
 
     def __str__(self):
         ret = []
@@ -216,7 +434,10 @@ class FretBoard():
         #strings
         for i in range(self._strings):
             y = innerspacing + string_distance * i
-            fretboard.append(svg.Line(x1=innerspacing-5,
+            # short strings start at their first fret
+            first = self._first_frets[self._strings-(i+1)]
+            fretboard.append(svg.Line(x1=innerspacing-5 + fret_distance*first
+                                      if first else innerspacing-5,
                                       x2=width-innerspacing+3, y1=y, y2=y,
                                       stroke='black',stroke_width=4))
 
@@ -235,59 +456,125 @@ class FretBoard():
 
         return fretboard
 
-    def _draw_notes(self, notes_list, left=False) -> list:
-        """Returns svg elements to be added to the fretboard representing the
-        notes in "notes". Notes can be a list of notes.Note or
-        notes.PitchClass.
+    def _note_positions(self, notes_list) -> list:
+        """Returns the positions of the notes in "notes_list" as list of
+        tuple(string, fret, color, name). Notes can be a list of notes.Note,
+        notes.PitchClass or intervals.Interval relative to the first entry.
+        Entries with a third element (string, fret) are drawn at this
+        position only.
+        """
+        positions = []
+        for n in notes_list:
+            if len(n) > 2:
+                i = (n[2],)
+            elif isinstance(n[0], intervals.Interval):
+                i = self.get_indices(notes_list[0][0] + n[0])
+            else:
+                i = self.get_indices(n[0])
+            name = n[0].name
+            for (string, fret) in i:
+                positions.append((string, fret, n[1], name))
+        return positions
+
+    def _note_markers(self, notes_list, left=False) -> list:
+        """Returns the geometry of the markers representing the notes in
+        "notes_list" as list of tuple(cx, cy, r, color, label) with label
+        tuple(x, y, css_class, text) or None. Notes can be a list of
+        notes.Note or notes.PitchClass.
         """
         innerspacing= self._innerspacing
         string_distance = self._string_distance
         fret_distance   = self._fret_distance
 
-        notes_svg = []
-        for n in notes_list:
-            if isinstance(n[0], intervals.Interval):
-                i = self.get_indices(notes_list[0][0] + n[0])
+        markers = []
+        for (y, x, color, name) in self._note_positions(notes_list):
+            if not left:
+                y = self._strings - (y+1)
+            cx = innerspacing+fret_distance*x
+            cy = innerspacing+string_distance*y
+            if len(name) == 1:
+                label = (cx-5, cy+4, 'notebig', name.upper())
+            elif len(name) == 2:
+                label = (cx-8, cy+4, 'notebig', name.upper())
+            elif len(name) == 6:
+                label = (cx-11, cy+3, 'notesmall', name.upper().replace("/", " "))
+            elif len(name) > 2:
+                label = (cx-7, cy+3, 'notebig', name.upper())
             else:
-                i = self.get_indices(n[0])
-            for (y,x) in i:
-                if not left:
-                    y = self._strings - (y+1)
-                notes_svg.append(svg.Circle(cx=innerspacing+fret_distance*x,
-                                            cy=innerspacing+string_distance*y,
-                                            r=(string_distance*0.9)/2,
-                                            stroke=n[1], stroke_width=1,
-                                            fill=n[1] ))
-                if len(n[0].name) == 1:
-                    notes_svg.append(svg.Text(  x=innerspacing+fret_distance*x-5,
-                                                y=innerspacing+string_distance*y+4,
-                                                class_=['notebig'],
-                                                text=n[0].name.upper(),
-                                                fill='white'))
-                elif len(n[0].name) == 2:
-                    notes_svg.append(svg.Text(  x=innerspacing+fret_distance*x-8,
-                                                y=innerspacing+string_distance*y+4,
-                                                class_=['notebig'],
-                                                text=n[0].name.upper(),
-                                                fill='white'))
-                elif len(n[0].name) == 6:
-                    notes_svg.append(svg.Text(  x=innerspacing+fret_distance*x-11,
-                                                y=innerspacing+string_distance*y+3,
-                                                class_=['notesmall'],
-                                                text=n[0].name.upper().replace("/"
-                                                                               ," "),
-                                                fill='white'))
-                elif len(n[0].name) > 2:
-                    notes_svg.append(svg.Text(  x=innerspacing+fret_distance*x-7,
-                                                y=innerspacing+string_distance*y+3,
-                                                class_=['notebig'],
-                                                text=n[0].name.upper(),
-                                                fill='white'))
+                label = None
+            markers.append((cx, cy, (string_distance*0.9)/2, color, label))
+        return markers
+
+    def _draw_notes(self, notes_list, left=False) -> list:
+        """Returns svg elements to be added to the fretboard representing the
+        notes in "notes". Notes can be a list of notes.Note or
+        notes.PitchClass.
+        """
+        notes_svg = []
+        for (cx, cy, r, color, label) in self._note_markers(notes_list, left):
+            notes_svg.append(svg.Circle(cx=cx, cy=cy, r=r,
+                                        stroke=color, stroke_width=1,
+                                        fill=color))
+            if label:
+                notes_svg.append(svg.Text(x=label[0], y=label[1],
+                                          class_=[label[2]],
+                                          text=label[3],
+                                          fill='white'))
         return notes_svg
 
     @singledispatchmethod
-    def svg(self, n, color: str='green', root_color: str='red',
-            notes_color: str='green', intervals: tuple=False) -> svg.SVG:
+    def _notes_list(self, n, *args, **kwargs):
+        """ List of tuple(note/pitchclass/interval, color) for a diagram of n
+        """
+        # pylint: disable=unused-argument
+        return n
+
+    @_notes_list.register(notes.Note)
+    @_notes_list.register(notes.PitchClass)
+    def _1(self, n, color='blue'):
+        return ((n,color),)
+
+    @_notes_list.register
+    def _2(self, n: chords.Chord, root_color="red", notes_color="green",
+           intervals=False):
+        # pylint: disable=redefined-outer-name
+        n_list = []
+        if n.voicing:
+            n_list.append( (n[0], root_color) )
+            for x in n[1:]:
+                if intervals:
+                    n_list.append( (x-n[0],notes_color) )
+                else:
+                    n_list.append( (x,notes_color) )
+        else:
+            n_list.append( (n.get_pitchclasses()[0], root_color) )
+            for x in n[1:]:
+                if intervals:
+                    n_list.append( (x-n[0],notes_color) )
+                else:
+                    n_list.append( (notes.PitchClass(x), notes_color) )
+        return n_list
+
+    @_notes_list.register
+    def _3(self, n: scales.Scale, root_color="red", notes_color="green"):
+        n_list = []
+        n_list.append( (n[0], root_color) )
+        for x in n[1:]:
+            n_list.append( (x, notes_color) )
+        return n_list
+
+    @_notes_list.register
+    def _3p(self, n: _positions.ScalePosition, root_color="red",
+            notes_color="green"):
+        root = n.scale[0]
+        n_list = []
+        for (string, fret) in n.positions:
+            pc = notes.PitchClass(self._pitchclasses[string, fret].item())
+            n_list.append( (pc, root_color if pc == root else notes_color,
+                            (string, fret)) )
+        return n_list
+
+    def svg(self, n, *args, **kwargs) -> svg.SVG:
         """ Creates a fretboard diagram containing n
 
         Creates an svg fretboard with
@@ -301,6 +588,9 @@ class FretBoard():
         d) a scale for n=scales.Scale, root_color=color1, notes_color=color2
                 (default: red, blue)
                 printed in 'root_color', intervalls in 'notes_color'
+        e) a scale position for n=positions.ScalePosition, root_color=color1,
+        notes_color=color2 (default: red, green), drawn at the positions
+        of the pattern only
 
         Args:
             n:
@@ -317,48 +607,195 @@ class FretBoard():
                 sinlge chord or scale.
 
         """
-        fret_diagram = self._svg_fretboard[:]
-        fret_diagram.extend(self._draw_notes(n))
+        fret_diagram = list(self._svg_fretboard)
+        fret_diagram.extend(self._draw_notes(self._notes_list(n, *args, **kwargs)))
         return svg.SVG(width=self._width, height=self._height,
                            elements=fret_diagram)
 
-    @svg.register(notes.Note)
-    @svg.register(notes.PitchClass)
-    def _1(self, n, color='blue'):
-        return self.svg( ((n,color),) )
-
-    @svg.register
-    def _2(self, n: chords.Chord, root_color="red", notes_color="green",
-           intervals=False):
-        n_list = []
-        if n.voicing:
-            n_list.append( (n[0], root_color) )
-            for x in n[1:]:
-                if intervals:
-                    n_list.append( (x-n[0],notes_color) )
-                else:
-                    n_list.append( (x,notes_color) )
+    def _template(self, compact=False, precision=1):
+        """ Pre-serialized svg fretboard, shared per geometry """
+        key = (self._width, self._height, self._strings, self._frets,
+               self._first_frets, compact, precision)
+        try:
+            return _svg_templates[key]
+        except KeyError:
+            pass
+        if compact:
+            template = svgtemplate.CompactSVGTemplate(
+                self._width, self._height, self._svg_fretboard, precision)
         else:
-            n_list.append( (n.get_pitchclasses()[0], root_color) )
-            for x in n[1:]:
-                if intervals:
-                    n_list.append( (x-n[0],notes_color) )
-                else:
-                    n_list.append( (notes.PitchClass(x), notes_color) )
+            template = svgtemplate.SVGTemplate(
+                self._width, self._height, self._svg_fretboard)
+        return _svg_templates.setdefault(key, template)
 
-        return self.svg(n_list)
+    def svg_str(self, n, *args, **kwargs) -> str:
+        """ Creates the fretboard diagram of n as svg string
 
-    @svg.register
-    def _3(self, n: scales.Scale, root_color="red", notes_color="green"):
-        n_list = []
-        n_list.append( (n[0], root_color) )
-        for x in n[1:]:
-            n_list.append( (x, notes_color) )
-        return self.svg(n_list)
+        Same arguments and output as str(self.svg(...)) but rendered from
+        a pre-serialized fretboard template without svg element objects.
+        """
+        return self._template().render(
+            self._note_markers(self._notes_list(n, *args, **kwargs)))
+
+    def svg_compact(self, n, *args, precision=1, **kwargs) -> str:
+        """ Creates the fretboard diagram of n as compact svg string
+
+        Same arguments and drawing as self.svg(...) but a smaller document:
+        markers are <use> references of one symbol, coordinates are
+        rounded to "precision" decimals and attributes are shared by
+        groups (see trallala.render.svgtemplate.CompactSVGTemplate).
+        """
+        return self._template(True, precision).render(
+            self._note_markers(self._notes_list(n, *args, **kwargs)))
+
+    def json_geometry(self) -> str:
+        """ Geometry of the fretboard as compact JSON
+
+        Static per fretboard, can be cached by clients and combined with
+        the note layers of self.to_json(..., geometry=False).
+        (see trallala.render.jsonformat)
+        """
+        return jsonformat.encode_geometry(self._strings, self._frets,
+                                          (n.name for n in self._notes_tuning()))
+
+    def to_json(self, n, *args, geometry=True, **kwargs) -> str:
+        """ Creates the fretboard diagram of n as compact JSON
+
+        Same arguments as self.svg. Contains the string/fret positions of
+        the notes with their colors and labels (pitchclass, note or
+        interval names) instead of svg elements.
+        (see trallala.render.jsonformat)
+
+        Args:
+            geometry:
+                include the geometry of the fretboard (see json_geometry)
+        """
+        layer = self._note_positions(self._notes_list(n, *args, **kwargs))
+        if geometry:
+            return jsonformat.encode(layer, self._strings, self._frets,
+                                     (n.name for n in self._notes_tuning()))
+        return jsonformat.encode(layer)
+
+    def _notes_tuning(self):
+        """ Open notes of the strings """
+        return tuple(s[0] for s in self._notes)
+
+    @singledispatchmethod
+    def _label(self, n) -> str:
+        """ Default caption of the diagram of n in sheets """
+        # pylint: disable=unused-argument
+        return ""
+
+    @_label.register(notes.Note)
+    @_label.register(notes.PitchClass)
+    def _4(self, n):
+        return n.name.upper()
+
+    @_label.register
+    def _5(self, n: chords.Chord):
+        return str(n).upper()
+
+    @_label.register
+    def _6(self, n: scales.Scale):
+        return " ".join((n[0].name.upper(), n.scalename.replace("_", " ")))
+
+    @_label.register
+    def _7(self, n: _positions.ScalePosition):
+        return f"{self._label(n.scale)} ({n.name})"
+
+    def svg_sheet(self, diagrams, columns=4, labels=None, precision=1) -> str:
+        """ Creates one compact svg document with a grid of diagrams
+
+        The fretboard is defined once and referenced by every diagram (see
+        trallala.render.svgtemplate.CompactSVGTemplate.render_many). Each
+        diagram is captioned with its label.
+
+        Args:
+            diagrams:
+                list of n as accepted by self.svg or tuple(n, dict of keyword
+                arguments for self.svg), e.g. (chord, {'intervals': True})
+            columns:
+                diagrams per row
+            labels:
+                list of captions, one per diagram. Default: name of the
+                note/pitchclass, notes of the chord, root and name of the
+                scale
+            precision:
+                decimals of coordinates
+        Returns:
+            svg document as str
+        Raises:
+            ValueError: len(labels) != len(diagrams) or columns < 1
+        """
+        diagrams = list(diagrams)
+        if labels is not None and len(labels) != len(diagrams):
+            raise ValueError("len(labels) != len(diagrams)")
+        if columns < 1:
+            raise ValueError("columns must be >= 1")
+        template = self._template(True, precision)
+        layers, captions = self._sheet_cells(template, diagrams, columns, labels)
+        rows = -(-len(diagrams) // columns)
+        extra = f'<g class="label">{"".join(captions)}</g>' if captions else ""
+        return template.render_many(layers, min(len(diagrams), columns) * self._width,
+                                    rows * (self._height + self._sheet_caption),
+                                    extra, ".label{font:bold 14px sans-serif}")
+
+    def _sheet_cells(self, template, diagrams, columns, labels):
+        """ Marker layers and caption texts of the diagrams of svg_sheet """
+        caption = self._sheet_caption
+        layers = []
+        captions = []
+        for i, d in enumerate(diagrams):
+            if isinstance(d, tuple) and len(d) == 2 and isinstance(d[1], dict):
+                n, kwargs = d
+            else:
+                n, kwargs = d, {}
+            x = (i % columns) * self._width
+            y = (i // columns) * (self._height + caption)
+            layers.append((x, y + caption,
+                           self._note_markers(self._notes_list(n, **kwargs))))
+            label = labels[i] if labels is not None else self._label(n)
+            if label:
+                captions.append(f'<text x="{template.format_number(x + self._innerspacing)}" '
+                                f'y="{template.format_number(y + caption - 2)}">'
+                                f'{svgtemplate.escape(label)}</text>')
+        return layers, captions
+
+    @property
+    def position_index(self):
+        """ Read-only position index: distance to C0 -> ((string, fret), ...)
+        ordered by string
+        """
+        return MappingProxyType(self._positions)
+
+    @property
+    def playable(self):
+        """ Read-only boolean numpy matrix [string][fret] of the existing
+        positions (False for the missing frets of short strings)
+        """
+        return self._playable
+
+    @property
+    def distances(self):
+        """ Read-only numpy matrix [string][fret] of the distances to C0
+        """
+        return self._distances
+
+    @property
+    def pitchclasses(self):
+        """ Read-only numpy matrix [string][fret] of the numeric pitchclasses
+        """
+        return self._pitchclasses
+
+    @property
+    def frequencies(self):
+        """ Read-only numpy matrix [string][fret] of the frequencies in Hz
+        """
+        return self._frequencies
 
     @property
     def all_notes(self):
-        """ All notes.Notes of the fretbaord
+        """ All notes.Notes of the fretbaord as tuple[string][fret]
         """
         return self._notes
 
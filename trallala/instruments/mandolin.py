@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+"""
+Mandolin family tuned in fifths.
+
+The double strings of a course are represented by one string. The
+fretboard engine (FretBoard) is shared with all fretted instruments, see
+guitar.FretBoard for the supported diagrams.
+
+Typical usage examples:
+    mandolin = Mandolin()                   # g3 d4 a4 e5
+    mandola = Mandolin(tuning='mandola')    # c3 g3 d4 a4
+    print(mandolin.fretboard.svg_str(trallala.core.notes.PitchClass('g')))
+
+"""
+
+from .guitar import _FrettedInstrument
+
+
+tunings = {
+        4 : {
+            'standard'  : ( 0, 7, 7, 7),
+            'mandola'   : ( 0, 7, 7, 7),
+            'octave'    : ( 0, 7, 7, 7)
+            }
+        }
+
+# lowest note of the tunings, used if no root_of_tuning is given
+tuning_roots = {
+        4 : { 'standard' : 'g3', 'mandola' : 'c3', 'octave' : 'g2' }
+        }
+
+
+class Mandolin(_FrettedInstrument):
+    """Mandolin class, customizable with parameters
+
+    Attributes:
+        fretboard: FretBoard object for SVG output
+
+    Args:
+        root_of_tuning:
+            The lowest note of the used tuning in SPN
+            (default: root of the named tuning, e.g. 'g3')
+        tuning:
+            str_name of tuning (standard, mandola or octave) or list of
+            semitone distances between courses or tuning as notes.Note
+            for open courses. (default: 'standard')
+        strings:
+            amount of courses (default: 4)
+        frets:
+            amount of frets on the fretboard. (default: 20)
+    Raises:
+        ValueError: An unsupported tuning was provided
+    """
+    default_strings = 4
+    default_frets = 20
+    tunings = tunings
+    tuning_roots = tuning_roots
+
+
+if __name__ == "__main__":
+    pass
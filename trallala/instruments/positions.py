@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+
+"""Scale positions (box fingerings) on fretted instruments
+
+A position is a playable part of a scale on the fretboard: the scale
+tones are taken in ascending order and assigned to the strings ordered by
+the pitch of the open strings (re-entrant tunings and short strings are
+sorted in). The assignment is solved by dynamic programming over the
+scale tones and strings using the position index of the fretboard
+(FretBoard.position_index). Solved patterns are cached per fretboard,
+scale and parameters.
+
+Supported patterns:
+    window: all scale tones of a fret window. Tones outside the window
+        (stretch) are only used to close gaps between strings.
+    caged: the five CAGED boxes, fret windows anchored on the roots of the
+        C, A, G, E and D chord shapes.
+    three_notes_per_string: one pattern per scale degree with exactly three
+        tones on every string.
+
+The results are ScalePositions with (string, fret) coordinates and can be
+drawn directly by FretBoard.svg, svg_str, svg_compact and to_json.
+
+Typical usage examples:
+    for p in caged(Scale('g', 'major'), Guitar()):
+        print(p.name, p.frets, p.positions)
+    svg = Guitar().fretboard.svg_str(caged(Scale('g', 'major'), Guitar())[0])
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+
+# CAGED chord shapes: (name, string of the root counted from the lowest
+# string, fret of the root relative to the first fret of the box)
+caged_shapes = (('C', 1, 3), ('A', 1, 1), ('G', 0, 3), ('E', 0, 1), ('D', 2, 1))
+
+
+class ScalePosition(namedtuple('ScalePosition', ('scale', 'name', 'positions'))):
+    """ Position of a scale on a fretboard
+
+    Attributes:
+        scale: scales.Scale
+        name: name of the position (e.g. 'E' for the CAGED E shape)
+        positions: tuple of (string, fret) in ascending pitch
+    """
+    __slots__ = ()
+
+    @property
+    def frets(self) -> tuple:
+        """ Lowest and highest fret of the position """
+        frets = [f for _, f in self.positions]
+        return (min(frets), max(frets))
+
+
+def _string_order(fretboard):
+    """ Strings ordered by the pitch of their open notes """
+    return np.argsort(fretboard.distances[:, 0], kind='stable').tolist()
+
+
+def _frets(fretboard):
+    """ dict distance -> fret per string of fretboard, in pitch order of
+    the strings (see _string_order)
+    """
+    frets = [{} for _ in range(fretboard.distances.shape[0])]
+    for distance, positions in fretboard.position_index.items():
+        for string, fret in positions:
+            frets[string][distance] = fret
+    return [frets[i] for i in _string_order(fretboard)]
+
+
+def _tones(fretboard, mask):
+    """ Distances of all scale tones on fretboard in ascending order """
+    return sorted(d for d, positions in fretboard.position_index.items()
+                  if mask >> fretboard.pitchclasses[positions[0]] & 1)
+
+
+def _solve(fretboard, tones, starts, limits, counts, max_span=None):
+    """ Assigns consecutive tones to consecutive strings
+
+    Args:
+        tones:
+            ascending distances of the scale tones
+        starts:
+            indices of tones allowed as first tone on the lowest string
+            (in the pitch order of the strings)
+        limits:
+            tuple(low, high, core_low, core_high): frets allowed and frets
+            used without stretching
+        counts:
+            tuple(min, max) tones per string
+        max_span:
+            maximal fret distance of the tones on one string
+    Returns:
+        tuple of (string, fret). The position with most tones inside the
+        core frets and the fewest stretched tones.
+    """
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-positional-arguments
+    index = _frets(fretboard)
+    order = _string_order(fretboard)
+    strings = len(index)
+    low, high, core_low, core_high = limits
+    least, most = counts
+
+    def fret(j, i):
+        f = index[i].get(tones[j])
+        return f if f is not None and low <= f <= high else None
+
+    # (tone, string, tones on string) -> (score, next state), tone j is the
+    # c-th tone on string i
+    best = {}
+    for j in range(len(tones)-1, -1, -1):
+        for i in range(strings):
+            f = fret(j, i)
+            if f is None:
+                continue
+            own = 1000 if core_low <= f <= core_high else -1
+            for c in range(1, most+1):
+                first = fret(j-c+1, i) if j-c+1 >= 0 else None
+                if first is None or \
+                        (max_span is not None and f - first > max_span):
+                    break
+                options = []
+                if c < most and (j+1, i, c+1) in best:
+                    options.append((best[(j+1, i, c+1)][0], (j+1, i, c+1)))
+                if c >= least:
+                    if (j+1, i+1, 1) in best:
+                        options.append((best[(j+1, i+1, 1)][0], (j+1, i+1, 1)))
+                    options.append((0, None))
+                if options:
+                    score, state = max(options, key=lambda o: o[0])
+                    best[(j, i, c)] = (own + score, state)
+
+    candidates = [(best[(j, 0, 1)][0], (j, 0, 1)) for j in starts
+                  if (j, 0, 1) in best]
+    if not candidates:
+        return ()
+    state = max(candidates, key=lambda o: o[0])[1]
+    ret = []
+    while state is not None:
+        j, i, _ = state
+        ret.append((order[i], index[i][tones[j]]))
+        state = best[state][1]
+    return tuple(ret)
+
+
+@lru_cache(maxsize=1024)
+def _window(fretboard, mask, lo, width, stretch):
+    tones = _tones(fretboard, mask)
+    high = lo + width - 1
+    lowest = _frets(fretboard)[0]
+    starts = [j for j, d in enumerate(tones)
+              if max(lo - stretch, 0) <= lowest.get(d, -1) <= high]
+    return _solve(fretboard, tones, starts,
+                  (max(lo - stretch, 0), high + stretch, lo, high),
+                  (1, width + stretch))
+
+
+def window(scale, instrument, lo, width=4, stretch=1) -> ScalePosition:
+    """ Position of scale in a fret window
+
+    Args:
+        scale:
+            scales.Scale
+        instrument:
+            fretted instrument (e.g. guitar.Guitar)
+        lo:
+            first fret of the window
+        width:
+            frets of the window (default: 4, one finger per fret)
+        stretch:
+            frets below and above the window usable to close gaps
+            between strings (default: 1)
+    Returns:
+        ScalePosition named 'fret <lo>'
+    """
+    positions = _window(instrument.fretboard, scale.pitchclassset.mask, lo,
+                        width, stretch)
+    return ScalePosition(scale, f"fret {lo}", positions)
+
+
+def caged(scale, instrument, width=4, stretch=1) -> list:
+    """ The five CAGED boxes of scale
+
+    Each box is a fret window (see window) placed like the chord shape of
+    its name on the roots of the scale. The shapes assume a guitar like
+    tuning in fourths, other tunings get windows anchored the same way.
+    Strings are counted in the pitch order of the open strings.
+
+    Args:
+        scale:
+            scales.Scale
+        instrument:
+            fretted instrument with at least 3 strings (e.g. guitar.Guitar)
+        width, stretch:
+            see window
+    Returns:
+        list of ScalePosition named 'C', 'A', 'G', 'E' and 'D', ordered by
+        fret
+    Raises:
+        ValueError: less than 3 strings
+    """
+    fretboard = instrument.fretboard
+    if fretboard.distances.shape[0] < 3:
+        raise ValueError("CAGED boxes require at least 3 strings")
+    root = scale[0].numeric
+    order = _string_order(fretboard)
+    boxes = []
+    for name, string, offset in caged_shapes:
+        frets = np.nonzero((fretboard.pitchclasses[order[string]] == root)
+                           & fretboard.playable[order[string]])[0]
+        frets = frets[frets >= offset]
+        if len(frets) == 0:
+            continue
+        lo = int(frets[0]) - offset
+        boxes.append((lo, window(scale, instrument, lo, width, stretch)._replace(name=name)))
+    boxes.sort(key=lambda b: b[0])
+    return [b for _, b in boxes]
+
+
+@lru_cache(maxsize=1024)
+def _three_notes_per_string(fretboard, root, mask, length, max_span):
+    tones = _tones(fretboard, mask)
+    lowest = _frets(fretboard)[0]
+    frets = fretboard.distances.shape[1] - 1
+    # scale degrees in ascending order from the root
+    degrees = sorted((pc for pc in range(length) if mask >> pc & 1),
+                     key=lambda pc: (pc - root) % length)
+    ret = []
+    for pc in degrees:
+        starts = [j for j, d in enumerate(tones)
+                  if d in lowest and d % length == pc]
+        ret.append(_solve(fretboard, tones, starts[:1], (0, frets, 0, frets),
+                          (3, 3), max_span))
+    return tuple(ret)
+
+
+def three_notes_per_string(scale, instrument, max_span=5) -> list:
+    """ Three-notes-per-string patterns of scale
+
+    One pattern per scale degree, starting with the lowest occurrence of
+    the degree on the lowest string.
+
+    Args:
+        scale:
+            scales.Scale
+        instrument:
+            fretted instrument (e.g. guitar.Guitar)
+        max_span:
+            maximal fret distance of the three tones on one string
+    Returns:
+        list of ScalePosition named by the degree ('1', '2', ...)
+    """
+    patterns = _three_notes_per_string(instrument.fretboard, scale[0].numeric,
+                                       scale.pitchclassset.mask,
+                                       scale.pitchclassset.length, max_span)
+    return [ScalePosition(scale, str(i+1), p) for i, p in enumerate(patterns)]
+
+
+if __name__ == "__main__":
+    pass
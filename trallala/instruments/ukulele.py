@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+"""
+Ukuleles with re-entrant and linear tunings.
+
+The fretboard engine (FretBoard) is shared with all fretted instruments,
+see guitar.FretBoard for the supported diagrams.
+
+Typical usage examples:
+    ukulele = Ukulele()                     # g4 c4 e4 a4 (re-entrant)
+    ukulele = Ukulele(tuning='baritone')    # d3 g3 b3 e4
+    print(ukulele.fretboard.svg_str(trallala.core.chords.Chord('major', 'c')))
+
+"""
+
+from .guitar import _FrettedInstrument
+
+
+tunings = {
+        4 : {
+            'standard'  : ( 0, -7, 4, 5),
+            'low_g'     : ( 0, 5, 4, 5),
+            'baritone'  : ( 0, 5, 4, 5)
+            }
+        }
+
+# open note of the first string, used if no root_of_tuning is given
+tuning_roots = {
+        4 : { 'standard' : 'g4', 'low_g' : 'g3', 'baritone' : 'd3' }
+        }
+
+
+class Ukulele(_FrettedInstrument):
+    """Ukulele class, customizable with parameters
+
+    Attributes:
+        fretboard: FretBoard object for SVG output
+
+    Args:
+        root_of_tuning:
+            The open note of the first string in SPN
+            (default: root of the named tuning, e.g. 'g4')
+        tuning:
+            str_name of tuning (standard, low_g or baritone) or list of
+            semitone distances between strings or tuning as notes.Note for
+            open strings. (default: 'standard')
+        strings:
+            amount of strings (default: 4)
+        frets:
+            amount of frets on the fretboard. (default: 12)
+    Raises:
+        ValueError: An unsupported tuning was provided
+    """
+    tunings = tunings
+    tuning_roots = tuning_roots
+    default_strings = 4
+    default_frets = 12
+
+
+if __name__ == "__main__":
+    pass
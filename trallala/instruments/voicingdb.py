@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+
+"""Memory-mapped database of precomputed chord voicings
+
+build() enumerates the voicings of all chords of trallala.config_chords
+for all roots on one instrument configuration (see voicings.catalogue) and
+writes them into a binary file. VoicingDatabase maps the file read-only
+into memory: opening is independent of its size and the pages are shared
+by all processes using the same file.
+
+File layout (little endian):
+    magic       8 bytes  b'TRLVDB\\x00\\x01'
+    header_len  uint32
+    header      JSON: version, strings, frets, tuning (distances),
+                chords, roots, constraints, records; padded to 8 bytes
+    index       uint64[chords][roots][2]: first record, amount of records
+    records     uint8[records][strings + 2]: fret per string (255 = muted),
+                lowest and highest fretted fret (0 if only open strings)
+
+Records of one chord and root are stored consecutively in the order of
+voicings.voicings.
+
+Typical usage examples:
+    build(Guitar(), 'guitar.vdb')
+    with VoicingDatabase('guitar.vdb') as db:
+        db.query('major', 'c', min_fret=0, max_fret=3)
+"""
+
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from ..core import notes
+from . import voicings as _voicings
+
+
+MAGIC = b'TRLVDB\x00\x01'
+VERSION = 1
+MUTED = 255
+
+
+def _instrument_config(instrument):
+    fretboard = instrument.fretboard
+    strings = fretboard.all_notes
+    return (len(strings), len(strings[0]) - 1,
+            [s[0].distance for s in strings])
+
+
+def build(instrument, path, chord_names=None, workers=None, **constraints) -> int:
+    """ Builds the voicing database of instrument
+
+    Args:
+        instrument:
+            stringed instrument with a fretboard (e.g. guitar.Guitar)
+        path:
+            path of the database file. It is written to path + '.tmp' and
+            replaced atomically, open VoicingDatabases keep their data.
+        chord_names:
+            chord names of trallala.config_chords (default: all)
+        workers:
+            number of worker processes (default: os.cpu_count())
+        constraints:
+            keyword arguments of voicings.voicings (e.g. max_span)
+    Returns:
+        number of stored voicings
+    Raises:
+        ValueError: instrument has more than 254 frets
+    """
+    # pylint: disable=too-many-locals
+    strings, frets, tuning = _instrument_config(instrument)
+    if frets >= MUTED:
+        raise ValueError("Too many frets")
+    catalogue = _voicings.catalogue(instrument, chord_names, workers=workers,
+                                    **constraints)
+    chords = list(dict.fromkeys(name for name, _ in catalogue))
+    roots = list(dict.fromkeys(root for _, root in catalogue))
+
+    index = np.zeros((len(chords), len(roots), 2), dtype='<u8')
+    rows = []
+    for ci, name in enumerate(chords):
+        for ri, root in enumerate(roots):
+            found = catalogue[(name, root)]
+            index[ci, ri] = (len(rows), len(found))
+            for v in found:
+                fretted = [f for f in v if f]
+                rows.append([MUTED if f is None else f for f in v]
+                            + [min(fretted, default=0), max(fretted, default=0)])
+    records = np.array(rows, dtype=np.uint8).reshape(len(rows), strings + 2)
+
+    header = json.dumps({'version': VERSION, 'strings': strings,
+                         'frets': frets, 'tuning': tuning,
+                         'chords': chords, 'roots': roots,
+                         'constraints': constraints,
+                         'records': len(rows)}).encode('utf-8')
+    header += b' ' * (-(len(MAGIC) + 4 + len(header)) % 8)
+    # replaced atomically: open VoicingDatabases keep mapping the old file
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<I', len(header)))
+        f.write(header)
+        f.write(index.tobytes())
+        f.write(records.tobytes())
+    os.replace(tmp, path)
+    return len(rows)
+
+
+class VoicingDatabase:
+    """ Read-only, memory-mapped voicing database (see build)
+
+    Attributes:
+        chords: chord names in the database
+        roots: root pitchclass names in the database
+        strings: amount of strings of the instrument
+        frets: amount of frets of the instrument
+        tuning: distances of the open strings
+        constraints: constraints used for the enumeration
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, path):
+        """ Opens and maps the database at path
+
+        Raises:
+            ValueError: path is no voicing database of a supported version
+        """
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if self._mmap[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"No voicing database: {path}")
+            (header_len,) = struct.unpack_from('<I', self._mmap, len(MAGIC))
+            start = len(MAGIC) + 4
+            header = json.loads(self._mmap[start:start + header_len])
+            if header['version'] != VERSION:
+                raise ValueError(f"Unsupported version {header['version']}")
+        except ValueError:
+            self._mmap.close()
+            raise
+        self.chords = tuple(header['chords'])
+        self.roots = tuple(header['roots'])
+        self.strings = header['strings']
+        self.frets = header['frets']
+        self.tuning = tuple(header['tuning'])
+        self.constraints = header['constraints']
+        self._chord_index = {name: i for i, name in enumerate(self.chords)}
+        self._root_index = {notes.PitchClass(r).numeric: i
+                            for i, r in enumerate(self.roots)}
+
+        offset = start + header_len
+        self._index = np.frombuffer(self._mmap, dtype='<u8',
+                                    count=len(self.chords) * len(self.roots) * 2,
+                                    offset=offset).reshape(len(self.chords),
+                                                           len(self.roots), 2)
+        offset += self._index.nbytes
+        self._records = np.frombuffer(self._mmap, dtype=np.uint8,
+                                      count=header['records'] * (self.strings + 2),
+                                      offset=offset).reshape(header['records'],
+                                                             self.strings + 2)
+
+    def matches(self, instrument) -> bool:
+        """ True if the database was built for the configuration of
+        instrument (strings, frets and tuning)
+        """
+        strings, frets, tuning = _instrument_config(instrument)
+        return (strings, frets, tuple(tuning)) == \
+            (self.strings, self.frets, self.tuning)
+
+    def query_array(self, chord, root, min_fret=0, max_fret=None,
+                    max_span=None) -> np.ndarray:
+        """ Voicings of chord and root as array
+
+        Args:
+            chord:
+                chord name
+            root:
+                root as pitchclass name, numeric or notes.PitchClass
+            min_fret, max_fret:
+                fret window containing all fretted notes
+            max_span:
+                maximal distance in frets between the fretted notes
+        Returns:
+            numpy.ndarray uint8[voicings][strings], 255 for muted strings
+        Raises:
+            KeyError: chord or root not in the database
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        ci = self._chord_index[chord]
+        ri = self._root_index[notes.PitchClass(root).numeric]
+        first, count = (int(x) for x in self._index[ci, ri])
+        records = self._records[first:first + count]
+        lo = records[:, -2]
+        hi = records[:, -1]
+        mask = np.ones(count, dtype=bool)
+        if min_fret:
+            # voicings with open strings only have lo = hi = 0
+            mask &= (lo >= min_fret)
+        if max_fret is not None:
+            mask &= (hi <= max_fret)
+        if max_span is not None:
+            mask &= (hi - lo <= max_span)
+        return records[mask, :-2]
+
+    def query(self, chord, root, min_fret=0, max_fret=None, max_span=None) -> list:
+        """ Voicings of chord and root (see query_array)
+
+        Returns:
+            list of tuple(fret or None per string) as voicings.voicings
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        return [tuple(None if f == MUTED else f for f in row)
+                for row in self.query_array(chord, root, min_fret, max_fret,
+                                            max_span).tolist()]
+
+    def __len__(self):
+        return len(self._records)
+
+    def close(self):
+        """ Unmaps the database """
+        if self._mmap is not None:
+            self._index = self._records = None
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv=None):
+    """ Builds a voicing database from command line arguments """
+    # pylint: disable=import-outside-toplevel
+    import argparse
+    from .guitar import Guitar
+    parser = argparse.ArgumentParser(prog="python3 -m trallala.instruments.voicingdb",
+                                     description="Build the voicing database "
+                                     "of all chords for all roots of a guitar")
+    parser.add_argument("output", help="path of the database file")
+    parser.add_argument("--root", default=None,
+                        help="lowest note of the tuning (default: root of the "
+                        "tuning for the amount of strings, e.g. e2 for 6 "
+                        "strings)")
+    parser.add_argument("--tuning", default="standard",
+                        help="name of the tuning (default: standard)")
+    parser.add_argument("--strings", type=int, default=6,
+                        help="amount of strings (default: 6)")
+    parser.add_argument("--frets", type=int, default=24,
+                        help="amount of frets (default: 24)")
+    parser.add_argument("--max-span", type=int, default=3,
+                        help="maximal fret span of a voicing (default: 3)")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: number of cpus)")
+    args = parser.parse_args(argv)
+    guitar = Guitar(args.root, tuning=args.tuning, strings=args.strings,
+                    frets=args.frets)
+    n = build(guitar, args.output, workers=args.workers, max_span=args.max_span)
+    print(f"{n} voicings written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
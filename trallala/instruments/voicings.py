@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+"""Playable chord voicings on stringed instruments
+
+A voicing assigns one fret or None (muted) to every string of an
+instrument. Voicings are enumerated by a depth first search over the
+strings using the frets holding a tone of the chord. Branches exceeding
+the fret span or unable to complete the chord are pruned.
+
+Typical usage examples:
+    for v in voicings(Chord('major', 'c'), Guitar(), root_in_bass=True):
+        print(v)    # e.g. (None, 3, 2, 0, 1, 0)
+    c = catalogue(Guitar(frets=12), workers=4)
+"""
+
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ..core import chords
+from ..core import notes
+from ..core import intervals
+from ..core.scales import ChromaticScale
+
+
+def _fifth(length):
+    """ Distance of the perfect fifth in a temperament of length """
+    if length == 12:
+        return intervals.Interval('perfect_fifth').distance
+    return None
+
+
+def voicings(chord, instrument, max_span=3, root_in_bass=False,
+             omit_fifth=False, min_strings=None, max_fret=None) -> list:
+    """ Enumerates all playable voicings of chord on instrument
+
+    Args:
+        chord:
+            chords.Chord. Only the pitchclasses are used, the voicing of
+            chord is ignored.
+        instrument:
+            stringed instrument with a fretboard (e.g. guitar.Guitar)
+        max_span:
+            maximal distance in frets between the fretted notes. Open
+            strings are not part of the span.
+        root_in_bass:
+            the lowest sounding note must be the root of the chord
+        omit_fifth:
+            the perfect fifth of the root may be omitted
+        min_strings:
+            minimal amount of sounding strings
+            (default: amount of required pitchclasses)
+        max_fret:
+            highest fret used (default: all frets of the instrument)
+    Returns:
+        list of tuple(fret or None per string), strings ordered as in
+        FretBoard.all_notes. Sorted by the first fretted position.
+    """
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-positional-arguments
+    fretboard = instrument.fretboard
+    pcset = chord.pitchclassset
+    length = pcset.length
+    root = chord.get_pitchclasses()[0].numeric
+    required = pcset.mask
+    fifth = _fifth(length)
+    if omit_fifth and fifth is not None:
+        required &= ~(1 << ((root + fifth) % length))
+    if min_strings is None:
+        min_strings = bin(required).count('1')
+    min_strings = max(min_strings, 1)
+
+    distances = fretboard.distances[:, :None if max_fret is None else max_fret+1]
+    pitchclasses = distances % length
+    playable = fretboard.playable[:, :distances.shape[1]]
+    in_chord = ((pcset.mask >> pitchclasses) & 1 == 1) & playable
+    candidates = [tuple(zip(np.nonzero(row)[0].tolist(), pcs[row].tolist(),
+                            dists[row].tolist()))
+                  for row, pcs, dists in zip(in_chord, pitchclasses, distances)]
+    strings = len(candidates)
+    result = []
+    frets = [None] * strings
+
+    def search(i, lo, hi, mask, sounding, bass):
+        # pylint: disable=too-many-positional-arguments
+        remaining = strings - i
+        if bin(required & ~mask).count('1') > remaining \
+                or sounding + remaining < min_strings:
+            return
+        if i == strings:
+            if not root_in_bass or bass[1] == root:
+                result.append(tuple(frets))
+            return
+        frets[i] = None
+        search(i+1, lo, hi, mask, sounding, bass)
+        for fret, pc, distance in candidates[i]:
+            if fret:
+                nlo = min(lo, fret)
+                nhi = max(hi, fret)
+                if nhi - nlo > max_span:
+                    if fret > lo:
+                        break
+                    continue
+            else:
+                nlo, nhi = lo, hi
+            frets[i] = fret
+            search(i+1, nlo, nhi, mask | 1 << pc, sounding + 1,
+                   min(bass, (distance, pc)))
+        frets[i] = None
+
+    search(0, float('inf'), float('-inf'), 0, 0, (float('inf'), None))
+    result.sort(key=lambda v: (min((f for f in v if f), default=0),
+                               tuple(-1 if f is None else f for f in v)))
+    return result
+
+
+def _catalogue_job(args):
+    name, root, instrument, constraints = args
+    chord = chords.Chord(name, root)
+    return ((name, root), tuple(voicings(chord, instrument, **constraints)))
+
+
+def catalogue(instrument, chord_names=None, roots=None, workers=None,
+              **constraints) -> dict:
+    """ Voicings of a catalogue of chords, enumerated in a process pool
+
+    Args:
+        instrument:
+            stringed instrument with a fretboard (e.g. guitar.Guitar)
+        chord_names:
+            chord names of trallala.config_chords (default: all)
+        roots:
+            root pitchclass names (default: all pitchclasses)
+        workers:
+            number of worker processes. 1 enumerates in the calling process.
+            (default: os.cpu_count())
+        constraints:
+            keyword arguments of voicings (e.g. max_span)
+    Returns:
+        dict tuple(chord name, root name) -> tuple of voicings, in the
+        order of chord_names and roots
+    """
+    length = ChromaticScale().temperament.length
+    if chord_names is None:
+        chord_names = chords.chord_integer[length]
+    if roots is None:
+        roots = [notes.PitchClass(i).name for i in range(length)]
+    tasks = [(name, root, instrument, constraints)
+             for name in chord_names for root in roots]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(tasks) <= 1:
+        return dict(map(_catalogue_job, tasks))
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+        return dict(executor.map(_catalogue_job, tasks, chunksize=4))
+
+
+if __name__ == "__main__":
+    pass
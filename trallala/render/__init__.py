@@ -0,0 +1,13 @@
+"""
+Rendering backends for diagrams of notes, chords and scales.
+"""
+
+from . import svgtemplate
+from . import jsonformat
+from . import manifest
+from . import sinks
+from . import parallel
+from .parallel import Job, BatchOptions, batch
+
+__all__ = ["svgtemplate", "jsonformat", "manifest", "sinks", "parallel",
+           "Job", "BatchOptions", "batch"]
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+"""Command line interface for batch rendering of fretboard diagrams
+
+Typical usage examples:
+    python3 -m trallala.render scales docs/img
+    python3 -m trallala.render chords --tuning drop --frets 22 -j 8 out
+    python3 -m trallala.render chords --instrument ukulele out
+"""
+
+import argparse
+import sys
+
+from ..instruments.guitar import Guitar
+from ..instruments.bass import Bass
+from ..instruments.ukulele import Ukulele
+from ..instruments.mandolin import Mandolin
+from ..instruments.banjo import Banjo
+from . import parallel
+
+
+instruments = {'guitar': Guitar, 'bass': Bass, 'ukulele': Ukulele,
+               'mandolin': Mandolin, 'banjo': Banjo}
+
+
+def main(argv=None):
+    """ Renders the catalogue given by the command line arguments """
+    parser = argparse.ArgumentParser(prog="python3 -m trallala.render",
+                                     description="Render fretboard diagrams "
+                                     "of all scales or chords for all roots")
+    parser.add_argument("catalogue", choices=("scales", "chords", "all"),
+                        help="diagrams to render")
+    parser.add_argument("output", help="output directory or archive "
+                        "(.zip, .tar, .tar.gz, .tgz, .tar.bz2, .tar.xz)")
+    parser.add_argument("--instrument", choices=tuple(instruments),
+                        default="guitar", help="instrument (default: guitar)")
+    parser.add_argument("--root", default=None,
+                        help="open note of the first string "
+                        "(default: root of the tuning, e.g. e2)")
+    parser.add_argument("--tuning", default="standard",
+                        help="name of the tuning (default: standard)")
+    parser.add_argument("--strings", type=int, default=None,
+                        help="amount of strings (default: of the instrument)")
+    parser.add_argument("--frets", type=int, default=None,
+                        help="amount of frets (default: of the instrument)")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: number of cpus)")
+    parser.add_argument("-i", "--incremental", action="store_true",
+                        help="only render diagrams whose inputs changed")
+    parser.add_argument("--format", choices=tuple(parallel.renderers),
+                        default="svg", help="output format: svg, compact svg "
+                        "(<defs>/<use>, rounded numbers) or json (default: svg)")
+    parser.add_argument("--no-compress", action="store_true",
+                        help="store zip archive members uncompressed")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="do not report progress")
+    args = parser.parse_args(argv)
+
+    options = {k: v for k, v in (('strings', args.strings),
+                                 ('frets', args.frets)) if v is not None}
+    try:
+        instrument = instruments[args.instrument](args.root, tuning=args.tuning,
+                                                  **options)
+    except ValueError as e:
+        parser.error(str(e))
+    renderer = args.format
+    jobs = []
+    if args.catalogue in ("scales", "all"):
+        jobs.extend(parallel.scale_jobs(instrument, renderer=renderer,
+                                        prefix=f"scale_{args.instrument}_"))
+    if args.catalogue in ("chords", "all"):
+        jobs.extend(parallel.chord_jobs(instrument, renderer=renderer,
+                                        prefix=f"chord_{args.instrument}_"))
+
+    progress = None if args.quiet else parallel.print_progress
+    written = parallel.batch(jobs, args.output, workers=args.workers,
+                             progress=progress, incremental=args.incremental,
+                             compress=not args.no_compress)
+    print(f"{written} diagrams written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+"""Compact JSON format of fretboard diagrams for client side rendering
+
+A diagram is sent as note layer: the string/fret positions of the notes
+with indices into tables of colors and labels. The geometry of the
+fretboard (strings, frets, tuning) is static per instrument and can be
+sent once and cached by the client.
+
+Format (version 1):
+    {"v": 1,
+     "strings": 6, "frets": 24, "tuning": ["e2", ...],  (geometry)
+     "colors": ["red", "green"],
+     "labels": ["c", "M3/ d4", ...],
+     "notes": [string, fret, color index, label index, string, ...]}
+
+"notes" is a flat list with four integers per marker. Strings are counted
+from the lowest open note (0), frets from the nut (0 = open string).
+Labels are the names of the pitchclasses, notes or intervals.
+
+Typical usage examples:
+    payload = encode([(0, 8, 'red', 'c')], 6, 24, ('e2', 'a2', ...))
+    diagram = decode(payload)
+"""
+
+import json
+
+
+VERSION = 1
+
+# member names of the geometry
+_geometry = ('strings', 'frets', 'tuning')
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _geometry_dict(strings, frets, tuning) -> dict:
+    return {'strings': strings, 'frets': frets, 'tuning': list(tuning)}
+
+
+def encode_geometry(strings, frets, tuning) -> str:
+    """ Geometry of a fretboard as JSON
+
+    Args:
+        strings:
+            amount of strings
+        frets:
+            amount of frets
+        tuning:
+            names of the open notes of the strings
+    """
+    obj = {'v': VERSION}
+    obj.update(_geometry_dict(strings, frets, tuning))
+    return _dumps(obj)
+
+
+def encode(positions, strings=None, frets=None, tuning=None) -> str:
+    """ Note layer of a diagram as JSON
+
+    Args:
+        positions:
+            list of tuple(string, fret, color, label)
+        strings, frets, tuning:
+            geometry of the fretboard (see encode_geometry). Omitted if
+            strings is None.
+    Returns:
+        JSON document as str
+    """
+    colors = {}
+    labels = {}
+    flat = []
+    for (string, fret, color, label) in positions:
+        flat.extend((string, fret, colors.setdefault(color, len(colors)),
+                     labels.setdefault(label, len(labels))))
+    obj = {'v': VERSION}
+    if strings is not None:
+        obj.update(_geometry_dict(strings, frets, tuning))
+    obj['colors'] = list(colors)
+    obj['labels'] = list(labels)
+    obj['notes'] = flat
+    return _dumps(obj)
+
+
+def decode(payload) -> dict:
+    """ Decodes a JSON diagram or geometry
+
+    Returns:
+        dict with the geometry members (if present) and "notes" as list of
+        tuple(string, fret, color, label)
+    Raises:
+        ValueError: unsupported version or malformed note layer
+    """
+    obj = json.loads(payload)
+    if obj.get('v') != VERSION:
+        raise ValueError(f"Unsupported version {obj.get('v')}")
+    ret = {k: obj[k] for k in _geometry if k in obj}
+    if 'notes' in obj:
+        flat = obj['notes']
+        if len(flat) % 4:
+            raise ValueError("Malformed note layer")
+        colors = obj['colors']
+        labels = obj['labels']
+        ret['notes'] = [(flat[i], flat[i+1], colors[flat[i+2]], labels[flat[i+3]])
+                        for i in range(0, len(flat), 4)]
+    return ret
+
+
+if __name__ == "__main__":
+    pass
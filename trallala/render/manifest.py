@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+"""Content hashes of diagram jobs for incremental builds
+
+The hash of a job covers everything its diagram depends on: the
+instrument (type, strings, tuning, frets), the diagram definition (notes,
+pitchclasses, chord integers and voicing, scale pitchclasses and root),
+the rendering options (colours, intervals), the output format and the
+renderer version. A Manifest stores the hashes of the written diagrams
+of an output directory.
+
+Typical usage examples:
+    m = Manifest.load('docs/img/.trallala-manifest.json')
+    if m.changed(job.key, job_hash(job)):
+        ...
+"""
+
+import hashlib
+import json
+import os
+
+from functools import singledispatch
+
+import svg
+
+from ..core import notes
+from ..core import scales
+from ..core import chords
+from ..core import intervals
+from ..instruments import positions
+from . import svgtemplate
+
+
+MANIFEST_NAME = ".trallala-manifest.json"
+
+
+@singledispatch
+def _describe(diagram):
+    """ Canonical, hashable description of a diagram """
+    raise TypeError(f"Cannot hash diagram of type {type(diagram)}")
+
+@_describe.register(list)
+@_describe.register(tuple)
+def _1(diagram):
+    return ('list',) + tuple((_describe(n), str(color)) for n, color in diagram)
+
+@_describe.register
+def _2(diagram: notes.Note):
+    return ('Note', diagram.distance)
+
+@_describe.register
+def _3(diagram: notes.PitchClass):
+    return ('PitchClass', diagram.numeric)
+
+@_describe.register
+def _4(diagram: intervals.Interval):
+    return ('Interval', diagram.distance)
+
+@_describe.register
+def _5(diagram: chords.Chord):
+    return ('Chord', diagram.get_pitchclasses()[0].numeric,
+            tuple(diagram.chord_int), diagram.voicing)
+
+@_describe.register
+def _6(diagram: scales.Scale):
+    return ('Scale', diagram[0].numeric, diagram.pitchclassset.mask,
+            diagram.pitchclassset.length)
+
+@_describe.register
+def _7(diagram: positions.ScalePosition):
+    return ('ScalePosition', _describe(diagram.scale), diagram.name,
+            diagram.positions)
+
+
+def _describe_instrument(instrument):
+    if instrument is None:
+        return None
+    return (type(instrument).__name__, instrument.strings,
+            tuple(n.distance for n in instrument.tuning),
+            tuple(instrument.semitones))
+
+
+def job_hash(job) -> str:
+    """ Content hash of a diagram job
+
+    Args:
+        job:
+            trallala.render.Job
+    Returns:
+        hex digest of the sha256 hash of the job inputs
+    """
+    options = sorted((k, repr(v)) for k, v in (job.options or {}).items())
+    description = (svgtemplate.VERSION, svg.__version__,
+                   _describe_instrument(job.instrument),
+                   _describe(job.diagram), tuple(options), job.renderer)
+    return hashlib.sha256(repr(description).encode('utf-8')).hexdigest()
+
+
+class Manifest:
+    """ Hashes of the diagrams written to an output
+
+    Attributes:
+        path: path of the manifest file
+    """
+
+    def __init__(self, path, hashes=None):
+        """ Creates a manifest stored at path
+
+        Args:
+            path:
+                path of the manifest file
+            hashes:
+                dict key -> hash of the written diagrams
+        """
+        self.path = path
+        self._hashes = dict(hashes) if hashes else {}
+
+    @classmethod
+    def load(cls, path):
+        """ Loads the manifest from path. Returns an empty manifest if the
+        file does not exist or cannot be read.
+        """
+        try:
+            with open(path, encoding='utf-8') as f:
+                hashes = json.load(f)
+        except (OSError, ValueError):
+            hashes = {}
+        if not isinstance(hashes, dict):
+            hashes = {}
+        return cls(path, hashes)
+
+    def save(self):
+        """ Writes the manifest atomically to its path """
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self._hashes, f, indent=0, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def changed(self, key, digest) -> bool:
+        """ True if the diagram of key was not written with digest """
+        return self._hashes.get(key) != digest
+
+    def __setitem__(self, key, digest):
+        self._hashes[key] = digest
+
+    def __getitem__(self, key):
+        return self._hashes[key]
+
+    def __contains__(self, key):
+        return key in self._hashes
+
+    def __len__(self):
+        return len(self._hashes)
+
+
+if __name__ == "__main__":
+    pass
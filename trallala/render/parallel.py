@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+
+"""Parallel batch rendering of fretboard diagrams
+
+Diagram jobs are rendered by a pool of worker processes. Results are
+returned and written in the order of the jobs, independent of the number
+of workers.
+
+Typical usage examples:
+    jobs = scale_jobs(Guitar())
+    batch(jobs, 'docs/img', workers=4)
+    batch(jobs, 'catalogue.tar.gz', workers=4)
+"""
+
+import os
+import sys
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from ..core import notes
+from ..core import scales
+from ..core import chords
+from ..instruments import guitar
+from .manifest import Manifest, MANIFEST_NAME, job_hash
+from .sinks import is_directory, open_sink
+
+
+Job = namedtuple('Job', ['key', 'diagram', 'instrument', 'options', 'renderer'],
+                 defaults=(None, None, 'svg'))
+Job.__doc__ = """ Diagram rendering job
+
+Args:
+    key:
+        unique name of the job, used as file name of the diagram
+    diagram:
+        Note, PitchClass, Chord, Scale or list of tuple(note, color) as
+        accepted by FretBoard.svg
+    instrument:
+        instrument providing the fretboard (default: Guitar())
+    options:
+        dict of keyword arguments for FretBoard.svg (e.g., root_color)
+    renderer:
+        output format, key of renderers (default: 'svg')
+"""
+
+BatchOptions = namedtuple('BatchOptions',
+                          ['workers', 'progress', 'incremental', 'compress'],
+                          defaults=(None, None, False, True))
+BatchOptions.__doc__ = """ Options of batch
+
+Args:
+    workers:
+        number of worker processes (default: os.cpu_count())
+    progress:
+        callable(done, total, key) called after each rendered job
+    incremental:
+        skip jobs whose diagram exists and whose content hash matches
+        the manifest of output (see trallala.render.manifest). Only
+        supported for directories.
+    compress:
+        compress the members of zip archives
+"""
+
+# output format -> FretBoard method rendering the diagram as str
+renderers = {
+        'svg'       : 'svg_str',
+        'compact'   : 'svg_compact',
+        'json'      : 'to_json'
+        }
+
+# output format -> file suffix of the job keys
+suffixes = {
+        'svg'       : '.svg',
+        'compact'   : '.svg',
+        'json'      : '.json'
+        }
+
+
+def render_job(job: Job) -> tuple:
+    """ Renders a single job
+
+    Returns:
+        tuple(key, rendered document as str)
+    Raises:
+        ValueError: unknown renderer
+    """
+    instrument = job.instrument if job.instrument is not None else guitar.Guitar()
+    options = job.options if job.options is not None else {}
+    try:
+        method = getattr(instrument.fretboard, renderers[job.renderer])
+    except KeyError as e:
+        raise ValueError(f"Unknown renderer {job.renderer}") from e
+    return (job.key, method(job.diagram, **options))
+
+
+def render(jobs, workers=None, progress=None, chunksize=16):
+    """ Renders jobs, distributed over a pool of worker processes
+
+    Args:
+        jobs:
+            iterable of Job
+        workers:
+            number of worker processes. 1 renders in the calling process.
+            (default: os.cpu_count())
+        progress:
+            callable(done, total, key) called after each rendered job
+        chunksize:
+            number of jobs sent to a worker at once
+    Returns:
+        generator of tuple(key, svg document as str) in the order of jobs
+    """
+    jobs = list(jobs)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    total = len(jobs)
+
+    if workers == 1 or total <= 1:
+        for done, job in enumerate(jobs, 1):
+            result = render_job(job)
+            if progress:
+                progress(done, total, result[0])
+            yield result
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, total)) as executor:
+        for done, result in enumerate(executor.map(render_job, jobs,
+                                                   chunksize=chunksize), 1):
+            if progress:
+                progress(done, total, result[0])
+            yield result
+
+
+def batch(jobs, output, options: BatchOptions=None, **kwargs) -> int:
+    """ Renders jobs in parallel and writes the diagrams to output
+
+    Diagrams are written as soon as they are rendered, in the order of
+    jobs, to the sink of output (see trallala.render.sinks).
+
+    Args:
+        jobs:
+            iterable of Job
+        output:
+            output directory (created if missing), path of a zip or tar
+            archive or a sink object
+        options:
+            BatchOptions (default: BatchOptions())
+        kwargs:
+            fields of BatchOptions replacing those of options (e.g.,
+            workers=4, incremental=True)
+    Returns:
+        number of written diagrams
+    Raises:
+        ValueError: incremental is set and output is no directory
+    """
+    options = (options if options is not None else BatchOptions())._replace(**kwargs)
+    # checked before opening, opening an archive truncates it
+    if options.incremental and not is_directory(output):
+        raise ValueError("Incremental builds require a directory output")
+    sink = open_sink(output, options.compress)
+    manifest = None
+    if options.incremental:
+        manifest = Manifest.load(os.path.join(sink.path, MANIFEST_NAME))
+        digests = {}
+        changed = []
+        for job in jobs:
+            digests[job.key] = job_hash(job)
+            if manifest.changed(job.key, digests[job.key]) \
+                    or not sink.exists(job.key):
+                changed.append(job)
+        jobs = changed
+
+    written = 0
+    try:
+        for key, document in render(jobs, options.workers, options.progress):
+            sink.write(key, document)
+            if manifest is not None:
+                manifest[key] = digests[key]
+            written += 1
+    finally:
+        if manifest is not None:
+            manifest.save()
+        if sink is not output:
+            sink.close()
+    return written
+
+
+def print_progress(done, total, key, file=sys.stderr):
+    """ Progress reporter for batch printing done/total on one line """
+    print(f"\r[{done}/{total}] {key}", end="\n" if done == total else "",
+          file=file, flush=True)
+
+
+def scale_jobs(instrument=None, scale_names=None, prefix="scale_guitar_",
+               renderer='svg', **options) -> list:
+    """ Jobs for all scales for all roots
+
+    Args:
+        instrument:
+            instrument providing the fretboard (default: Guitar())
+        scale_names:
+            names of scales to render (default: all of config_scales)
+        prefix:
+            prefix of the job keys
+        renderer:
+            output format, key of renderers
+        options:
+            keyword arguments for FretBoard.svg
+    Returns:
+        list of Job with keys prefix + root + "_" + scale + suffix
+    """
+    instrument = instrument if instrument is not None else guitar.Guitar()
+    length = scales.ChromaticScale().temperament.length
+    if scale_names is None:
+        scale_names = scales.scales_steps[length]
+    jobs = []
+    for scale in scale_names:
+        for root_numeric in range(length):
+            pc = notes.PitchClass(root_numeric)
+            jobs.append(Job("".join((prefix, pc.name, "_", scale, suffixes[renderer])),
+                            scales.Scale(root=pc, scale=scale),
+                            instrument, options, renderer))
+    return jobs
+
+
+def chord_jobs(instrument=None, chord_names=None, prefix="chord_guitar_",
+               renderer='svg', **options) -> list:
+    """ Jobs for all chords for all roots
+
+    Args:
+        instrument:
+            instrument providing the fretboard (default: Guitar())
+        chord_names:
+            names of chords to render (default: all of config_chords)
+        prefix:
+            prefix of the job keys
+        renderer:
+            output format, key of renderers
+        options:
+            keyword arguments for FretBoard.svg
+    Returns:
+        list of Job with keys prefix + root + "_" + chord + suffix
+    """
+    instrument = instrument if instrument is not None else guitar.Guitar()
+    length = scales.ChromaticScale().temperament.length
+    if chord_names is None:
+        chord_names = chords.chord_integer[length]
+    jobs = []
+    for chord in chord_names:
+        for root_numeric in range(length):
+            pc = notes.PitchClass(root_numeric)
+            jobs.append(Job("".join((prefix, pc.name, "_", chord, suffixes[renderer])),
+                            chords.Chord(root=pc.name, chord=chord),
+                            instrument, options, renderer))
+    return jobs
+
+
+if __name__ == "__main__":
+    pass
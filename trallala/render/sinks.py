@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+"""Output sinks for rendered diagrams
+
+A sink receives rendered diagrams by key and stores them. DirectorySink
+writes one file per diagram, ArchiveSink streams all diagrams into a
+single zip or tar archive with an index of key -> member name.
+
+Typical usage examples:
+    with open_sink('catalogue.tar.gz') as sink:
+        sink.write('c_major.svg', document)
+"""
+
+import gzip
+import io
+import json
+import os
+import tarfile
+import zipfile
+
+from contextlib import ExitStack
+
+
+# member name of the key -> member name index in archives
+INDEX_NAME = "index.json"
+
+# archive suffix -> (format, compression)
+_archive_suffixes = {
+        '.zip'      : ('zip', 'deflate'),
+        '.tar'      : ('tar', ''),
+        '.tar.gz'   : ('tar', 'gz'),
+        '.tgz'      : ('tar', 'gz'),
+        '.tar.bz2'  : ('tar', 'bz2'),
+        '.tar.xz'   : ('tar', 'xz')
+        }
+
+
+def _archive_suffix(path):
+    """ Archive suffix of path or None """
+    lower = str(path).lower()
+    for suffix in sorted(_archive_suffixes, key=len, reverse=True):
+        if lower.endswith(suffix):
+            return suffix
+    return None
+
+
+class DirectorySink:
+    """ Writes each diagram to the file "path"/"key"
+
+    Attributes:
+        path: output directory
+    """
+
+    def __init__(self, path):
+        """ Creates the sink, creates path if missing """
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, key, document):
+        """ Writes document as file key """
+        with open(os.path.join(self.path, key), 'w', encoding='utf-8') as f:
+            print(document, file=f)
+
+    def exists(self, key) -> bool:
+        """ True if the diagram of key has been written """
+        return os.path.exists(os.path.join(self.path, key))
+
+    def close(self):
+        """ Nothing to close for directories """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ArchiveSink:
+    """ Streams all diagrams into a single zip or tar archive
+
+    The format is defined by the suffix of path: .zip (deflate compressed),
+    .tar, .tar.gz/.tgz, .tar.bz2 or .tar.xz. Member timestamps are fixed, so
+    equal jobs create equal archives. On close, the index of key -> member
+    name is added as INDEX_NAME.
+
+    Attributes:
+        path: path of the archive
+        index: dict key -> member name of the written diagrams
+    """
+
+    def __init__(self, path, compress=True):
+        """ Opens the archive for writing
+
+        Args:
+            path:
+                path of the archive, the suffix defines the format
+            compress:
+                compress the members of zip archives. tar archives are
+                compressed as defined by the suffix of path.
+        Raises:
+            ValueError: path has no supported archive suffix
+        """
+        suffix = _archive_suffix(path)
+        if suffix is None:
+            raise ValueError(f"Unsupported archive format: {path}")
+        self.path = path
+        self.index = {}
+        self._format, compression = _archive_suffixes[suffix]
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # the sink owns the open handles until close(), they are closed
+        # right away if opening fails
+        with ExitStack() as stack:
+            if self._format == 'zip':
+                self._archive = stack.enter_context(zipfile.ZipFile(
+                    path, 'w', zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED))
+            elif compression == 'gz':
+                # fixed gzip header timestamp
+                fileobj = stack.enter_context(gzip.GzipFile(path, 'wb', mtime=0))
+                self._archive = stack.enter_context(
+                    tarfile.open(fileobj=fileobj, mode='w'))
+            else:
+                self._archive = stack.enter_context(
+                    tarfile.open(path, 'w:' + compression))
+            self._handles = stack.pop_all()
+
+    def _add(self, name, data: bytes):
+        if self._format == 'zip':
+            info = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+            info.compress_type = self._archive.compression
+            self._archive.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = 0
+            info.mode = 0o644
+            self._archive.addfile(info, io.BytesIO(data))
+
+    def write(self, key, document):
+        """ Adds document as member key to the archive
+
+        Raises:
+            ValueError: key was already written or is INDEX_NAME
+        """
+        if key in self.index or key == INDEX_NAME:
+            raise ValueError(f"Duplicate archive member {key}")
+        self._add(key, (document + '\n').encode('utf-8'))
+        self.index[key] = key
+
+    def exists(self, key) -> bool:
+        """ True if the diagram of key has been written """
+        return key in self.index
+
+    def close(self):
+        """ Adds the index and closes the archive """
+        if self._archive is None:
+            return
+        try:
+            self._add(INDEX_NAME, json.dumps(self.index, indent=0).encode('utf-8'))
+        finally:
+            self._archive = None
+            self._handles.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def is_directory(output) -> bool:
+    """ True if output is a DirectorySink or the path of a directory (no
+    archive suffix)
+    """
+    if hasattr(output, 'write') and hasattr(output, 'close'):
+        return isinstance(output, DirectorySink)
+    return _archive_suffix(output) is None
+
+
+def open_sink(output, compress=True):
+    """ Sink for output
+
+    Args:
+        output:
+            sink object, path of an archive (see ArchiveSink) or path of
+            a directory
+        compress:
+            compress the members of zip archives
+    Returns:
+        output if it is a sink, else ArchiveSink or DirectorySink
+    """
+    if hasattr(output, 'write') and hasattr(output, 'close'):
+        return output
+    if _archive_suffix(output) is not None:
+        return ArchiveSink(output, compress)
+    return DirectorySink(output)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+
+"""Template based svg rendering
+
+The static part of a diagram (style, nut, strings, frets, watermark) is
+serialized once with svg.py. Markers are emitted by formatting strings
+that were serialized by svg.py as well, so the output is identical to
+str(svg.SVG(...)) of the same elements.
+
+CompactSVGTemplate renders the same diagrams with smaller documents: the
+marker circle is defined once in <defs> and placed with <use>, numbers
+are rounded, attributes are shared by groups and lines of the same style
+are merged into one path. Multiple diagrams in one document reference a
+single copy of the static background.
+
+Typical usage examples:
+    template = SVGTemplate(width, height, elements)
+    print(template.render([(cx, cy, r, 'red', (x, y, 'notebig', 'C'))]))
+"""
+
+import re
+
+import svg
+
+# version of the diagram output, increase on changes of the rendered svg
+VERSION = 1
+
+class SVGTemplate:
+    """Pre-serialized svg document with a note marker layer
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, width, height, elements):
+        """ Serializes the static part of the svg document
+
+        Args:
+            width:
+                width of the svg document
+            height:
+                height of the svg document
+            elements:
+                static svg elements drawn below the markers
+        """
+        document = str(svg.SVG(width=width, height=height, elements=list(elements)))
+        end = document.rindex('</svg>')
+        self._head = document[:end]
+        self._tail = document[end:]
+        # format strings of the markers
+        self._circle = svg.Circle(cx='{0}', cy='{1}', r='{2}', stroke='{3}',
+                                  stroke_width=1, fill='{3}').as_str()
+        self._text = svg.Text(x='{0}', y='{1}', class_=['{2}'],
+                              text='{3}', fill='white').as_str()
+
+    def render(self, markers) -> str:
+        """ Renders the svg document with markers
+
+        Args:
+            markers:
+                list of tuple(cx, cy, r, color, label) with label
+                tuple(x, y, css_class, text) or None
+        Returns:
+            svg document as str
+        """
+        circle = self._circle.format
+        text = self._text.format
+        parts = [self._head]
+        for (cx, cy, r, color, label) in markers:
+            parts.append(circle(cx, cy, r, color))
+            if label:
+                parts.append(text(*label))
+        parts.append(self._tail)
+        return "".join(parts)
+
+
+def format_number(value, precision=1) -> str:
+    """ Shortest representation of value rounded to precision decimals """
+    text = f"{value:.{precision}f}"
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    if text in ('-0', ''):
+        text = '0'
+    return text
+
+
+def escape(text) -> str:
+    """ Escapes text for svg text content and attribute values """
+    return str(text).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;') \
+                    .replace('"', '&quot;')
+
+
+class CompactSVGTemplate:
+    """Pre-serialized compact svg document with a note marker layer
+
+    Markers are rendered as <use> of one circle symbol per radius, grouped
+    by color; labels are grouped by css class. The stroke of the markers
+    (same color as the fill, width 1) is folded into the radius of the
+    symbol. <use> references use the SVG 2 href attribute.
+    """
+
+    def __init__(self, width, height, elements, precision=1):
+        """ Serializes the static part of the svg document
+
+        Args:
+            width:
+                width of the svg document
+            height:
+                height of the svg document
+            elements:
+                static svg elements drawn below the markers. svg.Style,
+                svg.Rect, svg.Line and svg.Text are compacted, other
+                elements are kept as serialized by svg.py.
+            precision:
+                decimals of coordinates
+        """
+        self._width = width
+        self._height = height
+        self._precision = precision
+        self._style, self._background = self._compact(elements)
+
+    def format_number(self, value) -> str:
+        """ value formatted with the precision of the template """
+        return format_number(value, self._precision)
+
+    def _compact(self, elements):
+        """ Returns tuple(css, background svg) of elements """
+        # pylint: disable=too-many-locals,too-many-branches
+        num = self.format_number
+        css = []
+        background = []
+        paths = {}
+        for e in elements:
+            if isinstance(e, svg.Style):
+                text = re.sub(r'\s*([{};:,])\s*', r'\1', e.text.strip())
+                css.append(text.replace(';}', '}'))
+            elif isinstance(e, svg.Line):
+                x1, y1, x2, y2 = (num(v) for v in (e.x1, e.y1, e.x2, e.y2))
+                if y1 == y2:
+                    segment = f"M{x1} {y1}H{x2}"
+                elif x1 == x2:
+                    segment = f"M{x1} {y1}V{y2}"
+                else:
+                    segment = f"M{x1} {y1}L{x2} {y2}"
+                style = (e.stroke, e.stroke_width)
+                if style not in paths:
+                    paths[style] = []
+                    background.append(style)
+                paths[style].append(segment)
+            elif isinstance(e, svg.Rect):
+                fill = '' if e.fill in (None, 'black') else f' fill="{e.fill}"'
+                stroke = '' if e.stroke is None else f' stroke="{e.stroke}"'
+                background.append(f'<rect x="{num(e.x)}" y="{num(e.y)}" '
+                                  f'width="{num(e.width)}" height="{num(e.height)}"'
+                                  f'{fill}{stroke}/>')
+            elif isinstance(e, svg.Text):
+                css_class = f' class="{" ".join(e.class_)}"' if e.class_ else ''
+                background.append(f'<text{css_class} x="{num(e.x)}" '
+                                  f'y="{num(e.y)}">{escape(e.text)}</text>')
+            else:
+                background.append(str(e))
+        parts = []
+        for b in background:
+            if isinstance(b, tuple):
+                stroke, stroke_width = b
+                width = '' if stroke_width is None else f' stroke-width="{stroke_width}"'
+                parts.append(f'<path stroke="{stroke}"{width} '
+                             f'd="{"".join(paths[b])}"/>')
+            else:
+                parts.append(b)
+        return "".join(css), "".join(parts)
+
+    def _layer(self, markers, symbols) -> str:
+        """ Markers as svg string, symbols: dict radius -> symbol id """
+        num = self.format_number
+        circles = {}
+        labels = {}
+        for (cx, cy, r, color, label) in markers:
+            if r not in symbols:
+                symbols[r] = f"m{len(symbols)}"
+            circles.setdefault(color, []).append(
+                f'<use href="#{symbols[r]}" x="{num(cx)}" y="{num(cy)}"/>')
+            if label:
+                labels.setdefault(label[2], []).append(
+                    f'<text x="{num(label[0])}" y="{num(label[1])}">'
+                    f'{escape(label[3])}</text>')
+        parts = []
+        for color, uses in circles.items():
+            parts.append(f'<g fill="{color}">{"".join(uses)}</g>')
+        for css_class, texts in labels.items():
+            parts.append(f'<g class="{css_class}">{"".join(texts)}</g>')
+        return "".join(parts)
+
+    def _defs(self, symbols, background=False) -> str:
+        """ <defs> with the marker symbols and optionally the background """
+        defs = [f'<circle id="{i}" r="{self.format_number(r + 0.5)}"/>'
+                for r, i in symbols.items()]
+        if background:
+            defs.insert(0, f'<g id="fb">{self._background}</g>')
+        return f'<defs>{"".join(defs)}</defs>' if defs else ''
+
+    def _document(self, width, height, body, css="") -> str:
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.format_number(width)}" '
+                f'height="{self.format_number(height)}"><style>{self._style}{css}</style>'
+                f'{body}</svg>')
+
+    def render(self, markers) -> str:
+        """ Renders the compact svg document with markers
+
+        Args:
+            markers:
+                list of tuple(cx, cy, r, color, label) with label
+                tuple(x, y, css_class, text) or None
+        Returns:
+            svg document as str
+        """
+        symbols = {}
+        layer = self._layer(markers, symbols)
+        return self._document(self._width, self._height,
+                              self._defs(symbols) + self._background + layer)
+
+    def render_many(self, layers, width, height, extra="", css="") -> str:
+        """ Renders several diagrams sharing one background in one document
+
+        Args:
+            layers:
+                list of tuple(x, y, markers): offset of the diagram in the
+                document and its markers (see render)
+            width:
+                width of the document
+            height:
+                height of the document
+            extra:
+                svg string added after the diagrams (e.g., captions)
+            css:
+                additional css rules for extra
+        Returns:
+            svg document as str
+        """
+        num = self.format_number
+        symbols = {}
+        body = []
+        for (x, y, markers) in layers:
+            body.append(f'<g transform="translate({num(x)} {num(y)})">'
+                        f'<use href="#fb"/>{self._layer(markers, symbols)}</g>')
+        return self._document(width, height,
+                              self._defs(symbols, True) + "".join(body) + extra,
+                              css)
+
+
+if __name__ == "__main__":
+    pass